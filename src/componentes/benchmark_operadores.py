@@ -0,0 +1,278 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mutacion_real import mutacion_real
+from seleccion_ruleta import transformar_aptitud, seleccion_ruleta
+from reemplazo_peores import reemplazo_peores
+from calcular_diversidad import calcular_diversidad
+from funciones import sphere
+from main_ga import MAPA_FUNCIONES, MAPA_CRUZAS
+
+# =========================================
+# Micro-benchmarks de componentes con historial
+# =========================================
+# Mide el tiempo de cada componente del AG sobre una población completa
+# (lo que cuesta en una generación del motor de listas) en una rejilla de
+# `dim` × `tam_pob`. Cada operador de cruza se mide por pareja ('cruza_<tipo>')
+# y en su versión por lotes sobre la matriz de parejas ('cruza_<tipo>_lote').
+#
+# El historial (JSON Lines) guarda las mediciones que pasan la revisión. La
+# referencia de cada componente es una línea base fija: su valor en la entrada
+# más reciente que lo incluye en 'linea_base' (su primera medición o un
+# `--rebase` explícito), no la última ejecución. Si algún componente es más
+# lento que su línea base por encima del umbral, la revisión falla y la
+# medición no se guarda: repetir no la convierte en referencia y las lentitudes
+# pequeñas de varias ejecuciones no se acumulan.
+#
+# Uso: python benchmark_operadores.py [--dims 10,30] [--tams 50,200] [--umbral 0.1] [--rebase]
+
+RUTA_HISTORIAL = "historial_benchmarks.jsonl"
+DIMS = [10, 30]
+TAMS_POB = [50, 200]
+UMBRAL_LENTITUD = 0.10
+
+# Tiempo mínimo de cada lote de llamadas (s) y lotes medidos por componente
+TIEMPO_LOTE = 0.05
+LOTES = 5
+
+# Funciones base de funciones.py (las variantes desplazadas/rotadas las envuelven)
+FUNCIONES = {nombre: valor for nombre, valor in MAPA_FUNCIONES.items() if "_" not in nombre}
+
+
+def _poblacion(n: int, dim: int, a: float, b: float, rng: random.Random) -> List[List[float]]:
+    return [[rng.uniform(a, b) for _ in range(dim)] for _ in range(n)]
+
+
+def _casos(dim: int, tam_pob: int, semilla: int = 0) -> Dict[str, Callable[[], object]]:
+    """
+    Construye las llamadas a medir para una combinación (dim, tam_pob).
+    Cada llamada procesa una población completa.
+    """
+    rng = random.Random(semilla)
+    a, b = -5.12, 5.12
+    poblacion = _poblacion(tam_pob, dim, a, b, rng)
+    hijos = _poblacion(tam_pob, dim, a, b, rng)
+    costos = [sphere(ind) for ind in poblacion]
+    costos_hijos = [sphere(ind) for ind in hijos]
+    aptitudes = transformar_aptitud(costos)
+    parejas = list(zip(poblacion[0::2], poblacion[1::2]))
+    P1 = np.array(poblacion[0::2])
+    P2 = np.array(poblacion[1::2])
+    rng_np = np.random.default_rng(semilla)
+    pm_gen = 1.0 / dim
+
+    # Parámetros propios de cada operador (los mismos en ambas versiones)
+    parametros_cruza = {
+        "un_punto": {},
+        "uniforme": {},
+        "blx": {"alpha": 0.5, "limite_inf": a, "limite_sup": b},
+        "sbx": {"eta_c": 10.0, "limite_inf": a, "limite_sup": b},
+    }
+
+    casos: Dict[str, Callable[[], object]] = {}
+    for tipo, (por_pareja, por_lotes) in MAPA_CRUZAS.items():
+        kwargs = parametros_cruza[tipo]
+        casos[f"cruza_{tipo}"] = lambda cruza=por_pareja, kwargs=kwargs: [
+            cruza(p1, p2, prob_cruza=1.0, rng=rng, **kwargs) for p1, p2 in parejas
+        ]
+        casos[f"cruza_{tipo}_lote"] = lambda cruza=por_lotes, kwargs=kwargs: cruza(
+            P1, P2, prob_cruza=1.0, rng=rng_np, **kwargs
+        )
+
+    casos.update({
+        "mutacion_real": lambda: [mutacion_real(ind, prob_mutacion_gen=pm_gen, a=a, b=b,
+                                                amplitud=0.1, rng=rng) for ind in hijos],
+        "seleccion_ruleta": lambda: seleccion_ruleta(poblacion, aptitudes, k=tam_pob, rng=rng),
+        "reemplazo_peores": lambda: reemplazo_peores(poblacion, hijos, costos, costos_hijos, elitismo=1),
+        "calcular_diversidad": lambda: calcular_diversidad(poblacion),
+    })
+
+    for nombre, (f, (fa, fb)) in FUNCIONES.items():
+        individuos = _poblacion(tam_pob, dim, fa, fb, rng)
+        casos[nombre] = lambda f=f, individuos=individuos: [f(ind) for ind in individuos]
+
+    return casos
+
+
+def medir(llamada: Callable[[], object], tiempo_lote: float = TIEMPO_LOTE, lotes: int = LOTES) -> float:
+    """
+    Segundos por llamada: mínimo sobre `lotes` lotes de llamadas repetidas.
+    El número de llamadas por lote se calibra para que cada lote dure al menos `tiempo_lote`.
+    """
+    numero = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(numero):
+            llamada()
+        transcurrido = time.perf_counter() - t0
+        if transcurrido >= tiempo_lote:
+            break
+        numero *= 2
+
+    mejor = transcurrido / numero
+    for _ in range(lotes - 1):
+        t0 = time.perf_counter()
+        for _ in range(numero):
+            llamada()
+        mejor = min(mejor, (time.perf_counter() - t0) / numero)
+    return mejor
+
+
+def ejecutar_suite(
+    dims: List[int] = DIMS,
+    tams_pob: List[int] = TAMS_POB,
+    componentes: Optional[List[str]] = None,
+    tiempo_lote: float = TIEMPO_LOTE,
+    lotes: int = LOTES,
+) -> Dict[str, float]:
+    """
+    Mide todos los componentes en la rejilla dims × tams_pob.
+
+    Returns:
+        Dict[str, float]: Segundos por población completa, con llaves
+        'componente|dim=D|n=N'.
+    """
+    resultados: Dict[str, float] = {}
+    for dim in dims:
+        for tam_pob in tams_pob:
+            for nombre, llamada in _casos(dim, tam_pob).items():
+                if componentes is not None and nombre not in componentes:
+                    continue
+                clave = f"{nombre}|dim={dim}|n={tam_pob}"
+                resultados[clave] = medir(llamada, tiempo_lote, lotes)
+                print(f"[INFO] {clave:<40} {resultados[clave] * 1e3:10.4f} ms "
+                      f"({tam_pob / resultados[clave]:,.0f} ind/s)")
+    return resultados
+
+
+def leer_historial(ruta: str = RUTA_HISTORIAL) -> List[dict]:
+    """Lee todas las entradas del historial (una por línea); ignora líneas incompletas."""
+    if not os.path.exists(ruta):
+        return []
+    entradas = []
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            try:
+                entradas.append(json.loads(linea))
+            except json.JSONDecodeError:
+                continue
+    return entradas
+
+
+def guardar_entrada(
+    resultados: Dict[str, float],
+    ruta: str = RUTA_HISTORIAL,
+    etiqueta: str = "",
+    linea_base: Optional[List[str]] = None,
+) -> dict:
+    """
+    Agrega una entrada al historial con los resultados y el entorno de medición.
+    `linea_base` son los componentes cuya referencia pasa a ser esta medición.
+    """
+    entrada = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "etiqueta": etiqueta,
+        "linea_base": sorted(linea_base or []),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    with open(ruta, mode="a", encoding="utf-8") as f:
+        f.write(json.dumps(entrada, sort_keys=True) + "\n")
+    return entrada
+
+
+def referencia_historial(historial: List[dict]) -> Dict[str, float]:
+    """Para cada componente, su línea base: la entrada más reciente que lo fija en 'linea_base'."""
+    referencia: Dict[str, float] = {}
+    for entrada in historial:
+        for clave in entrada.get("linea_base", []):
+            referencia[clave] = entrada["resultados"][clave]
+    return referencia
+
+
+def comparar(
+    actual: Dict[str, float],
+    referencia: Dict[str, float],
+    umbral: float = UMBRAL_LENTITUD,
+) -> List[Tuple[str, float]]:
+    """
+    Compara contra la referencia.
+
+    Returns:
+        List[Tuple[str, float]]: Componentes cuyo tiempo creció más que `umbral`
+        (fracción, 0.1 = 10 %), con su razón actual / referencia.
+    """
+    regresiones = []
+    for clave, tiempo in actual.items():
+        if clave in referencia and referencia[clave] > 0:
+            razon = tiempo / referencia[clave]
+            if razon > 1.0 + umbral:
+                regresiones.append((clave, razon))
+    return regresiones
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de los componentes del AG.")
+    parser.add_argument("--dims", default=",".join(map(str, DIMS)),
+                        help="Dimensiones separadas por comas")
+    parser.add_argument("--tams", default=",".join(map(str, TAMS_POB)),
+                        help="Tamaños de población separados por comas")
+    parser.add_argument("--componentes", default=None,
+                        help="Subconjunto de componentes separados por comas")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_LENTITUD,
+                        help="Lentitud relativa tolerada respecto a la referencia (0.1 = 10%%)")
+    parser.add_argument("--historial", default=RUTA_HISTORIAL)
+    parser.add_argument("--etiqueta", default="", help="Texto libre (p. ej. el commit medido)")
+    parser.add_argument("--no-guardar", action="store_true",
+                        help="Compara sin agregar la medición al historial")
+    parser.add_argument("--rebase", action="store_true",
+                        help="Guarda la medición como nueva línea base sin compararla")
+    args = parser.parse_args(argv)
+
+    componentes = args.componentes.split(",") if args.componentes else None
+    resultados = ejecutar_suite(
+        dims=[int(d) for d in args.dims.split(",")],
+        tams_pob=[int(n) for n in args.tams.split(",")],
+        componentes=componentes,
+    )
+
+    if args.rebase:
+        guardar_entrada(resultados, args.historial, args.etiqueta, linea_base=list(resultados))
+        print(f"\n[OK] Nueva línea base guardada en {args.historial}")
+        return 0
+
+    referencia = referencia_historial(leer_historial(args.historial))
+    regresiones = comparar(resultados, referencia, args.umbral)
+    if regresiones:
+        # La medición no se guarda: la línea base sigue siendo la referencia
+        print(f"\n[ERROR] Componentes más lentos que la línea base por encima de {args.umbral:.0%}:")
+        for clave, razon in regresiones:
+            print(f"        {clave:<40} x{razon:.2f}")
+        print("        (si la lentitud es esperada, use --rebase para fijar una nueva línea base)")
+        return 1
+
+    # Los componentes sin línea base la toman de esta medición
+    nuevos = [clave for clave in resultados if clave not in referencia]
+    if not args.no_guardar:
+        guardar_entrada(resultados, args.historial, args.etiqueta, linea_base=nuevos)
+
+    if len(nuevos) == len(resultados):
+        print(f"\n[OK] Primera medición: línea base guardada en {args.historial}")
+    else:
+        print(f"\n[OK] Sin regresiones mayores a {args.umbral:.0%} respecto a la línea base")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from main_ga import MAPA_FUNCIONES, ejecutar_ga_real
+
+# =========================================
+# Benchmark de precisión: float64 vs float32
+# =========================================
+# Corre la misma configuración (mismas semillas) con precision='float64' y
+# precision='float32' en cada función base y compara el tiempo por corrida y
+# la calidad final (mediana de `mejor_final`). Pensado para corridas grandes
+# (dimensión y población altas), donde el tráfico de memoria domina.
+#
+# Uso: python benchmark_precision.py [--dim 100] [--tam-pob 1000] [--generaciones 200]
+#                                    [--repeticiones 3] [--motor matricial] [--cruza sbx]
+
+PRECISIONES = ("float64", "float32")
+
+# Funciones base de funciones.py (las variantes desplazadas/rotadas las envuelven)
+FUNCIONES = [nombre for nombre in MAPA_FUNCIONES if "_" not in nombre]
+
+
+def comparar_precisiones(
+    funciones: List[str],
+    dim: int,
+    tam_pob: int,
+    generaciones: int,
+    repeticiones: int,
+    motor: str = "matricial",
+    tipo_cruza: str = "sbx",
+) -> Dict[str, Dict[str, dict]]:
+    """
+    Ejecuta `repeticiones` corridas por función y precisión (semillas 0..repeticiones-1).
+
+    Returns:
+        Dict[str, Dict[str, dict]]: Por función y precisión, la mediana de 'tiempo'
+        (segundos por corrida) y de 'mejor' (mejor costo final).
+    """
+    resultados: Dict[str, Dict[str, dict]] = {}
+    for nombre_func in funciones:
+        resultados[nombre_func] = {}
+        for precision in PRECISIONES:
+            tiempos, mejores = [], []
+            for semilla in range(repeticiones):
+                corrida = ejecutar_ga_real(
+                    nombre_func=nombre_func,
+                    dim=dim,
+                    tam_pob=tam_pob,
+                    generaciones=generaciones,
+                    tipo_cruza=tipo_cruza,
+                    semilla=semilla,
+                    motor=motor,
+                    precision=precision,
+                    compacto=True,
+                    almacenar_poblacion="no",
+                )
+                tiempos.append(corrida["tiempo_total"])
+                mejores.append(corrida["mejor_final"])
+            resultados[nombre_func][precision] = {
+                "tiempo": float(np.median(tiempos)),
+                "mejor": float(np.median(mejores)),
+            }
+    return resultados
+
+
+def imprimir_tabla(resultados: Dict[str, Dict[str, dict]]) -> None:
+    print(f"\n{'funcion':<12}{'t float64':>12}{'t float32':>12}{'acel.':>8}"
+          f"{'mejor float64':>16}{'mejor float32':>16}")
+    for nombre_func, medidas in resultados.items():
+        t64, t32 = medidas["float64"]["tiempo"], medidas["float32"]["tiempo"]
+        print(f"{nombre_func:<12}{t64:>11.3f}s{t32:>11.3f}s{t64 / t32:>7.2f}x"
+              f"{medidas['float64']['mejor']:>16.6g}{medidas['float32']['mejor']:>16.6g}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compara float64 y float32 en corridas completas del AG.")
+    parser.add_argument("--funciones", default=",".join(FUNCIONES),
+                        help="Funciones separadas por comas")
+    parser.add_argument("--dim", type=int, default=100)
+    parser.add_argument("--tam-pob", type=int, default=1000)
+    parser.add_argument("--generaciones", type=int, default=200)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--motor", default="matricial", help="matricial o apilado")
+    parser.add_argument("--cruza", default="sbx")
+    args = parser.parse_args(argv)
+
+    resultados = comparar_precisiones(
+        funciones=[nombre for nombre in args.funciones.split(",") if nombre],
+        dim=args.dim,
+        tam_pob=args.tam_pob,
+        generaciones=args.generaciones,
+        repeticiones=args.repeticiones,
+        motor=args.motor,
+        tipo_cruza=args.cruza,
+    )
+    imprimir_tabla(resultados)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+from typing import IO, Optional, Set, Tuple
+
+# =========================================
+# Bitácora de corridas completadas
+# =========================================
+# Cada línea registra una corrida terminada junto con la posición durable de
+# las salidas justo después de escribirla y sincronizarla a disco: tamaño en
+# bytes del CSV de resumen y, para las curvas, tamaño en bytes del CSV o número
+# de partes .npz escritas (salida columnar). Al reanudar, todo lo que exceda
+# esas posiciones es escritura parcial de una corrida interrumpida y se trunca.
+#
+# La primera línea guarda los parámetros de la batería (JSON tras
+# PREFIJO_PARAMETROS): solo se reanuda con los mismos, para no mezclar en los
+# mismos archivos filas de configuraciones distintas.
+
+PREFIJO_PARAMETROS = "#parametros "
+
+ENCABEZADO_BITACORA = [
+    "funcion",
+    "tipo_cruza",
+    "repeticion",
+    "semilla",
+    "bytes_resumen",
+    "pos_curvas",
+]
+
+Clave = Tuple[str, str, int, int]
+
+
+def leer_bitacora(ruta: str) -> Tuple[Set[Clave], Optional[Tuple[int, int]], Optional[dict]]:
+    """
+    Lee la bitácora y trunca una posible última línea incompleta.
+
+    Args:
+        ruta (str): Ruta del archivo de bitácora.
+
+    Returns:
+        Tuple[Set[Clave], Optional[Tuple[int, int]], Optional[dict]]: Conjunto de
+        corridas completadas (funcion, tipo_cruza, repeticion, semilla), posiciones
+        de las salidas tras la última corrida registrada (None si no hay ninguna) y
+        parámetros de la batería (None si la bitácora no los registra).
+    """
+    completadas: Set[Clave] = set()
+    offsets: Optional[Tuple[int, int]] = None
+    parametros: Optional[dict] = None
+
+    if not os.path.exists(ruta):
+        return completadas, offsets, parametros
+
+    with open(ruta, mode="rb") as f:
+        contenido = f.read()
+
+    # Solo cuentan las líneas terminadas en salto de línea
+    fin_valido = contenido.rfind(b"\n") + 1
+    lineas = contenido[:fin_valido].decode("utf-8").splitlines()
+
+    if lineas and lineas[0].startswith(PREFIJO_PARAMETROS):
+        parametros = json.loads(lineas[0][len(PREFIJO_PARAMETROS):])
+        lineas = lineas[1:]
+
+    for fila in csv.reader(lineas[1:]):
+        if len(fila) != len(ENCABEZADO_BITACORA):
+            continue
+        funcion, tipo_cruza, rep, semilla, bytes_res, pos_curv = fila
+        completadas.add((funcion, tipo_cruza, int(rep), int(semilla)))
+        offsets = (int(bytes_res), int(pos_curv))
+
+    if fin_valido < len(contenido):
+        with open(ruta, mode="r+b") as f:
+            f.truncate(fin_valido)
+
+    return completadas, offsets, parametros
+
+
+def escribir_encabezado(f_bitacora: IO, writer_bitacora, parametros: dict) -> None:
+    """Escribe la línea de parámetros y el encabezado de una bitácora nueva."""
+    f_bitacora.write(PREFIJO_PARAMETROS + json.dumps(parametros, sort_keys=True) + "\n")
+    writer_bitacora.writerow(ENCABEZADO_BITACORA)
+
+
+def verificar_parametros(ruta: str, registrados: Optional[dict], actuales: dict) -> None:
+    """
+    Verifica que una batería se reanude con los parámetros de la bitácora.
+
+    Raises:
+        ValueError: Si la bitácora no registra parámetros o alguno difiere.
+    """
+    if registrados is None:
+        raise ValueError(f"La bitácora {ruta} no registra los parámetros de la batería; no se puede reanudar.")
+
+    # Ida y vuelta por JSON para comparar con los mismos tipos que se leen del archivo
+    actuales = json.loads(json.dumps(actuales))
+    diferencias = [
+        f"{clave} ({registrados.get(clave)!r} -> {actuales.get(clave)!r})"
+        for clave in sorted(set(registrados) | set(actuales))
+        if registrados.get(clave) != actuales.get(clave)
+    ]
+    if diferencias:
+        raise ValueError(
+            f"Los parámetros no coinciden con la bitácora {ruta}: {', '.join(diferencias)}"
+        )
+
+
+def truncar_archivo(ruta: str, tam_bytes: int) -> None:
+    """Descarta las filas escritas parcialmente más allá de `tam_bytes`."""
+    with open(ruta, mode="r+b") as f:
+        f.truncate(tam_bytes)
+
+
+def sincronizar(f: IO) -> int:
+    """Vacía el buffer a disco y retorna el tamaño del archivo en bytes."""
+    f.flush()
+    os.fsync(f.fileno())
+    return os.fstat(f.fileno()).st_size
+
+
+def registrar_corrida(
+    f_bitacora: IO,
+    writer_bitacora,
+    clave: Clave,
+    bytes_resumen: int,
+    pos_curvas: int,
+) -> None:
+    """
+    Marca una corrida como completada de forma durable.
+
+    Las posiciones deben obtenerse después de sincronizar las salidas (ver
+    `sincronizar`), de modo que una corrida registrada siempre tiene sus filas
+    completas en disco.
+    """
+    writer_bitacora.writerow([*clave, bytes_resumen, pos_curvas])
+    sincronizar(f_bitacora)
@@ -0,0 +1,170 @@
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# =========================================
+# Evaluación con herencia de costos y caché LRU
+# =========================================
+# Dos niveles para evitar evaluaciones repetidas de la función objetivo:
+#   1. Herencia: si un hijo es idéntico bit a bit a uno de sus padres (cruza no
+#      aplicada y mutación sin cambios), se reutiliza el costo conocido del padre.
+#   2. Caché LRU acotada, indexada por los bytes del genoma (float64).
+
+
+def _clave(individuo) -> bytes:
+    """Bytes del genoma en float64, usados como llave de la caché."""
+    if isinstance(individuo, np.ndarray):
+        return np.ascontiguousarray(individuo, dtype=float).tobytes()
+    return array("d", individuo).tobytes()
+
+
+class EvaluadorCache:
+    """
+    Envuelve la función objetivo con herencia de costos y una caché LRU.
+
+    Args:
+        f (Callable): Función objetivo. En `evaluar_matriz` debe aceptar una
+            matriz (N, D) y devolver (N,) costos (ver funciones.py).
+        tam_max (int): Número máximo de genomas en la caché (0 la desactiva).
+    """
+
+    def __init__(self, f: Callable, tam_max: int = 4096):
+        if tam_max < 0:
+            raise ValueError("tam_max debe ser >= 0")
+
+        self.f = f
+        self.tam_max = tam_max
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+
+        self.evaluaciones = 0
+        self.aciertos = 0
+        self.heredados = 0
+
+    def _buscar(self, clave: bytes):
+        costo = self._cache.get(clave)
+        if costo is not None:
+            self._cache.move_to_end(clave)
+            self.aciertos += 1
+        return costo
+
+    def _guardar(self, clave: bytes, costo: float) -> None:
+        if self.tam_max == 0:
+            return
+        self._cache[clave] = costo
+        if len(self._cache) > self.tam_max:
+            self._cache.popitem(last=False)
+
+    def evaluar(self, individuo) -> float:
+        """Evalúa un individuo pasando por la caché."""
+        clave = _clave(individuo)
+        costo = self._buscar(clave)
+        if costo is None:
+            costo = self.f(individuo)
+            self.evaluaciones += 1
+            self._guardar(clave, costo)
+        return costo
+
+    def evaluar_poblacion(self, poblacion: Sequence[Sequence[float]]) -> List[float]:
+        """Evalúa una población completa sin información de padres."""
+        return [self.evaluar(ind) for ind in poblacion]
+
+    def evaluar_descendencia(
+        self,
+        hijos: List[List[float]],
+        poblacion: List[List[float]],
+        costos: Sequence[float],
+        candidatos: Sequence[Tuple[int, int]]
+    ) -> List[float]:
+        """
+        Evalúa hijos (listas) heredando el costo de un padre idéntico.
+
+        Args:
+            hijos (List[List[float]]): Descendencia a evaluar.
+            poblacion (List[List[float]]): Población de la que salieron los padres.
+            costos (Sequence[float]): Costos de `poblacion`.
+            candidatos (Sequence[Tuple[int, int]]): Para cada hijo, índices en
+                `poblacion` de sus dos padres.
+
+        Returns:
+            List[float]: Costo de cada hijo.
+        """
+        costos_hijos: List[float] = []
+        for hijo, (ia, ib) in zip(hijos, candidatos):
+            if hijo == poblacion[ia]:
+                costos_hijos.append(costos[ia])
+                self.heredados += 1
+            elif hijo == poblacion[ib]:
+                costos_hijos.append(costos[ib])
+                self.heredados += 1
+            else:
+                costos_hijos.append(self.evaluar(hijo))
+        return costos_hijos
+
+    def evaluar_matriz(
+        self,
+        hijos: np.ndarray,
+        padres_a: Optional[np.ndarray] = None,
+        costos_a: Optional[np.ndarray] = None,
+        padres_b: Optional[np.ndarray] = None,
+        costos_b: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Evalúa una matriz de hijos (N, D) heredando costos de padres idénticos.
+
+        Las filas de `padres_a`/`padres_b` (y sus costos) están alineadas con las
+        de `hijos`. Los hijos restantes se buscan en la caché y los que faltan se
+        evalúan juntos en una sola llamada a `f`. Sin padres (población inicial)
+        solo se usa la caché. Las llaves son los bytes float64 de cada fila (ver
+        `_clave`), así que una matriz float32 comparte llaves con su versión float64.
+
+        Returns:
+            np.ndarray: Vector (N,) de costos, con el dtype de `hijos` (float32 en
+            el modo de precisión simple de los motores).
+        """
+        costos_hijos = np.empty(len(hijos), dtype=hijos.dtype)
+
+        if padres_a is None:
+            pendientes = np.arange(len(hijos))
+        else:
+            igual_a = (hijos == padres_a).all(axis=1)
+            igual_b = ~igual_a & (hijos == padres_b).all(axis=1)
+            costos_hijos[igual_a] = costos_a[igual_a]
+            costos_hijos[igual_b] = costos_b[igual_b]
+            self.heredados += int(igual_a.sum() + igual_b.sum())
+            pendientes = np.flatnonzero(~(igual_a | igual_b))
+
+        if self.tam_max == 0:
+            faltantes = pendientes
+            claves: List[bytes] = []
+        else:
+            faltantes_lista = []
+            claves = []
+            for i in pendientes:
+                clave = _clave(hijos[i])
+                costo = self._buscar(clave)
+                if costo is None:
+                    faltantes_lista.append(i)
+                    claves.append(clave)
+                else:
+                    costos_hijos[i] = costo
+            faltantes = np.array(faltantes_lista, dtype=np.intp)
+
+        if len(faltantes):
+            nuevos = np.asarray(self.f(hijos[faltantes]), dtype=hijos.dtype)
+            costos_hijos[faltantes] = nuevos
+            self.evaluaciones += len(faltantes)
+            for clave, costo in zip(claves, nuevos.tolist()):
+                self._guardar(clave, costo)
+
+        return costos_hijos
+
+    def contadores(self) -> Dict[str, int]:
+        """Contadores para el diccionario de resultados."""
+        return {
+            "evaluaciones": self.evaluaciones,
+            "cache_aciertos": self.aciertos,
+            "cache_fallos": self.evaluaciones,
+            "costos_heredados": self.heredados,
+        }
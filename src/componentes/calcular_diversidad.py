@@ -1,5 +1,13 @@
 import numpy as np
-from typing import List
+from statistics import NormalDist
+from typing import List, Sequence, Tuple
+
+# Generaciones entre recálculos completos del RastreadorDiversidad (acota el error acumulado)
+PERIODO_REINICIO_DIVERSIDAD = 100
+
+# Fracción de la población reemplazada por encima de la cual actualizar con los
+# bloques de entrantes y salientes cuesta más que recalcular desde la población
+FRACCION_MAX_INCREMENTAL = 0.5
 
 def calcular_diversidad(poblacion: List[List[float]]) -> float:
     """
@@ -13,10 +21,10 @@ def calcular_diversidad(poblacion: List[List[float]]) -> float:
         float: Promedio de las desviaciones estándar de cada variable de decisión.
                Valores cercanos a 0 indican convergencia de la población.
     """
-    if not poblacion:
+    if len(poblacion) == 0:
         return 0.0
     
-    pob_array = np.array(poblacion, dtype=float)
+    pob_array = np.asarray(poblacion, dtype=float)
     
     # Calcular desviación estándar a lo largo de las dimensiones (axis=0)
     desv_std_por_dimension = np.std(pob_array, axis=0)
@@ -24,16 +32,147 @@ def calcular_diversidad(poblacion: List[List[float]]) -> float:
     return float(np.mean(desv_std_por_dimension))
 
 
-def calcular_diversidad_distancia(poblacion: List[List[float]]) -> float:
+def calcular_diversidad_apilada(poblaciones: np.ndarray) -> np.ndarray:
+    """
+    `calcular_diversidad` de cada población de un tensor (R, N, D) en una sola pasada.
+
+    Args:
+        poblaciones (np.ndarray): Tensor (R, N, D) con R poblaciones.
+
+    Returns:
+        np.ndarray: Vector (R,) con la diversidad de cada población.
+    """
+    return np.std(poblaciones, axis=1, dtype=np.float64).mean(axis=1)
+
+
+class RastreadorDiversidad:
+    """
+    Mantiene de forma incremental la media y la suma de cuadrados centrada (M2)
+    por dimensión de la población, con actualizaciones estables tipo Welford/Chan.
+
+    En lugar de reconstruir la matriz de la población cada generación, se
+    actualiza solo con los individuos que entran y salen en el reemplazo, por
+    lo que el costo es proporcional al número de individuos reemplazados.
+    Solo conviene cuando se reemplaza menos de FRACCION_MAX_INCREMENTAL de la
+    población (reemplazo parcial con elitismo > N/2); con reemplazos mayores,
+    como el generacional, el reemplazo llama a `programar_reinicio` y el estado
+    se recalcula desde la población solo cuando se consulta `diversidad()`,
+    con el costo de `calcular_diversidad`.
+    `diversidad()` coincide con `calcular_diversidad` salvo tolerancia numérica;
+    se recomienda llamar a `programar_reinicio` periódicamente para acotar el
+    error acumulado.
+
+    Args:
+        poblacion (Sequence[Sequence[float]]): Población inicial.
+    """
+
+    def __init__(self, poblacion: Sequence[Sequence[float]]):
+        self.reiniciar(poblacion)
+
+    def reiniciar(self, poblacion: Sequence[Sequence[float]]) -> None:
+        """Recalcula el estado desde cero a partir de la población completa."""
+        self._por_recalcular = None
+        pob_array = np.asarray(poblacion, dtype=float)
+        self.n = len(pob_array)
+        if self.n == 0:
+            self.media = None
+            self.m2 = None
+            return
+        self.media = pob_array.mean(axis=0)
+        self.m2 = ((pob_array - self.media) ** 2).sum(axis=0)
+
+    def programar_reinicio(self, poblacion: Sequence[Sequence[float]]) -> None:
+        """
+        Recalcula el estado desde `poblacion` en la siguiente consulta o actualización.
+        La población no debe modificarse después (solo se guarda la referencia).
+        """
+        self._por_recalcular = poblacion
+
+    def conviene_incremental(self, reemplazados: int) -> bool:
+        """True si actualizar con `reemplazados` entrantes es más barato que recalcular."""
+        return reemplazados <= FRACCION_MAX_INCREMENTAL * self.n
+
+    def _sincronizar(self) -> None:
+        if self._por_recalcular is not None:
+            self.reiniciar(self._por_recalcular)
+
+    def agregar(self, individuos: Sequence[Sequence[float]]) -> None:
+        """Incorpora un bloque de individuos que entra a la población."""
+        self._sincronizar()
+        bloque = np.asarray(individuos, dtype=float)
+        m = len(bloque)
+        if m == 0:
+            return
+        if self.n == 0:
+            self.reiniciar(bloque)
+            return
+
+        media_b = bloque.mean(axis=0)
+        m2_b = ((bloque - media_b) ** 2).sum(axis=0)
+
+        n_nuevo = self.n + m
+        delta = media_b - self.media
+        self.media = self.media + delta * (m / n_nuevo)
+        self.m2 = self.m2 + m2_b + delta**2 * (self.n * m / n_nuevo)
+        self.n = n_nuevo
+
+    def quitar(self, individuos: Sequence[Sequence[float]]) -> None:
+        """Retira un bloque de individuos que sale de la población."""
+        self._sincronizar()
+        bloque = np.asarray(individuos, dtype=float)
+        m = len(bloque)
+        if m == 0:
+            return
+        if m > self.n:
+            raise ValueError("No se pueden retirar más individuos de los que hay.")
+        if m == self.n:
+            self.reiniciar(bloque[:0])
+            return
+
+        media_b = bloque.mean(axis=0)
+        m2_b = ((bloque - media_b) ** 2).sum(axis=0)
+
+        n_nuevo = self.n - m
+        media_nueva = (self.n * self.media - m * media_b) / n_nuevo
+        delta = media_b - media_nueva
+        # Inverso de la fórmula de combinación; se satura en 0 por redondeo
+        self.m2 = np.maximum(self.m2 - m2_b - delta**2 * (n_nuevo * m / self.n), 0.0)
+        self.media = media_nueva
+        self.n = n_nuevo
+
+    def actualizar(
+        self,
+        salientes: Sequence[Sequence[float]],
+        entrantes: Sequence[Sequence[float]]
+    ) -> None:
+        """Aplica un reemplazo: primero agrega los entrantes y luego retira los salientes."""
+        self.agregar(entrantes)
+        self.quitar(salientes)
+
+    def diversidad(self) -> float:
+        """Promedio de las desviaciones estándar por dimensión (igual que `calcular_diversidad`)."""
+        self._sincronizar()
+        if self.n == 0:
+            return 0.0
+        return float(np.mean(np.sqrt(self.m2 / self.n)))
+
+
+def calcular_diversidad_distancia(
+    poblacion: List[List[float]],
+    tam_bloque: int = 1024
+) -> float:
     """
     Calcula la diversidad basada en la distancia Euclidiana promedio entre
     pares de individuos.
-    
-    Nota: Este método tiene complejidad O(N^2), por lo que se recomienda
-    usarlo solo con poblaciones pequeñas o para análisis específicos.
+
+    Usa la identidad de la matriz de Gram ||xi - xj||^2 = |xi|^2 + |xj|^2 - 2 xi·xj
+    por bloques de `tam_bloque` filas, de modo que la memoria adicional es
+    O(tam_bloque^2) independientemente del tamaño de la población. Los datos se
+    centran antes para reducir la cancelación numérica en poblaciones convergidas.
 
     Args:
         poblacion (List[List[float]]): Lista de individuos.
+        tam_bloque (int): Número de filas por bloque.
 
     Returns:
         float: Distancia promedio entre todos los pares únicos de individuos.
@@ -41,19 +180,105 @@ def calcular_diversidad_distancia(poblacion: List[List[float]]) -> float:
     n = len(poblacion)
     if n <= 1:
         return 0.0
-    
-    pob_array = np.array(poblacion, dtype=float)
+
+    pob_array = np.asarray(poblacion, dtype=float)
+    pob_array = pob_array - pob_array.mean(axis=0)
+    normas_sq = np.einsum("ij,ij->i", pob_array, pob_array)
+
     suma_distancias = 0.0
-    num_pares = 0
-    
-    # Acumular distancias de pares únicos (i, j) donde j > i
-    for i in range(n):
-        for j in range(i + 1, n):
-            distancia = np.linalg.norm(pob_array[i] - pob_array[j])
-            suma_distancias += distancia
-            num_pares += 1
-    
-    if num_pares == 0:
-        return 0.0
-    
-    return float(suma_distancias / num_pares)
\ No newline at end of file
+
+    # Acumular distancias de pares únicos (i, j) donde j > i, bloque por bloque
+    for i0 in range(0, n, tam_bloque):
+        bloque_i = pob_array[i0:i0 + tam_bloque]
+        for j0 in range(i0, n, tam_bloque):
+            bloque_j = pob_array[j0:j0 + tam_bloque]
+            dist_sq = (normas_sq[i0:i0 + tam_bloque, None]
+                       + normas_sq[None, j0:j0 + tam_bloque]
+                       - 2.0 * (bloque_i @ bloque_j.T))
+            # Valores negativos pequeños son error de redondeo
+            np.maximum(dist_sq, 0.0, out=dist_sq)
+            distancias = np.sqrt(dist_sq, out=dist_sq)
+            if j0 == i0:
+                suma_distancias += float(np.triu(distancias, k=1).sum())
+            else:
+                suma_distancias += float(distancias.sum())
+
+    num_pares = n * (n - 1) / 2
+    return float(suma_distancias / num_pares)
+
+
+def estimar_diversidad_distancia(
+    poblacion: List[List[float]],
+    num_pares: int = 2000,
+    rng: np.random.Generator = None,
+    confianza: float = 0.95
+) -> Tuple[float, float]:
+    """
+    Estima la distancia Euclidiana promedio entre pares con un muestreo
+    uniforme de pares distintos (estimador insesgado).
+
+    Si la población tiene a lo más `num_pares` pares únicos se usa el cálculo exacto.
+
+    Args:
+        poblacion (List[List[float]]): Lista de individuos.
+        num_pares (int): Número de pares muestreados.
+        rng (np.random.Generator): Generador de NumPy.
+        confianza (float): Nivel de confianza del intervalo (0, 1).
+
+    Returns:
+        Tuple[float, float]: Estimación de la distancia promedio y semiancho del
+        intervalo de confianza (aproximación normal). El semiancho es 0 en el caso exacto.
+    """
+    if rng is None:
+        raise ValueError("Se debe proporcionar un generador 'rng'")
+
+    n = len(poblacion)
+    if n * (n - 1) // 2 <= num_pares:
+        return calcular_diversidad_distancia(poblacion), 0.0
+
+    pob_array = np.asarray(poblacion, dtype=float)
+
+    # Pares ordenados (i, j) con i != j uniformes; equivale a pares únicos uniformes
+    idx_i = rng.integers(0, n, size=num_pares)
+    idx_j = rng.integers(0, n - 1, size=num_pares)
+    idx_j += idx_j >= idx_i
+
+    distancias = np.linalg.norm(pob_array[idx_i] - pob_array[idx_j], axis=1)
+    estimacion = float(distancias.mean())
+
+    z = NormalDist().inv_cdf(0.5 + confianza / 2.0)
+    semiancho = float(z * distancias.std(ddof=1) / np.sqrt(num_pares))
+
+    return estimacion, semiancho
+
+
+# Métricas que pueden registrarse en 'curva_diversidad'
+METRICAS_DIVERSIDAD = ("desviacion", "distancia", "distancia_muestreada")
+
+
+def medir_diversidad(
+    poblacion: List[List[float]],
+    metrica: str = "desviacion",
+    rng: np.random.Generator = None
+) -> float:
+    """
+    Calcula la métrica de diversidad seleccionada.
+
+    Args:
+        poblacion (List[List[float]]): Población actual.
+        metrica (str): 'desviacion' (std promedio por dimensión), 'distancia'
+            (distancia promedio exacta entre pares) o 'distancia_muestreada'
+            (estimación por muestreo de pares; requiere `rng`).
+        rng (np.random.Generator): Generador para la métrica muestreada.
+
+    Returns:
+        float: Valor de diversidad.
+    """
+    if metrica == "desviacion":
+        return calcular_diversidad(poblacion)
+    elif metrica == "distancia":
+        return calcular_diversidad_distancia(poblacion)
+    elif metrica == "distancia_muestreada":
+        return estimar_diversidad_distancia(poblacion, rng=rng)[0]
+    else:
+        raise ValueError(f"Métrica de diversidad no reconocida: {metrica}")
@@ -0,0 +1,174 @@
+import csv
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# =========================================
+# Carreras estadísticas (racing)
+# =========================================
+# Las repeticiones se ejecutan por bloques. Al terminar cada bloque se comparan,
+# dentro de cada función, las configuraciones que siguen en carrera con el mejor
+# costo final de las repeticiones que todas completaron (emparejadas por número
+# de repetición) y se descartan las significativamente peores que la mejor:
+#   'friedman' -> F-race: prueba de Friedman y, si rechaza, comparaciones de la
+#                 suma de rangos contra la mejor (diferencia crítica de Conover).
+#                 Con dos configuraciones se usa la prueba de Wilcoxon pareada.
+#   'wilcoxon' -> Wilcoxon pareada de una cola de cada configuración contra la
+#                 mejor (menor mediana), con corrección de Holm.
+# Las configuraciones descartadas no reciben más repeticiones.
+#
+# SciPy se importa solo al evaluar una carrera.
+
+METODOS_CARRERA = ("friedman", "wilcoxon")
+
+Configuracion = Tuple[str, str]
+
+
+def _p_wilcoxon(x: np.ndarray, y: np.ndarray) -> float:
+    """p-valor de una cola de H1: x > y (pareadas). 1.0 si todas las diferencias son nulas."""
+    from scipy.stats import wilcoxon
+
+    if np.all(x == y):
+        return 1.0
+    return float(wilcoxon(x, y, alternative="greater").pvalue)
+
+
+def _descartes_friedman(costos: np.ndarray, alfa: float) -> List[Tuple[int, float]]:
+    """
+    F-race sobre una matriz (n repeticiones, k configuraciones) de costos a minimizar.
+
+    Returns:
+        List[Tuple[int, float]]: Columnas descartadas con el p-valor de la prueba global.
+    """
+    from scipy.stats import friedmanchisquare, rankdata, t as dist_t
+
+    n, k = costos.shape
+    if k == 2:
+        mejor = int(np.argmin(np.median(costos, axis=0)))
+        otra = 1 - mejor
+        p = _p_wilcoxon(costos[:, otra], costos[:, mejor])
+        return [(otra, p)] if p < alfa else []
+
+    # Sin variación (p. ej. todas llegan al óptimo) el p-valor es nan y no se descarta
+    p = float(friedmanchisquare(*costos.T).pvalue)
+    if not p < alfa:
+        return []
+
+    rangos = rankdata(costos, axis=1)
+    suma_rangos = rangos.sum(axis=0)
+    A = (rangos ** 2).sum()
+    denominador = (n - 1) * (k - 1)
+    critica = dist_t.ppf(1 - alfa / 2, denominador) * np.sqrt(
+        2 * (n * A - (suma_rangos ** 2).sum()) / denominador
+    )
+    mejor = suma_rangos.min()
+    return [(j, p) for j in range(k) if suma_rangos[j] - mejor > critica]
+
+
+def _descartes_wilcoxon(costos: np.ndarray, alfa: float) -> List[Tuple[int, float]]:
+    """Wilcoxon de cada columna contra la de menor mediana, con corrección de Holm."""
+    mejor = int(np.argmin(np.median(costos, axis=0)))
+    otras = [j for j in range(costos.shape[1]) if j != mejor]
+    pvalores = [_p_wilcoxon(costos[:, j], costos[:, mejor]) for j in otras]
+
+    descartes = []
+    m = len(otras)
+    for paso, i in enumerate(np.argsort(pvalores, kind="stable")):
+        if pvalores[i] >= alfa / (m - paso):
+            break
+        descartes.append((otras[i], pvalores[i]))
+    return descartes
+
+
+class CarreraEstadistica:
+    """
+    Estado de una carrera entre las configuraciones (funcion, tipo_cruza).
+
+    Args:
+        funciones (List[str]): Funciones; cada una es una carrera independiente.
+        cruzas (List[str]): Operadores que compiten en cada función.
+        repeticiones (int): Repeticiones máximas por configuración.
+        metodo (str): Uno de METODOS_CARRERA.
+        alfa (float): Nivel de significancia.
+        bloque (int): Repeticiones entre pruebas (también el mínimo antes de la primera).
+    """
+
+    def __init__(
+        self,
+        funciones: List[str],
+        cruzas: List[str],
+        repeticiones: int,
+        metodo: str = "friedman",
+        alfa: float = 0.05,
+        bloque: int = 5,
+    ):
+        if metodo not in METODOS_CARRERA:
+            raise ValueError(f"Método de carrera no reconocido: {metodo}")
+        if not 0.0 < alfa < 1.0:
+            raise ValueError("alfa_carrera debe estar en (0, 1)")
+        if bloque < 2:
+            raise ValueError("bloque_carrera debe ser >= 2")
+
+        self.funciones = funciones
+        self.cruzas = cruzas
+        self.repeticiones = repeticiones
+        self.metodo = metodo
+        self.alfa = alfa
+        self.bloque = bloque
+        self.mejores: Dict[Tuple[str, str, int], float] = {}
+        # Configuración descartada -> repeticiones que alcanzó a ejecutar
+        self.descartadas: Dict[Configuracion, int] = {}
+
+    def bloques(self) -> List[range]:
+        """Repeticiones de cada bloque, en orden."""
+        return [
+            range(inicio, min(inicio + self.bloque, self.repeticiones))
+            for inicio in range(0, self.repeticiones, self.bloque)
+        ]
+
+    def sigue(self, nombre_func: str, tipo_cruza: str) -> bool:
+        """True si la configuración no ha sido descartada."""
+        return (nombre_func, tipo_cruza) not in self.descartadas
+
+    def registrar(self, nombre_func: str, tipo_cruza: str, rep: int, mejor_final: float) -> None:
+        """Guarda el mejor costo final de una corrida."""
+        self.mejores[(nombre_func, tipo_cruza, rep)] = mejor_final
+
+    def cargar_resumen(self, ruta: str) -> None:
+        """Recupera los mejores costos de las corridas ya escritas en un CSV de resumen."""
+        with open(ruta, newline="") as f:
+            for fila in csv.DictReader(f):
+                self.registrar(fila["funcion"], fila["tipo_cruza"],
+                               int(fila["repeticion"]), float(fila["mejor_final"]))
+
+    def evaluar(self, completadas: int) -> List[Tuple[str, str, float]]:
+        """
+        Prueba cada función con las repeticiones 0..completadas-1 y descarta las
+        configuraciones significativamente peores.
+
+        Returns:
+            List[Tuple[str, str, float]]: (funcion, tipo_cruza, p-valor) de los descartes.
+        """
+        descartes = []
+        for nombre_func in self.funciones:
+            vivas = [cruza for cruza in self.cruzas if self.sigue(nombre_func, cruza)]
+            if len(vivas) < 2:
+                continue
+
+            costos = np.array([
+                [self.mejores[(nombre_func, cruza, rep)] for cruza in vivas]
+                for rep in range(completadas)
+            ])
+            if self.metodo == "friedman":
+                columnas = _descartes_friedman(costos, self.alfa)
+            else:
+                columnas = _descartes_wilcoxon(costos, self.alfa)
+
+            for j, p in columnas:
+                self.descartadas[(nombre_func, vivas[j])] = completadas
+                descartes.append((nombre_func, vivas[j], p))
+        return descartes
+
+    def corridas_ahorradas(self) -> int:
+        """Corridas que no se ejecutaron por descartes."""
+        return sum(self.repeticiones - hechas for hechas in self.descartadas.values())
@@ -0,0 +1,141 @@
+import time
+from typing import Optional
+
+# =========================================
+# Criterios de paro
+# =========================================
+# Además del máximo de generaciones, una corrida puede detenerse por:
+#   'evaluaciones'  -> se alcanzó el presupuesto de evaluaciones de la función objetivo
+#   'tiempo'        -> se agotó el tiempo de reloj (segundos)
+#   'objetivo'      -> el mejor costo llegó al valor objetivo (p. ej. 1e-8 con óptimo 0)
+#   'estancamiento' -> el mejor costo no mejoró más de `tol_estancamiento` en una ventana
+#   'diversidad'    -> la diversidad registrada cayó por debajo de un umbral
+# Los criterios se revisan al final de cada generación (o de cada registro en el
+# modo asíncrono, que revisa evaluaciones y tiempo tras cada evaluación), por lo
+# que la generación en curso siempre se completa.
+
+CRITERIO_GENERACIONES = "generaciones"
+
+
+class CriteriosParo:
+    """
+    Conjunto de criterios de paro; los que valen None están desactivados.
+
+    Args:
+        max_evaluaciones (int): Presupuesto de evaluaciones de la función objetivo.
+        tiempo_max (float): Tiempo de reloj máximo en segundos.
+        costo_objetivo (float): Se detiene cuando mejor <= costo_objetivo.
+        ventana_estancamiento (int): Generaciones sin mejora tolerables.
+        tol_estancamiento (float): Mejora mínima que reinicia la ventana.
+        diversidad_minima (float): Se detiene cuando diversidad < diversidad_minima.
+    """
+
+    def __init__(
+        self,
+        max_evaluaciones: Optional[int] = None,
+        tiempo_max: Optional[float] = None,
+        costo_objetivo: Optional[float] = None,
+        ventana_estancamiento: Optional[int] = None,
+        tol_estancamiento: float = 0.0,
+        diversidad_minima: Optional[float] = None,
+    ):
+        if max_evaluaciones is not None and max_evaluaciones < 1:
+            raise ValueError("max_evaluaciones debe ser >= 1")
+        if tiempo_max is not None and tiempo_max <= 0:
+            raise ValueError("tiempo_max debe ser > 0")
+        if ventana_estancamiento is not None and ventana_estancamiento < 1:
+            raise ValueError("ventana_estancamiento debe ser >= 1")
+
+        self.max_evaluaciones = max_evaluaciones
+        self.tiempo_max = tiempo_max
+        self.costo_objetivo = costo_objetivo
+        self.ventana_estancamiento = ventana_estancamiento
+        self.tol_estancamiento = tol_estancamiento
+        self.diversidad_minima = diversidad_minima
+        self.iniciar()
+
+    def activos(self) -> bool:
+        """True si hay al menos un criterio además del máximo de generaciones."""
+        return any(
+            valor is not None
+            for valor in (self.max_evaluaciones, self.tiempo_max, self.costo_objetivo,
+                          self.ventana_estancamiento, self.diversidad_minima)
+        )
+
+    def requiere_diversidad(self) -> bool:
+        """True si `revisar` necesita la diversidad de cada generación."""
+        return self.diversidad_minima is not None
+
+    def iniciar(self) -> None:
+        """Reinicia el reloj y la ventana de estancamiento (al comenzar la corrida)."""
+        self._t0 = time.perf_counter()
+        self._mejor_ref = float("inf")
+        self._sin_mejora = 0
+
+    def revisar_presupuesto(self, evaluaciones: int, transcurrido: Optional[float] = None) -> Optional[str]:
+        """
+        Revisa solo los criterios de presupuesto ('evaluaciones' y 'tiempo').
+
+        No depende del mejor costo ni de la diversidad, por lo que puede revisarse
+        tras cada evaluación sin alterar la ventana de estancamiento.
+
+        Args:
+            evaluaciones (int): Evaluaciones acumuladas de la función objetivo.
+            transcurrido (float): Segundos atribuidos a la corrida (ver `revisar`).
+
+        Returns:
+            Optional[str]: Nombre del criterio que detiene la corrida, o None.
+        """
+        if self.max_evaluaciones is not None and evaluaciones >= self.max_evaluaciones:
+            return "evaluaciones"
+
+        if self.tiempo_max is not None:
+            if transcurrido is None:
+                transcurrido = time.perf_counter() - self._t0
+            if transcurrido >= self.tiempo_max:
+                return "tiempo"
+
+        return None
+
+    def revisar(
+        self,
+        evaluaciones: int,
+        mejor: float,
+        diversidad: float,
+        transcurrido: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Revisa los criterios tras una generación.
+
+        Args:
+            evaluaciones (int): Evaluaciones acumuladas de la función objetivo.
+            mejor (float): Mejor costo actual.
+            diversidad (float): Diversidad de la generación (solo se usa si
+                `requiere_diversidad()`; puede ser None en otro caso).
+            transcurrido (float): Segundos atribuidos a la corrida. Si es None se usa
+                el reloj desde `iniciar()`; el motor apilado pasa la parte que le toca
+                a cada repetición del tiempo compartido.
+
+        Returns:
+            Optional[str]: Nombre del criterio que detiene la corrida, o None.
+        """
+        if self.costo_objetivo is not None and mejor <= self.costo_objetivo:
+            return "objetivo"
+
+        motivo = self.revisar_presupuesto(evaluaciones, transcurrido)
+        if motivo is not None:
+            return motivo
+
+        if self.ventana_estancamiento is not None:
+            if mejor < self._mejor_ref - self.tol_estancamiento:
+                self._mejor_ref = mejor
+                self._sin_mejora = 0
+            else:
+                self._sin_mejora += 1
+                if self._sin_mejora >= self.ventana_estancamiento:
+                    return "estancamiento"
+
+        if self.diversidad_minima is not None and diversidad < self.diversidad_minima:
+            return "diversidad"
+
+        return None
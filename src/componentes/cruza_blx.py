@@ -1,6 +1,8 @@
 from random import Random
 from typing import List, Tuple, Optional
 
+import numpy as np
+
 def cruza_blx(
     padre1: List[float],
     padre2: List[float],
@@ -65,4 +67,59 @@ def cruza_blx(
         hijo2.append(h2)
 
     return hijo1, hijo2
-    
\ No newline at end of file
+
+
+def cruza_blx_lote(
+    padres1: np.ndarray,
+    padres2: np.ndarray,
+    prob_cruza: float = 0.9,
+    alpha: float = 0.5,
+    rng: np.random.Generator = None,
+    limite_inf: Optional[float] = None,
+    limite_sup: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión por lotes de `cruza_blx`: cruza M parejas en una sola llamada.
+
+    Args:
+        padres1 (np.ndarray): Matriz (M, D) con los primeros progenitores.
+        padres2 (np.ndarray): Matriz (M, D) con los segundos progenitores.
+        prob_cruza (float): Probabilidad de aplicar el operador a cada pareja.
+        alpha (float): Coeficiente de expansión del intervalo.
+        rng (np.random.Generator): Generador de NumPy.
+        limite_inf (Optional[float]): Cota inferior del espacio de búsqueda.
+        limite_sup (Optional[float]): Cota superior del espacio de búsqueda.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matrices (M, D) con los hijos generados.
+    """
+    if rng is None:
+        raise ValueError("Se debe proporcionar un generador 'rng'")
+
+    if padres1.shape != padres2.shape:
+        raise ValueError("Los vectores padres deben tener la misma dimensión.")
+
+    M, n = padres1.shape
+
+    # Máscara de parejas que se cruzan
+    cruza = (rng.random(M) < prob_cruza)[:, None]
+
+    c_min = np.minimum(padres1, padres2)
+    c_max = np.maximum(padres1, padres2)
+    I = c_max - c_min
+
+    # Intervalo extendido [min - I*alpha, max + I*alpha]
+    low = c_min - alpha * I
+    ancho = (c_max + alpha * I) - low
+
+    # Muestreo independiente para cada hijo
+    # Sorteos en la precisión de los padres (float32 no se promueve a float64)
+    hijos1 = low + rng.random((M, n), dtype=padres1.dtype) * ancho
+    hijos2 = low + rng.random((M, n), dtype=padres1.dtype) * ancho
+
+    # Restricción de límites (clipping) para asegurar factibilidad
+    if limite_inf is not None and limite_sup is not None:
+        np.clip(hijos1, limite_inf, limite_sup, out=hijos1)
+        np.clip(hijos2, limite_inf, limite_sup, out=hijos2)
+
+    return np.where(cruza, hijos1, padres1), np.where(cruza, hijos2, padres2)
@@ -1,6 +1,8 @@
 from random import Random
 from typing import List, Tuple, Optional
 
+import numpy as np
+
 def cruza_sbx(
     padre1: List[float],
     padre2: List[float],
@@ -75,4 +77,69 @@ def cruza_sbx(
         hijo2.append(c2)
 
     return hijo1, hijo2
-    
\ No newline at end of file
+
+
+def cruza_sbx_lote(
+    padres1: np.ndarray,
+    padres2: np.ndarray,
+    prob_cruza: float = 0.9,
+    eta_c: float = 10.0,
+    rng: np.random.Generator = None,
+    limite_inf: Optional[float] = None,
+    limite_sup: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión por lotes de `cruza_sbx`: cruza M parejas en una sola llamada.
+
+    Args:
+        padres1 (np.ndarray): Matriz (M, D) con los primeros progenitores.
+        padres2 (np.ndarray): Matriz (M, D) con los segundos progenitores.
+        prob_cruza (float): Probabilidad de aplicar el operador a cada pareja.
+        eta_c (float): Índice de distribución.
+        rng (np.random.Generator): Generador de NumPy.
+        limite_inf (Optional[float]): Cota inferior del espacio de búsqueda.
+        limite_sup (Optional[float]): Cota superior del espacio de búsqueda.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matrices (M, D) con los hijos generados.
+    """
+    if rng is None:
+        raise ValueError("Se debe dar un generador 'rng'")
+
+    if padres1.shape != padres2.shape:
+        raise ValueError("Los padres deben tener la misma longitud.")
+
+    M, n = padres1.shape
+
+    # Máscara de parejas que se cruzan
+    cruza = (rng.random(M) < prob_cruza)[:, None]
+
+    eps = 1e-14
+
+    # Ordenamiento de variables para el cálculo (x1 < x2)
+    x1 = np.minimum(padres1, padres2)
+    x2 = np.maximum(padres1, padres2)
+
+    # Sorteo en la precisión de los padres (float32 no se promueve a float64)
+    u = rng.random((M, n), dtype=padres1.dtype)
+    exponente = 1.0 / (eta_c + 1.0)
+    beta_q = np.where(
+        u <= 0.5,
+        (2.0 * u) ** exponente,
+        (1.0 / (2.0 * (1.0 - u))) ** exponente,
+    )
+
+    c1 = 0.5 * ((x1 + x2) - beta_q * (x2 - x1))
+    c2 = 0.5 * ((x1 + x2) + beta_q * (x2 - x1))
+
+    # Genes idénticos o muy cercanos se heredan sin cambio; sin cruza se copian los padres
+    copia = (np.abs(padres1 - padres2) <= eps) | ~cruza
+    hijos1 = np.where(copia, padres1, c1)
+    hijos2 = np.where(copia, padres2, c2)
+
+    # Restricción de límites (clipping) para asegurar factibilidad
+    if limite_inf is not None and limite_sup is not None:
+        np.clip(hijos1, limite_inf, limite_sup, out=hijos1)
+        np.clip(hijos2, limite_inf, limite_sup, out=hijos2)
+
+    return hijos1, hijos2
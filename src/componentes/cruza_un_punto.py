@@ -1,6 +1,8 @@
 from random import Random
 from typing import List, Tuple
 
+import numpy as np
+
 def cruza_un_punto(
     padre1: List[float],
     padre2: List[float],
@@ -48,3 +50,46 @@ def cruza_un_punto(
     hijo2 = padre2[:punto_corte] + padre1[punto_corte:]
 
     return hijo1, hijo2
+
+
+def cruza_un_punto_lote(
+    padres1: np.ndarray,
+    padres2: np.ndarray,
+    prob_cruza: float = 0.8,
+    rng: np.random.Generator = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión por lotes de `cruza_un_punto`: cruza M parejas en una sola llamada.
+
+    Args:
+        padres1 (np.ndarray): Matriz (M, D) con los primeros progenitores.
+        padres2 (np.ndarray): Matriz (M, D) con los segundos progenitores.
+        prob_cruza (float): Probabilidad de aplicar el operador a cada pareja.
+        rng (np.random.Generator): Generador de NumPy.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matrices (M, D) con los hijos generados.
+    """
+    if rng is None:
+        raise ValueError("Se debe dar un generador 'rng'")
+
+    if padres1.shape != padres2.shape:
+        raise ValueError("Los padres deben tener la misma longitud.")
+
+    M, n = padres1.shape
+
+    # Máscara de parejas que se cruzan
+    cruza = rng.random(M) < prob_cruza
+
+    # Con un solo gen no hay punto de corte posible
+    if n == 1:
+        return padres1.copy(), padres2.copy()
+
+    # Punto de corte por pareja (entre 1 y n-1); las parejas sin cruza usan corte n
+    puntos_corte = np.where(cruza, rng.integers(1, n, size=M), n)
+    mascara = np.arange(n)[None, :] < puntos_corte[:, None]
+
+    hijos1 = np.where(mascara, padres1, padres2)
+    hijos2 = np.where(mascara, padres2, padres1)
+
+    return hijos1, hijos2
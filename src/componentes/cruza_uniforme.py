@@ -1,6 +1,8 @@
 from random import Random
 from typing import List, Tuple
 
+import numpy as np
+
 def cruza_uniforme(
     padre1: List[float],
     padre2: List[float],
@@ -40,3 +42,41 @@ def cruza_uniforme(
     hijo2 = [padre2[i] if mascara[i] else padre1[i] for i in range(n)]
 
     return hijo1, hijo2
+
+
+def cruza_uniforme_lote(
+    padres1: np.ndarray,
+    padres2: np.ndarray,
+    prob_cruza: float = 0.8,
+    rng: np.random.Generator = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión por lotes de `cruza_uniforme`: cruza M parejas en una sola llamada.
+
+    Args:
+        padres1 (np.ndarray): Matriz (M, D) con los primeros progenitores.
+        padres2 (np.ndarray): Matriz (M, D) con los segundos progenitores.
+        prob_cruza (float): Probabilidad de aplicar el operador a cada pareja.
+        rng (np.random.Generator): Generador de NumPy.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matrices (M, D) con los hijos generados.
+    """
+    if rng is None:
+        raise ValueError("Se debe dar un generador 'rng'")
+
+    if padres1.shape != padres2.shape:
+        raise ValueError("Los padres deben tener la misma longitud.")
+
+    M, n = padres1.shape
+
+    # Máscara de parejas que se cruzan
+    cruza = rng.random(M) < prob_cruza
+
+    # Máscara por gen; en parejas sin cruza cada hijo hereda de su propio padre
+    mascara = (rng.random((M, n)) < 0.5) | ~cruza[:, None]
+
+    hijos1 = np.where(mascara, padres1, padres2)
+    hijos2 = np.where(mascara, padres2, padres1)
+
+    return hijos1, hijos2
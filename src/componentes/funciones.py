@@ -1,13 +1,45 @@
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
 import numpy as np
 
+# Todas las funciones aceptan un individuo (D,) o una matriz de población (N, D)
+# y operan sobre el último eje, devolviendo un escalar o un vector (N,) de costos.
+# Las constantes que dependen solo de la dimensión se calculan una vez por dimensión.
+# Una entrada float32 se evalúa en float32 de principio a fin (costos float32);
+# cualquier otra se convierte a float64.
+
+
+def _arreglo(x) -> np.ndarray:
+    """Arreglo NumPy de x: conserva float32 y convierte lo demás a float64."""
+    x = np.asarray(x)
+    return x if x.dtype == np.float32 else x.astype(float, copy=False)
+
+
+@lru_cache(maxsize=None)
+def _indices(n: int, tipo: type = np.float64) -> np.ndarray:
+    """Vector de solo lectura [1, 2, ..., n]."""
+    i = np.arange(1, n + 1, dtype=tipo)
+    i.setflags(write=False)
+    return i
+
+
+@lru_cache(maxsize=None)
+def _raiz_indices(n: int, tipo: type = np.float64) -> np.ndarray:
+    """Vector de solo lectura [sqrt(1), ..., sqrt(n)] (Griewank)."""
+    r = np.sqrt(_indices(n, tipo))
+    r.setflags(write=False)
+    return r
+
+
 # A. Función Sphere
 def sphere(x):
     """
     Función Esfera.
     Mínimo global: f(0, 0, ..., 0) = 0.
     """
-    x = np.array(x)  # Asegura que siempre sea un arreglo de numpy
-    return np.sum(x**2)
+    x = _arreglo(x)  # Asegura que siempre sea un arreglo de numpy
+    return np.sum(x**2, axis=-1)
 
 # B. Función Ackley
 def ackley(x):
@@ -15,10 +47,10 @@ def ackley(x):
     Función de Ackley.
     Mínimo global: f(0, 0, ..., 0) = 0.
     """
-    x = np.array(x)  # asegura que siempre sea arreglo numpy
-    n = x.size
-    sum_sq = np.sum(x**2)
-    sum_cos = np.sum(np.cos(2 * np.pi * x))
+    x = _arreglo(x)  # asegura que siempre sea arreglo numpy
+    n = x.shape[-1]
+    sum_sq = np.sum(x**2, axis=-1)
+    sum_cos = np.sum(np.cos(2 * np.pi * x), axis=-1)
     term1 = -20 * np.exp(-0.2 * np.sqrt(sum_sq / n))
     term2 = -np.exp(sum_cos / n)
     return 20 + np.e + term1 + term2
@@ -29,12 +61,11 @@ def griewank(x):
     Función de Griewank.
     Mínimo global: f(0, 0, ..., 0) = 0.
     """
-    x = np.array(x)
-    n = x.size
-    # Índices para el producto (de 1 a n)
-    i = np.arange(1, n + 1)
-    sum_term = np.sum(x**2 / 4000)
-    prod_term = np.prod(np.cos(x / np.sqrt(i)))
+    x = _arreglo(x)
+    n = x.shape[-1]
+    sum_term = np.sum(x**2 / 4000, axis=-1)
+    # Raíces de los índices (de 1 a n), precalculadas por dimensión
+    prod_term = np.prod(np.cos(x / _raiz_indices(n, x.dtype.type)), axis=-1)
     return 1 + sum_term - prod_term
 
 # D. Función Rastrigin
@@ -43,9 +74,9 @@ def rastrigin(x):
     Función de Rastrigin. Altamente multimodal.
     Mínimo global: f(0, 0, ..., 0) = 0.
     """
-    x = np.array(x)
-    n = x.size
-    sum_term = np.sum(x**2 - 10 * np.cos(2 * np.pi * x))
+    x = _arreglo(x)
+    n = x.shape[-1]
+    sum_term = np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=-1)
     return 10 * n + sum_term
 
 # E. Función Rosenbrock
@@ -54,12 +85,136 @@ def rosenbrock(x):
     Función de Rosenbrock (Banana).
     Mínimo global: f(1, 1, ..., 1) = 0.
     """
-    x = np.array(x)  # asegura que siempre sea arreglo numpy
-    n = x.size
+    x = _arreglo(x)  # asegura que siempre sea arreglo numpy
+    n = x.shape[-1]
     if n < 2:
         raise ValueError("La función Rosenbrock requiere al menos 2 dimensiones")
-    suma = 0
-    for i in range(n - 1):
-        suma += 100 * (x[i+1] - x[i]**2)**2 + (1 - x[i])**2
-    return suma
-    
\ No newline at end of file
+    if x.ndim == 1:
+        # Un individuo: ciclo escalar original (los motores de listas dependen de
+        # sus bits exactos; las potencias vectorizadas difieren en el último bit)
+        suma = 0
+        for i in range(n - 1):
+            suma += 100 * (x[i+1] - x[i]**2)**2 + (1 - x[i])**2
+        return suma
+    terminos = 100 * (x[..., 1:] - x[..., :-1]**2)**2 + (1 - x[..., :-1])**2
+    # Suma acumulada secuencial en el orden del ciclo (np.sum suma por pares)
+    return np.cumsum(terminos, axis=-1)[..., -1]
+
+# F. Función Schwefel (2.26)
+def schwefel(x):
+    """
+    Función de Schwefel. Multimodal, con el óptimo lejos del segundo mejor mínimo.
+    Mínimo global: f(420.9687, ..., 420.9687) ≈ 0.
+    """
+    x = _arreglo(x)
+    n = x.shape[-1]
+    return 418.9828872724338 * n - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=-1)
+
+# G. Función Levy
+def levy(x):
+    """
+    Función de Levy.
+    Mínimo global: f(1, 1, ..., 1) = 0.
+    """
+    x = _arreglo(x)
+    w = 1 + (x - 1) / 4
+    termino1 = np.sin(np.pi * w[..., 0])**2
+    w_medio = w[..., :-1]
+    termino2 = np.sum((w_medio - 1)**2 * (1 + 10 * np.sin(np.pi * w_medio + 1)**2), axis=-1)
+    w_n = w[..., -1]
+    termino3 = (w_n - 1)**2 * (1 + np.sin(2 * np.pi * w_n)**2)
+    return termino1 + termino2 + termino3
+
+# H. Función Zakharov
+def zakharov(x):
+    """
+    Función de Zakharov. Unimodal, no separable.
+    Mínimo global: f(0, 0, ..., 0) = 0.
+    """
+    x = _arreglo(x)
+    n = x.shape[-1]
+    sum_sq = np.sum(x**2, axis=-1)
+    # Ponderación 0.5 * i con los índices precalculados por dimensión
+    sum_ponderada = 0.5 * (x @ _indices(n, x.dtype.type))
+    return sum_sq + sum_ponderada**2 + sum_ponderada**4
+
+
+# =========================================
+# Variantes desplazadas y rotadas
+# =========================================
+
+def matriz_rotacion(n: int, semilla: int) -> np.ndarray:
+    """
+    Matriz ortogonal aleatoria (n, n) uniforme (Haar), vía descomposición QR.
+    """
+    rng = np.random.default_rng(semilla)
+    q, r = np.linalg.qr(rng.standard_normal((n, n)))
+    # Corrección de signos para que la distribución sea uniforme
+    return q * np.sign(np.diag(r))
+
+
+class FuncionTransformada:
+    """
+    Variante desplazada y/o rotada de una función base:
+
+        g(x) = f(R (x - o) + c)
+
+    donde `o` es el desplazamiento (nuevo óptimo), `R` una rotación ortogonal
+    y `c` el óptimo de la función base (0 para Sphere, 1 para Rosenbrock...).
+    `o` y `R` se generan una vez por dimensión con una semilla fija y la rotación
+    se aplica a toda la población como una sola multiplicación de matrices.
+
+    Args:
+        base: Función base (acepta (D,) o (N, D)).
+        limites (Tuple[float, float]): Dominio; el desplazamiento se toma en el 80% central.
+        centro (float): Óptimo de la función base en cada coordenada.
+        desplazar (bool): Aplica el desplazamiento `o`.
+        rotar (bool): Aplica la rotación `R`.
+        semilla (int): Semilla para generar `o` y `R`.
+    """
+
+    def __init__(
+        self,
+        base,
+        limites: Tuple[float, float],
+        centro: float = 0.0,
+        desplazar: bool = True,
+        rotar: bool = True,
+        semilla: int = 0,
+    ):
+        self.base = base
+        self.limites = limites
+        self.centro = centro
+        self.desplazar = desplazar
+        self.rotar = rotar
+        self.semilla = semilla
+        self._parametros: Dict[object, Tuple[np.ndarray, Optional[np.ndarray]]] = {}
+
+    def parametros(self, n: int, tipo: type = np.float64) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Desplazamiento (n,) y matriz de rotación transpuesta (n, n) para la dimensión n y la precisión `tipo`."""
+        if tipo is not np.float64:
+            # Copia de los parámetros float64 en la otra precisión, también una vez por dimensión
+            if (n, tipo) not in self._parametros:
+                o, rot_t = self.parametros(n)
+                self._parametros[(n, tipo)] = (
+                    o.astype(tipo), None if rot_t is None else rot_t.astype(tipo)
+                )
+            return self._parametros[(n, tipo)]
+        if n not in self._parametros:
+            a, b = self.limites
+            rng = np.random.default_rng((self.semilla, n))
+            if self.desplazar:
+                o = rng.uniform(0.8 * a, 0.8 * b, size=n)
+            else:
+                o = np.zeros(n)
+            rot_t = matriz_rotacion(n, self.semilla + n).T.copy() if self.rotar else None
+            self._parametros[n] = (o, rot_t)
+        return self._parametros[n]
+
+    def __call__(self, x):
+        x = _arreglo(x)
+        o, rot_t = self.parametros(x.shape[-1], x.dtype.type)
+        z = x - o
+        if rot_t is not None:
+            z = z @ rot_t
+        return self.base(z + self.centro)
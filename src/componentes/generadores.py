@@ -0,0 +1,169 @@
+import random
+from typing import List, Tuple, Union
+
+import numpy as np
+
+# =========================================
+# Capa de generadores aleatorios
+# =========================================
+# Dos modos por corrida:
+#   'compatible' -> generadores originales: random.Random(semilla) en el motor de
+#                   listas, default_rng(semilla) en el matricial y (semilla, k) para
+#                   flujos auxiliares. Reproduce bit a bit los resultados publicados.
+#   'secuencia'  -> un SeedSequence(semilla) por corrida del que se derivan (spawn)
+#                   flujos hijos independientes: operadores genéticos, métrica de
+#                   diversidad muestreada y, en el modelo de islas, uno por isla.
+#                   Todos los flujos son PCG64 y admiten sorteos por bloques.
+#
+# En el modo 'secuencia' el motor de listas recibe un GeneradorBloques: conserva
+# la interfaz de random.Random que usan los operadores, pero sus números salen
+# de un Generator de NumPy sorteados en bloques.
+
+MODOS_RNG = ("compatible", "secuencia")
+
+# Índices de los flujos hijos de cada corrida
+FLUJO_OPERADORES = 0
+FLUJO_DIVERSIDAD = 1
+NUM_FLUJOS = 2
+
+
+class GeneradorBloques(random.Random):
+    """
+    random.Random respaldado por un np.random.Generator.
+
+    `random()` y `getrandbits()` (usado por randrange, randint y choice)
+    consumen bloques de `tam_bloque` uniformes y palabras de 64 bits sorteados
+    de una sola vez. El Generator queda disponible en `generador` para
+    sorteos vectoriales.
+
+    Args:
+        generador (np.random.Generator): Flujo de origen.
+        tam_bloque (int): Uniformes por bloque.
+    """
+
+    def __init__(self, generador: np.random.Generator, tam_bloque: int = 4096):
+        if tam_bloque < 1:
+            raise ValueError("tam_bloque debe ser >= 1")
+        self.generador = generador
+        self.tam_bloque = tam_bloque
+        super().__init__()
+
+    def seed(self, *args, **kwargs) -> None:
+        # random.Random.__init__ llama a seed(); la semilla la controla el Generator
+        self._bloque: List[float] = []
+        self._pos = 0
+        self._palabras: List[int] = []
+        self._pos_palabras = 0
+
+    def random(self) -> float:
+        if self._pos == len(self._bloque):
+            self._bloque = self.generador.random(self.tam_bloque).tolist()
+            self._pos = 0
+        valor = self._bloque[self._pos]
+        self._pos += 1
+        return valor
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            if self._pos_palabras == len(self._palabras):
+                self._palabras = self.generador.integers(
+                    0, 1 << 64, size=self.tam_bloque, dtype=np.uint64
+                ).tolist()
+                self._pos_palabras = 0
+            palabra = self._palabras[self._pos_palabras]
+            self._pos_palabras += 1
+            return palabra >> (64 - k)
+        palabras = self.generador.integers(0, 1 << 32, size=(k + 31) // 32, dtype=np.uint64)
+        return int.from_bytes(palabras.astype("<u4").tobytes(), "little") >> (32 * len(palabras) - k)
+
+    def getstate(self):
+        return (self.generador.bit_generator.state, self._bloque, self._pos,
+                self._palabras, self._pos_palabras)
+
+    def setstate(self, estado) -> None:
+        (self.generador.bit_generator.state, self._bloque, self._pos,
+         self._palabras, self._pos_palabras) = estado
+
+
+def _validar_modo(modo_rng: str) -> None:
+    if modo_rng not in MODOS_RNG:
+        raise ValueError(f"Modo de generador no reconocido: {modo_rng}")
+
+
+def generadores_corrida(
+    semilla: int,
+    modo_rng: str = "compatible",
+    vectorial: bool = False,
+) -> Tuple[Union[random.Random, np.random.Generator], np.random.Generator]:
+    """
+    Generadores de una corrida: (operadores, diversidad muestreada).
+
+    Args:
+        semilla (int): Semilla de la corrida.
+        modo_rng (str): 'compatible' o 'secuencia'.
+        vectorial (bool): True para motores NumPy (operadores como Generator);
+            False para el motor de listas (operadores con interfaz random.Random).
+    """
+    _validar_modo(modo_rng)
+    if modo_rng == "compatible":
+        operadores = np.random.default_rng(semilla) if vectorial else random.Random(semilla)
+        return operadores, np.random.default_rng((semilla, 1))
+
+    flujos = np.random.SeedSequence(semilla).spawn(NUM_FLUJOS)
+    operadores = np.random.default_rng(flujos[FLUJO_OPERADORES])
+    if not vectorial:
+        operadores = GeneradorBloques(operadores)
+    return operadores, np.random.default_rng(flujos[FLUJO_DIVERSIDAD])
+
+
+def semillas_islas(semilla: int, num_islas: int, modo_rng: str = "compatible") -> list:
+    """Semillas de cada isla, aceptadas por np.random.default_rng."""
+    _validar_modo(modo_rng)
+    if modo_rng == "compatible":
+        return [(semilla, isla) for isla in range(num_islas)]
+    return np.random.SeedSequence(semilla).spawn(num_islas)
+
+
+def semillas_derivadas(base_semilla: int, n: int) -> List[int]:
+    """
+    `n` semillas enteras derivadas de SeedSequence(base_semilla).spawn(n).
+    Cada semilla es un entero de 63 bits apto para CSV y para random.Random.
+    """
+    return [
+        int(hijo.generate_state(1, np.uint64)[0] >> np.uint64(1))
+        for hijo in np.random.SeedSequence(base_semilla).spawn(n)
+    ]
+
+
+class GeneradoresApilados:
+    """
+    Varios np.random.Generator (uno por repetición) con la interfaz de sorteo de
+    los operadores por lotes (`random`, `integers`, `uniform`).
+
+    Un sorteo de forma (R * m, ...) se reparte en R sorteos (m, ...), uno de cada
+    generador, apilados en orden: cada repetición consume exactamente los números
+    que consumiría corriendo sola con su propio generador.
+
+    Args:
+        generadores (List[np.random.Generator]): Un flujo por repetición.
+    """
+
+    def __init__(self, generadores: List[np.random.Generator]):
+        self.generadores = generadores
+
+    def _apilar(self, sorteo, size) -> np.ndarray:
+        forma = (size,) if np.isscalar(size) else tuple(size)
+        num = len(self.generadores)
+        if forma[0] % num:
+            raise ValueError(f"La forma {forma} no se reparte entre {num} generadores")
+        parcial = (forma[0] // num,) + forma[1:]
+        return np.concatenate([sorteo(rng, parcial) for rng in self.generadores])
+
+    def random(self, size, dtype=np.float64) -> np.ndarray:
+        return self._apilar(lambda rng, forma: rng.random(forma, dtype=dtype), size)
+
+    def integers(self, low, high, size) -> np.ndarray:
+        return self._apilar(lambda rng, forma: rng.integers(low, high, size=forma), size)
+
+    def uniform(self, low, high, size) -> np.ndarray:
+        return self._apilar(lambda rng, forma: rng.uniform(low, high, size=forma), size)
@@ -0,0 +1,283 @@
+import argparse
+import sys
+from typing import List, Optional
+
+# =========================================
+# Interfaz de línea de comandos
+# =========================================
+# Un solo punto de entrada con subcomandos:
+#   run      -> batería de experimentos (correr_experimentos)
+#   resume   -> retoma una batería interrumpida (correr_experimentos con reanudar=True)
+#   plot     -> gráficas en una pasada (reporte.py)
+#   bench    -> micro-benchmarks de componentes (benchmark_operadores.py)
+#   profile  -> una corrida con desglose de tiempo por fase (perfilado.py)
+#
+# Este módulo solo importa argparse al cargarse: cada subcomando importa sus
+# dependencias al ejecutarse (run/resume/profile: NumPy; plot: pandas y
+# matplotlib, solo si la caché de agregados no sirve). Así `--help` no paga el
+# costo de NumPy, pandas ni matplotlib, y `run` nunca importa pandas ni matplotlib.
+#
+# Las opciones con valores fijos se validan con `choices` de argparse. Las tuplas
+# repiten las de sus módulos (MODOS_RNG, PRECISIONES, PROGRAMAS_REGISTRO...) para
+# no importarlos en `--help`. Las listas de funciones y cruzas las valida main_ga;
+# los errores de ejecución se propagan sin convertirse en errores de uso.
+
+RUTA_RESULTADOS = "resultados_ga_sphere_rastrigin_rosenbrock.csv"
+FUNCIONES = "sphere,rastrigin,rosenbrock"
+CRUZAS = "un_punto,uniforme,blx,sbx"
+
+MOTORES = ("listas", "matricial", "apilado", "islas", "asincrono")
+MUTACIONES = ("densa", "dispersa")
+SELECCIONES = ("ruleta", "sus")
+REEMPLAZOS = ("ordenado", "parcial")
+METRICAS_DIVERSIDAD = ("desviacion", "distancia", "distancia_muestreada")
+MODOS_RNG = ("compatible", "secuencia")
+PRECISIONES = ("float64", "float32")
+PROGRAMAS_REGISTRO = ("todas", "cada_k", "logaritmico", "mejora")
+MODOS_SEMILLAS = ("independientes", "bloques", "derivadas")
+FORMATOS_CURVAS = ("csv", "npz")
+METODOS_CARRERA = ("friedman", "wilcoxon")
+
+
+def _lista(texto: str) -> List[str]:
+    return [valor for valor in texto.split(",") if valor]
+
+
+def _agregar_parametros_ga(parser: argparse.ArgumentParser) -> None:
+    """Parámetros comunes a cada corrida (los de `ejecutar_ga_real`)."""
+    grupo = parser.add_argument_group("algoritmo")
+    grupo.add_argument("--dim", type=int, default=10)
+    grupo.add_argument("--tam-pob", type=int, default=100)
+    grupo.add_argument("--generaciones", type=int, default=1000)
+    grupo.add_argument("--motor", default="listas", choices=MOTORES)
+    grupo.add_argument("--mutacion", default="densa", choices=MUTACIONES)
+    grupo.add_argument("--seleccion", default="ruleta", choices=SELECCIONES,
+                       help="'sus' en los motores matricial, apilado e islas")
+    grupo.add_argument("--reemplazo", default="ordenado", choices=REEMPLAZOS)
+    grupo.add_argument("--metrica-diversidad", default="desviacion", choices=METRICAS_DIVERSIDAD)
+    grupo.add_argument("--diversidad-incremental", action="store_true")
+    grupo.add_argument("--cache-evaluacion", action="store_true")
+    grupo.add_argument("--num-islas", type=int, default=4)
+    grupo.add_argument("--trabajadores-eval", type=int, default=2)
+    grupo.add_argument("--modo-rng", default="compatible", choices=MODOS_RNG)
+    grupo.add_argument("--precision", default="float64", choices=PRECISIONES,
+                       help="float32 solo en los motores matricial y apilado")
+    grupo.add_argument("--registro", default="todas", choices=PROGRAMAS_REGISTRO)
+    grupo.add_argument("--registro-cada", type=int, default=10)
+    grupo.add_argument("--registro-puntos", type=int, default=100)
+
+    paro = parser.add_argument_group("criterios de paro")
+    paro.add_argument("--max-evaluaciones", type=int, default=None)
+    paro.add_argument("--tiempo-max", type=float, default=None, help="Segundos por corrida")
+    paro.add_argument("--costo-objetivo", type=float, default=None)
+    paro.add_argument("--ventana-estancamiento", type=int, default=None)
+    paro.add_argument("--tol-estancamiento", type=float, default=0.0)
+    paro.add_argument("--diversidad-minima", type=float, default=None)
+
+
+def _parametros_ga(args: argparse.Namespace) -> dict:
+    return dict(
+        dim=args.dim,
+        tam_pob=args.tam_pob,
+        generaciones=args.generaciones,
+        motor=args.motor,
+        mutacion=args.mutacion,
+        seleccion=args.seleccion,
+        reemplazo=args.reemplazo,
+        metrica_diversidad=args.metrica_diversidad,
+        diversidad_incremental=args.diversidad_incremental,
+        cache_evaluacion=args.cache_evaluacion,
+        num_islas=args.num_islas,
+        trabajadores_eval=args.trabajadores_eval,
+        modo_rng=args.modo_rng,
+        precision=args.precision,
+        registro=args.registro,
+        registro_cada=args.registro_cada,
+        registro_puntos=args.registro_puntos,
+    )
+
+
+def _criterios_paro(args: argparse.Namespace) -> dict:
+    criterios = {
+        nombre: getattr(args, nombre)
+        for nombre in ("max_evaluaciones", "tiempo_max", "costo_objetivo",
+                       "ventana_estancamiento", "diversidad_minima")
+        if getattr(args, nombre) is not None
+    }
+    if args.ventana_estancamiento is not None:
+        criterios["tol_estancamiento"] = args.tol_estancamiento
+    return criterios
+
+# =========================================
+# Subcomandos
+# =========================================
+
+
+def _bateria(args: argparse.Namespace, reanudar: bool) -> int:
+    from main_ga import correr_experimentos
+
+    modo_semillas = args.modo_semillas
+    if modo_semillas is None:
+        # Con -s, el modo por bloques (comportamiento histórico de main_ga.py -s SEED)
+        modo_semillas = "bloques" if args.semilla is not None else "independientes"
+    if args.semilla is not None:
+        print(f"[INFO] Modo de semillas '{modo_semillas}' activo. Base: {args.semilla}")
+
+    correr_experimentos(
+        nombre_archivo=args.salida,
+        funciones=_lista(args.funciones),
+        cruzas=_lista(args.cruzas),
+        repeticiones=args.repeticiones,
+        modo_semillas=modo_semillas,
+        base_semilla=args.semilla,
+        criterios_paro=_criterios_paro(args),
+        perfilar=args.perfilar,
+        workers=args.workers,
+        reanudar=reanudar,
+        salida_curvas=args.salida_curvas,
+        carrera=args.carrera,
+        alfa_carrera=args.alfa_carrera,
+        bloque_carrera=args.bloque_carrera,
+        **_parametros_ga(args),
+    )
+    return 0
+
+
+def comando_run(args: argparse.Namespace) -> int:
+    return _bateria(args, reanudar=False)
+
+
+def comando_resume(args: argparse.Namespace) -> int:
+    return _bateria(args, reanudar=True)
+
+
+def comando_plot(args: argparse.Namespace) -> int:
+    from reporte import generar_reporte
+
+    generar_reporte(
+        figuras=args.figuras or None,
+        ruta_resumen=args.resumen,
+        ruta_curvas=args.curvas,
+        ruta_npz=args.npz,
+        dir_cache=args.dir_cache,
+        dir_salida=args.dir_salida,
+    )
+    return 0
+
+
+def comando_bench(args: argparse.Namespace) -> int:
+    from benchmark_operadores import main as main_benchmark
+
+    return main_benchmark(args.argumentos)
+
+
+def comando_profile(args: argparse.Namespace) -> int:
+    from main_ga import ejecutar_ga_real
+
+    resultado = ejecutar_ga_real(
+        nombre_func=args.funcion,
+        tipo_cruza=args.cruza,
+        semilla=args.semilla,
+        perfilar=True,
+        **_criterios_paro(args),
+        **_parametros_ga(args),
+    )
+
+    perfil = resultado["perfil"]
+    total = sum(fase["tiempo"] for fase in perfil.values()) or 1.0
+    print(f"\n[INFO] {args.funcion} + {args.cruza} ({args.motor}): "
+          f"{resultado['generaciones_ejecutadas']} generaciones, "
+          f"{resultado['evaluaciones']} evaluaciones, {resultado['tiempo_total']:.4f}s")
+    print(f"\n{'fase':<16}{'tiempo (s)':>12}{'%':>8}{'llamadas':>10}")
+    for fase, datos in sorted(perfil.items(), key=lambda par: -par[1]["tiempo"]):
+        print(f"{fase:<16}{datos['tiempo']:>12.4f}{100 * datos['tiempo'] / total:>8.1f}{datos['llamadas']:>10}")
+    return 0
+
+# =========================================
+# Parser
+# =========================================
+
+
+def construir_parser() -> argparse.ArgumentParser:
+    # Rutas por defecto de reporte.py, repetidas aquí para no importarlo en --help
+    ruta_base = RUTA_RESULTADOS[:-len(".csv")]
+
+    parser = argparse.ArgumentParser(
+        prog="linea_comandos.py",
+        description="Algoritmo genético real: experimentos, reanudación, gráficas y perfilado.",
+    )
+    subparsers = parser.add_subparsers(dest="comando", required=True, metavar="comando")
+
+    # --- run / resume ---
+    bateria = argparse.ArgumentParser(add_help=False)
+    bateria.add_argument("--salida", default=RUTA_RESULTADOS,
+                         help="CSV de resumen; las curvas y la bitácora usan el mismo nombre base")
+    bateria.add_argument("--funciones", default=FUNCIONES, help="Funciones separadas por comas")
+    bateria.add_argument("--cruzas", default=CRUZAS, help="Operadores de cruza separados por comas")
+    bateria.add_argument("--repeticiones", type=int, default=30)
+    bateria.add_argument("-s", "--semilla", "--seed", type=int, default=None,
+                         help="Semilla base (activa el modo de semillas 'bloques')")
+    bateria.add_argument("--modo-semillas", default=None, choices=MODOS_SEMILLAS)
+    bateria.add_argument("--workers", type=int, default=1, help="Procesos para repartir las corridas")
+    bateria.add_argument("--salida-curvas", default="csv", choices=FORMATOS_CURVAS)
+    bateria.add_argument("--perfilar", action="store_true",
+                         help="Agrega al resumen el tiempo por fase de cada corrida")
+    bateria.add_argument("--carrera", default=None, choices=METODOS_CARRERA,
+                         help="Deja de correr las cruzas peores")
+    bateria.add_argument("--alfa-carrera", type=float, default=0.05)
+    bateria.add_argument("--bloque-carrera", type=int, default=5,
+                         help="Repeticiones entre pruebas de la carrera")
+    _agregar_parametros_ga(bateria)
+
+    run = subparsers.add_parser("run", parents=[bateria], help="Ejecuta una batería de experimentos")
+    run.set_defaults(accion=comando_run)
+
+    resume = subparsers.add_parser(
+        "resume", parents=[bateria],
+        help="Retoma una batería interrumpida (mismos parámetros que run)",
+    )
+    resume.set_defaults(accion=comando_resume)
+
+    # --- plot ---
+    plot = subparsers.add_parser("plot", help="Genera las gráficas desde los CSV de resultados")
+    plot.add_argument("figuras", nargs="*",
+                      help="convergencia, diversidad, boxplot y/o tiempo (default: todas)")
+    plot.add_argument("--resumen", default=RUTA_RESULTADOS)
+    plot.add_argument("--curvas", default=f"{ruta_base}_curvas.csv")
+    plot.add_argument("--npz", default=f"{ruta_base}_curvas_npz",
+                      help="Directorio de curvas columnar (tiene prioridad si existe)")
+    plot.add_argument("--dir-cache", default=".cache_reporte")
+    plot.add_argument("--dir-salida", default=".")
+    plot.set_defaults(accion=comando_plot)
+
+    # --- bench ---
+    bench = subparsers.add_parser(
+        "bench", add_help=False,
+        help="Micro-benchmarks de componentes (opciones de benchmark_operadores.py)",
+    )
+    bench.set_defaults(accion=comando_bench)
+
+    # --- profile ---
+    profile = subparsers.add_parser("profile", help="Una corrida con desglose de tiempo por fase")
+    profile.add_argument("--funcion", default="rastrigin")
+    profile.add_argument("--cruza", default="sbx")
+    profile.add_argument("-s", "--semilla", type=int, default=42)
+    _agregar_parametros_ga(profile)
+    profile.set_defaults(accion=comando_profile)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = construir_parser()
+    # Las opciones de bench las interpreta benchmark_operadores.main
+    args, restantes = parser.parse_known_args(argv)
+    if args.comando == "bench":
+        args.argumentos = restantes
+    elif restantes:
+        parser.error(f"argumentos no reconocidos: {' '.join(restantes)}")
+    return args.accion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
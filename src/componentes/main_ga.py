@@ -2,18 +2,43 @@ import random
 import time
 import csv
 import sys
+from functools import partial
 
-from typing import Callable, Dict, Tuple, List
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 
-from funciones import sphere, ackley, griewank, rastrigin, rosenbrock
-from seleccion_ruleta import transformar_aptitud, seleccion_ruleta
-from calcular_diversidad import calcular_diversidad
-from cruza_un_punto import cruza_un_punto
-from cruza_uniforme import cruza_uniforme
-from cruza_blx import cruza_blx
-from cruza_sbx import cruza_sbx
-from mutacion_real import mutacion_real
-from reemplazo_peores import reemplazo_peores
+from typing import Callable, Dict, Tuple, List, Optional, Union
+
+from funciones import (
+    sphere, ackley, griewank, rastrigin, rosenbrock, schwefel, levy, zakharov,
+    FuncionTransformada
+)
+from seleccion_ruleta import transformar_aptitud_vector, seleccion_ruleta_indices
+from calcular_diversidad import (
+    medir_diversidad, RastreadorDiversidad, PERIODO_REINICIO_DIVERSIDAD, METRICAS_DIVERSIDAD
+)
+from cruza_un_punto import cruza_un_punto, cruza_un_punto_lote
+from cruza_uniforme import cruza_uniforme, cruza_uniforme_lote
+from cruza_blx import cruza_blx, cruza_blx_lote
+from cruza_sbx import cruza_sbx, cruza_sbx_lote
+from mutacion_real import mutacion_real, mutacion_real_dispersa
+from reemplazo_peores import reemplazo_peores, reemplazo_peores_parcial
+from motor_matricial import ejecutar_ga_matricial
+from motor_apilado import ejecutar_ga_apilado
+from modelo_islas import ejecutar_ga_islas
+from modelo_asincrono import ejecutar_ga_asincrono
+from criterios_paro import CriteriosParo, CRITERIO_GENERACIONES
+from perfilado import PerfiladorFases, columnas_perfil, valores_perfil
+from registro_metricas import RegistroMetricas
+from generadores import MODOS_RNG, generadores_corrida, semillas_derivadas
+from cache_evaluacion import EvaluadorCache
+from bitacora import (
+    escribir_encabezado, leer_bitacora, registrar_corrida, sincronizar, truncar_archivo,
+    verificar_parametros
+)
+from salida_columnar import EscritorCurvasNPZ, truncar_partes
+from carrera import CarreraEstadistica
+from resultado_corrida import ResultadoCorrida, ALMACENAMIENTO_POBLACION
 
 # =========================================
 # 1. Configuración de Benchmarks
@@ -26,6 +51,39 @@ MAPA_FUNCIONES: Dict[str, Tuple[Callable[[List[float]], float], Tuple[float, flo
     "ackley":     (ackley,     (-30.0,   30.0)),
     "griewank":   (griewank,   (-600.0,  600.0)),
     "rosenbrock": (rosenbrock, (-2.048,  2.048)),
+    "schwefel":   (schwefel,   (-500.0,  500.0)),
+    "levy":       (levy,       (-10.0,   10.0)),
+    "zakharov":   (zakharov,   (-5.0,    10.0)),
+
+    # Variantes desplazadas (óptimo fuera del centro del dominio)
+    "sphere_desplazada":     (FuncionTransformada(sphere, (-5.12, 5.12), rotar=False, semilla=101),
+                              (-5.12, 5.12)),
+    "rastrigin_desplazada":  (FuncionTransformada(rastrigin, (-5.12, 5.12), rotar=False, semilla=102),
+                              (-5.12, 5.12)),
+    "ackley_desplazada":     (FuncionTransformada(ackley, (-30.0, 30.0), rotar=False, semilla=103),
+                              (-30.0, 30.0)),
+
+    # Variantes desplazadas y rotadas (no separables)
+    "zakharov_rotada":       (FuncionTransformada(zakharov, (-5.0, 10.0), semilla=201),
+                              (-5.0, 10.0)),
+    "rastrigin_rotada":      (FuncionTransformada(rastrigin, (-5.12, 5.12), semilla=202),
+                              (-5.12, 5.12)),
+    "ackley_rotada":         (FuncionTransformada(ackley, (-30.0, 30.0), semilla=203),
+                              (-30.0, 30.0)),
+    "griewank_rotada":       (FuncionTransformada(griewank, (-600.0, 600.0), semilla=204),
+                              (-600.0, 600.0)),
+    "rosenbrock_rotada":     (FuncionTransformada(rosenbrock, (-2.048, 2.048), centro=1.0, semilla=205),
+                              (-2.048, 2.048)),
+    "levy_rotada":           (FuncionTransformada(levy, (-10.0, 10.0), centro=1.0, semilla=206),
+                              (-10.0, 10.0)),
+}
+
+# Mapeo de operadores de cruza a su versión por pareja y su versión por lotes (M, D)
+MAPA_CRUZAS: Dict[str, Tuple[Callable, Callable]] = {
+    "un_punto": (cruza_un_punto, cruza_un_punto_lote),
+    "uniforme": (cruza_uniforme, cruza_uniforme_lote),
+    "blx":      (cruza_blx,      cruza_blx_lote),
+    "sbx":      (cruza_sbx,      cruza_sbx_lote),
 }
 
 # =========================================
@@ -69,6 +127,8 @@ def crear_hijos_reales(
     alpha_blx: float = 0.5,
     eta_c_sbx: float = 10.0,
     amplitud_mut: float = 0.1,
+    mutacion: str = "densa",
+    perfil: Optional[PerfiladorFases] = None,
 ) -> Tuple[List[float], List[float]]:
     """
     Gestiona la reproducción: selecciona el operador de cruza y aplica mutación.
@@ -77,8 +137,12 @@ def crear_hijos_reales(
         tipo_cruza: Identificador del operador ('un_punto', 'uniforme', 'blx', 'sbx').
         pm_gen: Probabilidad de mutación por gen.
         amplitud_mut: Intensidad de la mutación real.
+        mutacion: 'densa' (un sorteo por gen) o 'dispersa' (salto geométrico a los genes mutados).
+        perfil: Si se proporciona, acumula el tiempo de las fases 'cruza' y 'mutacion'.
     """
     tipo = tipo_cruza.lower()
+    if perfil is not None:
+        t = perfil.reloj()
 
     # Selección del operador de recombinación
     if tipo == "un_punto":
@@ -94,11 +158,26 @@ def crear_hijos_reales(
     else:
         raise ValueError(f"Operador de cruza no reconocido: {tipo_cruza}")
 
+    if perfil is not None:
+        t = perfil.marcar("cruza", t)
+
     # Aplicación de mutación gaussiana a nivel de gen
-    c1 = mutacion_real(c1, prob_mutacion_gen=pm_gen, a=a, b=b,
-                       amplitud=amplitud_mut, rng=rng)
-    c2 = mutacion_real(c2, prob_mutacion_gen=pm_gen, a=a, b=b,
-                       amplitud=amplitud_mut, rng=rng)
+    if mutacion == "dispersa":
+        # Los hijos ya son copias nuevas, por lo que se pueden mutar en sitio
+        c1 = mutacion_real_dispersa(c1, prob_mutacion_gen=pm_gen, a=a, b=b,
+                                    amplitud=amplitud_mut, rng=rng)
+        c2 = mutacion_real_dispersa(c2, prob_mutacion_gen=pm_gen, a=a, b=b,
+                                    amplitud=amplitud_mut, rng=rng)
+    elif mutacion == "densa":
+        c1 = mutacion_real(c1, prob_mutacion_gen=pm_gen, a=a, b=b,
+                           amplitud=amplitud_mut, rng=rng)
+        c2 = mutacion_real(c2, prob_mutacion_gen=pm_gen, a=a, b=b,
+                           amplitud=amplitud_mut, rng=rng)
+    else:
+        raise ValueError(f"Modo de mutación no reconocido: {mutacion}")
+
+    if perfil is not None:
+        perfil.marcar("mutacion", t)
 
     return c1, c2
 
@@ -106,6 +185,13 @@ def crear_hijos_reales(
 # 3. Motor del Algoritmo Genético
 # =========================================
 
+def _empaquetar(resultado: dict, compacto: bool, almacenar_poblacion: str) -> Union[dict, ResultadoCorrida]:
+    """Retorna el diccionario de resultados tal cual o, con compacto=True, como ResultadoCorrida."""
+    if not compacto:
+        return resultado
+    return ResultadoCorrida.desde_dict(resultado, almacenar_poblacion)
+
+
 def ejecutar_ga_real(
     nombre_func: str,
     dim: int = 10,
@@ -119,43 +205,329 @@ def ejecutar_ga_real(
     alpha_blx: float = 0.5,
     eta_c_sbx: float = 10.0,
     amplitud_mut: float = 0.1,
-) -> dict:
+    motor: str = "listas",
+    mutacion: str = "densa",
+    diversidad_incremental: bool = False,
+    metrica_diversidad: str = "desviacion",
+    seleccion: str = "ruleta",
+    reemplazo: str = "ordenado",
+    cache_evaluacion: bool = False,
+    tam_cache: int = 4096,
+    num_islas: int = 4,
+    intervalo_migracion: int = 20,
+    num_migrantes: int = 2,
+    topologia: str = "anillo",
+    politica_migracion: str = "mejor_reemplaza_peor",
+    trabajadores_eval: int = 2,
+    evaluaciones_por_registro: int = None,
+    max_evaluaciones: int = None,
+    tiempo_max: float = None,
+    costo_objetivo: float = None,
+    ventana_estancamiento: int = None,
+    tol_estancamiento: float = 0.0,
+    diversidad_minima: float = None,
+    perfilar: bool = False,
+    registro: str = "todas",
+    registro_cada: int = 10,
+    registro_puntos: int = 100,
+    modo_rng: str = "compatible",
+    precision: str = "float64",
+    compacto: bool = False,
+    almacenar_poblacion: str = "float64",
+) -> Union[dict, ResultadoCorrida]:
     """
     Ejecuta una instancia completa del AG. 
     Retorna métricas de desempeño y series de tiempo de la evolución.
+
+    Args:
+        motor: 'listas' (implementación original, individuo por individuo),
+               'matricial' (población en arreglos NumPy (N, D), ver motor_matricial.py) o
+               'islas' (tam_pob repartido en `num_islas` subpoblaciones, una por proceso,
+               con migración por memoria compartida; ver modelo_islas.py) o 'apilado'
+               (una repetición del motor por lotes de `ejecutar_ga_repeticiones`; misma
+               trayectoria que 'matricial').
+        mutacion: 'densa' (un sorteo por gen, original) o 'dispersa' (solo se sortean
+                  las posiciones de los genes mutados; costo proporcional a ellos).
+        diversidad_incremental: Si es True, la diversidad se mantiene con un
+                  RastreadorDiversidad actualizado en el reemplazo en lugar de
+                  recalcularse sobre toda la población cada generación. Solo ahorra
+                  trabajo si se reemplaza menos de la mitad de la población (elitismo
+                  > tam_pob / 2); si no, se recalcula al consultarse.
+        metrica_diversidad: Métrica registrada en 'curva_diversidad': 'desviacion'
+                  (std promedio por dimensión), 'distancia' (distancia promedio entre
+                  pares) o 'distancia_muestreada' (estimación por muestreo de pares).
+        seleccion: 'ruleta' o 'sus' (Stochastic Universal Sampling, solo motor matricial).
+        reemplazo: Motor de listas: 'ordenado' (reemplazo_peores original) o 'parcial'
+                  (reemplazo_peores_parcial: mismos sobrevivientes sin ordenar ni copiar,
+                  y elitismo > 1 efectivo). El motor matricial siempre usa selección parcial.
+        cache_evaluacion: Si es True, los hijos idénticos a un padre heredan su costo y el
+                  resto pasa por una caché LRU de `tam_cache` genomas (ver cache_evaluacion.py).
+                  Los contadores se agregan al resultado.
+        num_islas, intervalo_migracion, num_migrantes, topologia, politica_migracion:
+                  Parámetros del motor 'islas'. Cada `intervalo_migracion` generaciones
+                  cada isla envía `num_migrantes` individuos a sus vecinas ('anillo' o
+                  'completa'); 'mejor_reemplaza_peor' envía los mejores y
+                  'aleatorio_reemplaza_peor' una muestra aleatoria. Los que llegan
+                  sustituyen a los peores de la isla receptora.
+        trabajadores_eval, evaluaciones_por_registro: Parámetros del motor 'asincrono'.
+                  Las curvas se registran cada `evaluaciones_por_registro` evaluaciones
+                  completadas (por defecto `tam_pob`, a lo más el presupuesto) y al final.
+        max_evaluaciones, tiempo_max, costo_objetivo, ventana_estancamiento,
+        tol_estancamiento, diversidad_minima: Criterios de paro adicionales a
+                  `generaciones` (ver criterios_paro.py). El resultado incluye
+                  'criterio_paro', 'generaciones_ejecutadas' y 'evaluaciones' (conteo
+                  exacto de evaluaciones de la función objetivo).
+        perfilar: Si es True (motores 'listas' y 'matricial'), acumula tiempo y número de
+                  llamadas por fase (ver perfilado.py) y agrega el desglose en 'perfil'.
+        registro, registro_cada, registro_puntos: Programa de registro de curvas (motores
+                  'listas' y 'matricial'): 'todas', 'cada_k' (cada `registro_cada`
+                  generaciones), 'logaritmico' (~`registro_puntos` generaciones) o 'mejora'.
+                  El promedio y la diversidad solo se calculan en las generaciones
+                  registradas, listadas en 'generaciones_registradas'.
+        modo_rng: 'compatible' (generadores originales; trayectorias idénticas a las
+                  publicadas) o 'secuencia' (flujos PCG64 independientes derivados de
+                  SeedSequence(semilla); ver generadores.py).
+        precision: 'float64' o 'float32' (motores 'matricial' y 'apilado'): tipo de la
+                  población, los sorteos de los operadores y los costos. La selección y
+                  las métricas registradas se calculan en float64 (ver motor_matricial.py).
+        compacto: Si es True retorna un ResultadoCorrida (slots y curvas en arreglos
+                  NumPy; ver resultado_corrida.py) en lugar del diccionario.
+        almacenar_poblacion: Con compacto=True, 'float64' (población final completa),
+                  'float32' o 'no' (sin población ni costos finales).
     """
     if nombre_func not in MAPA_FUNCIONES:
         raise ValueError(f"Benchmark desconocido: {nombre_func}")
 
-    # Inicialización de generador determinístico
-    rng = random.Random(semilla)
+    if modo_rng not in MODOS_RNG:
+        raise ValueError(f"Modo de generador no reconocido: {modo_rng}")
+
+    if metrica_diversidad not in METRICAS_DIVERSIDAD:
+        raise ValueError(f"Métrica de diversidad no reconocida: {metrica_diversidad}")
+
+    if almacenar_poblacion not in ALMACENAMIENTO_POBLACION:
+        raise ValueError(f"Almacenamiento de población no reconocido: {almacenar_poblacion}")
+
+    if diversidad_incremental and metrica_diversidad != "desviacion":
+        raise ValueError("La diversidad incremental solo está disponible para la métrica 'desviacion'.")
 
     f, (a, b) = MAPA_FUNCIONES[nombre_func]
 
+    paro = CriteriosParo(
+        max_evaluaciones=max_evaluaciones,
+        tiempo_max=tiempo_max,
+        costo_objetivo=costo_objetivo,
+        ventana_estancamiento=ventana_estancamiento,
+        tol_estancamiento=tol_estancamiento,
+        diversidad_minima=diversidad_minima,
+    )
+
+    if perfilar and motor not in ("listas", "matricial"):
+        raise ValueError(f"El perfilado por fases no está disponible para el motor '{motor}'.")
+
+    if registro != "todas" and motor not in ("listas", "matricial", "apilado"):
+        raise ValueError(f"El registro diezmado no está disponible para el motor '{motor}'.")
+
+    if precision != "float64" and motor not in ("matricial", "apilado"):
+        raise ValueError(f"La precisión '{precision}' no está disponible para el motor '{motor}'.")
+
+    if motor == "matricial":
+        return _empaquetar(ejecutar_ga_matricial(
+            nombre_func=nombre_func,
+            f=f,
+            limites=(a, b),
+            dim=dim,
+            tam_pob=tam_pob,
+            generaciones=generaciones,
+            pc=pc,
+            tipo_cruza=tipo_cruza,
+            porcentaje_reemplazo=porcentaje_reemplazo,
+            elitismo=elitismo,
+            semilla=semilla,
+            alpha_blx=alpha_blx,
+            eta_c_sbx=eta_c_sbx,
+            amplitud_mut=amplitud_mut,
+            mutacion=mutacion,
+            diversidad_incremental=diversidad_incremental,
+            metrica_diversidad=metrica_diversidad,
+            seleccion=seleccion,
+            cache_evaluacion=cache_evaluacion,
+            tam_cache=tam_cache,
+            paro=paro,
+            perfilar=perfilar,
+            registro=registro,
+            registro_cada=registro_cada,
+            registro_puntos=registro_puntos,
+            modo_rng=modo_rng,
+            precision=precision,
+        ), compacto, almacenar_poblacion)
+    elif motor == "apilado":
+        return ejecutar_ga_repeticiones(
+            nombre_func=nombre_func,
+            semillas=[semilla],
+            dim=dim,
+            tam_pob=tam_pob,
+            generaciones=generaciones,
+            pc=pc,
+            tipo_cruza=tipo_cruza,
+            porcentaje_reemplazo=porcentaje_reemplazo,
+            elitismo=elitismo,
+            alpha_blx=alpha_blx,
+            eta_c_sbx=eta_c_sbx,
+            amplitud_mut=amplitud_mut,
+            mutacion=mutacion,
+            diversidad_incremental=diversidad_incremental,
+            metrica_diversidad=metrica_diversidad,
+            seleccion=seleccion,
+            cache_evaluacion=cache_evaluacion,
+            max_evaluaciones=max_evaluaciones,
+            tiempo_max=tiempo_max,
+            costo_objetivo=costo_objetivo,
+            ventana_estancamiento=ventana_estancamiento,
+            tol_estancamiento=tol_estancamiento,
+            diversidad_minima=diversidad_minima,
+            registro=registro,
+            registro_cada=registro_cada,
+            registro_puntos=registro_puntos,
+            modo_rng=modo_rng,
+            precision=precision,
+            compacto=compacto,
+            almacenar_poblacion=almacenar_poblacion,
+        )[0]
+    elif motor == "islas":
+        if diversidad_incremental or metrica_diversidad != "desviacion":
+            raise ValueError("El motor de islas solo registra la diversidad 'desviacion' completa.")
+        if paro.activos():
+            raise ValueError("El motor de islas solo admite el criterio de paro por generaciones.")
+        return _empaquetar(ejecutar_ga_islas(
+            nombre_func=nombre_func,
+            f=f,
+            limites=(a, b),
+            dim=dim,
+            tam_pob=tam_pob,
+            generaciones=generaciones,
+            pc=pc,
+            tipo_cruza=tipo_cruza,
+            porcentaje_reemplazo=porcentaje_reemplazo,
+            elitismo=elitismo,
+            semilla=semilla,
+            alpha_blx=alpha_blx,
+            eta_c_sbx=eta_c_sbx,
+            amplitud_mut=amplitud_mut,
+            mutacion=mutacion,
+            seleccion=seleccion,
+            cache_evaluacion=cache_evaluacion,
+            tam_cache=tam_cache,
+            num_islas=num_islas,
+            intervalo_migracion=intervalo_migracion,
+            num_migrantes=num_migrantes,
+            topologia=topologia,
+            politica_migracion=politica_migracion,
+            modo_rng=modo_rng,
+        ), compacto, almacenar_poblacion)
+    elif motor == "asincrono":
+        if diversidad_incremental or cache_evaluacion:
+            raise ValueError("El motor asíncrono no admite diversidad incremental ni caché de evaluación.")
+        if seleccion != "ruleta":
+            raise ValueError(f"El motor asíncrono solo admite selección 'ruleta', no '{seleccion}'")
+        crear_hijos = partial(
+            crear_hijos_reales,
+            pc=pc,
+            pm_gen=1.0 / dim,
+            a=a, b=b,
+            tipo_cruza=tipo_cruza,
+            alpha_blx=alpha_blx,
+            eta_c_sbx=eta_c_sbx,
+            amplitud_mut=amplitud_mut,
+            mutacion=mutacion,
+        )
+        return _empaquetar(ejecutar_ga_asincrono(
+            nombre_func=nombre_func,
+            f=f,
+            limites=(a, b),
+            crear_hijos=crear_hijos,
+            dim=dim,
+            tam_pob=tam_pob,
+            generaciones=generaciones,
+            pc=pc,
+            tipo_cruza=tipo_cruza,
+            porcentaje_reemplazo=porcentaje_reemplazo,
+            elitismo=elitismo,
+            semilla=semilla,
+            alpha_blx=alpha_blx,
+            eta_c_sbx=eta_c_sbx,
+            amplitud_mut=amplitud_mut,
+            metrica_diversidad=metrica_diversidad,
+            trabajadores=trabajadores_eval,
+            evaluaciones_por_registro=evaluaciones_por_registro,
+            paro=paro,
+            modo_rng=modo_rng,
+        ), compacto, almacenar_poblacion)
+    elif motor != "listas":
+        raise ValueError(f"Motor de ejecución no reconocido: {motor}")
+
+    if seleccion != "ruleta":
+        raise ValueError(f"El motor de listas solo admite selección 'ruleta', no '{seleccion}'")
+
+    if reemplazo == "ordenado":
+        funcion_reemplazo = reemplazo_peores
+    elif reemplazo == "parcial":
+        funcion_reemplazo = reemplazo_peores_parcial
+    else:
+        raise ValueError(f"Estrategia de reemplazo no reconocida: {reemplazo}")
+
+    # Inicialización de generadores determinísticos. El de diversidad es aparte
+    # para que la métrica muestreada no altere la trayectoria del AG
+    rng, rng_diversidad = generadores_corrida(semilla, modo_rng)
+
     # Heurística: Probabilidad de mutación inversamente proporcional a la dimensión
     pm_gen = 1.0 / dim
 
+    evaluador = EvaluadorCache(f, tam_max=tam_cache) if cache_evaluacion else None
+    perfil = PerfiladorFases() if perfilar else None
+
     # Inicialización y evaluación base
     poblacion = inicializar_poblacion_reales(tam_pob, dim, a, b, rng)
-    costos = evaluar_poblacion(poblacion, f)
+    if evaluador is None:
+        costos = evaluar_poblacion(poblacion, f)
+    else:
+        costos = evaluador.evaluar_poblacion(poblacion)
+    evaluaciones = len(poblacion)
+
+    rastreador = RastreadorDiversidad(poblacion) if diversidad_incremental else None
+
+    # Traza histórica en arreglos preasignados (solo generaciones programadas)
+    traza = RegistroMetricas(generaciones, registro, registro_cada, registro_puntos)
 
-    # Estructuras para traza histórica
-    curva_mejor: List[float] = []
-    curva_promedio: List[float] = []
-    curva_diversidad: List[float] = []
+    def diversidad_actual() -> float:
+        if rastreador is None:
+            return medir_diversidad(poblacion, metrica_diversidad, rng_diversidad)
+        return rastreador.diversidad()
 
+    criterio_paro = CRITERIO_GENERACIONES
+    generaciones_ejecutadas = 0
+    paro.iniciar()
     t0 = time.perf_counter()
 
     for g in range(generaciones):
-        # Selección de padres (Aptitud transformada para maximización)
-        aptitudes = transformar_aptitud(costos)
-        padres = seleccion_ruleta(poblacion, aptitudes, tam_pob, rng)
+        if perfil is not None:
+            t = perfil.reloj()
 
-        # Ciclo de reproducción
+        # Selección de padres por índice (Aptitud transformada para maximización)
+        aptitudes = transformar_aptitud_vector(costos)
+        if perfil is not None:
+            t = perfil.marcar("transformacion", t)
+        padres = seleccion_ruleta_indices(aptitudes, tam_pob, rng)
+        if perfil is not None:
+            perfil.marcar("seleccion", t)
+
+        # Ciclo de reproducción (los operadores de cruza no modifican a los padres)
         hijos: List[List[float]] = []
+        candidatos: List[Tuple[int, int]] = []
         for i in range(0, tam_pob, 2):
-            p1 = padres[i]
-            p2 = padres[(i + 1) % tam_pob] # Wrap-around para población impar
+            ia = padres[i]
+            ib = padres[(i + 1) % tam_pob] # Wrap-around para población impar
+            p1 = poblacion[ia]
+            p2 = poblacion[ib]
 
             h1, h2 = crear_hijos_reales(
                 p1, p2,
@@ -167,34 +539,69 @@ def ejecutar_ga_real(
                 alpha_blx=alpha_blx,
                 eta_c_sbx=eta_c_sbx,
                 amplitud_mut=amplitud_mut,
+                mutacion=mutacion,
+                perfil=perfil,
             )
             hijos.append(h1)
             hijos.append(h2)
+            candidatos.append((ia, ib))
+            candidatos.append((ia, ib))
 
         # Recorte de excedentes
         hijos = hijos[:tam_pob]
 
+        if perfil is not None:
+            t = perfil.reloj()
+
         # Evaluación de descendencia
-        costos_hijos = evaluar_poblacion(hijos, f)
+        if evaluador is None:
+            costos_hijos = evaluar_poblacion(hijos, f)
+            evaluaciones += len(hijos)
+        else:
+            costos_hijos = evaluador.evaluar_descendencia(hijos, poblacion, costos, candidatos)
+        if perfil is not None:
+            t = perfil.marcar("evaluacion", t)
 
         # Estrategia de reemplazo (Elitismo + Sustitución de peores)
-        poblacion, costos = reemplazo_peores(
+        poblacion, costos = funcion_reemplazo(
             poblacion=poblacion,
             hijos=hijos,
             apt_pob=costos,
             apt_hijos=costos_hijos,
             porcentaje=porcentaje_reemplazo,
-            elitismo=elitismo
+            elitismo=elitismo,
+            rastreador=rastreador
         )
+        if perfil is not None:
+            t = perfil.marcar("reemplazo", t)
 
-        # Registro de métricas generacionales
+        # Registro de métricas generacionales (promedio y diversidad solo si se registran)
+        generaciones_ejecutadas = g + 1
         mejor = min(costos)
-        promedio = sum(costos) / len(costos)
-        diversidad = calcular_diversidad(poblacion)
+        if rastreador is not None and (g + 1) % PERIODO_REINICIO_DIVERSIDAD == 0:
+            rastreador.programar_reinicio(poblacion)
+
+        diversidad = None
+        if traza.debe_registrar(g, mejor):
+            diversidad = diversidad_actual()
+            traza.registrar(g, mejor, sum(costos) / len(costos), diversidad)
+        if perfil is not None:
+            perfil.marcar("metricas", t)
 
-        curva_mejor.append(mejor)
-        curva_promedio.append(promedio)
-        curva_diversidad.append(diversidad)
+        if paro.activos():
+            if evaluador is not None:
+                evaluaciones = evaluador.evaluaciones
+            if diversidad is None and paro.requiere_diversidad():
+                diversidad = diversidad_actual()
+            motivo = paro.revisar(evaluaciones, mejor, diversidad)
+            if motivo is not None:
+                criterio_paro = motivo
+                # La generación de paro se registra siempre
+                if traza.ultima() != g:
+                    if diversidad is None:
+                        diversidad = diversidad_actual()
+                    traza.registrar(g, mejor, sum(costos) / len(costos), diversidad)
+                break
 
     t1 = time.perf_counter()
     tiempo_total = t1 - t0
@@ -204,7 +611,7 @@ def ejecutar_ga_real(
     peor_final = max(costos)
     promedio_final = sum(costos) / len(costos)
 
-    return {
+    resultado = {
         "nombre_func": nombre_func,
         "dim": dim,
         "tam_pob": tam_pob,
@@ -220,18 +627,311 @@ def ejecutar_ga_real(
         "mejor_final": mejor_final,
         "peor_final": peor_final,
         "promedio_final": promedio_final,
-        "curva_mejor": curva_mejor,
-        "curva_promedio": curva_promedio,
-        "curva_diversidad": curva_diversidad,
+        **traza.curvas(),
         "poblacion_final": poblacion,
         "costos_finales": costos,
         "tiempo_total": tiempo_total,
+        "criterio_paro": criterio_paro,
+        "generaciones_ejecutadas": generaciones_ejecutadas,
+        "evaluaciones": evaluaciones,
     }
+    if evaluador is not None:
+        resultado.update(evaluador.contadores())
+    if perfil is not None:
+        resultado["perfil"] = perfil.resumen()
+    return _empaquetar(resultado, compacto, almacenar_poblacion)
+
+
+def ejecutar_ga_repeticiones(
+    nombre_func: str,
+    semillas: List[int],
+    dim: int = 10,
+    tam_pob: int = 50,
+    generaciones: int = 1000,
+    pc: float = 0.9,
+    tipo_cruza: str = "un_punto",
+    porcentaje_reemplazo: float = 1.0,
+    elitismo: int = 1,
+    alpha_blx: float = 0.5,
+    eta_c_sbx: float = 10.0,
+    amplitud_mut: float = 0.1,
+    mutacion: str = "densa",
+    diversidad_incremental: bool = False,
+    metrica_diversidad: str = "desviacion",
+    seleccion: str = "ruleta",
+    cache_evaluacion: bool = False,
+    max_evaluaciones: int = None,
+    tiempo_max: float = None,
+    costo_objetivo: float = None,
+    ventana_estancamiento: int = None,
+    tol_estancamiento: float = 0.0,
+    diversidad_minima: float = None,
+    perfilar: bool = False,
+    registro: str = "todas",
+    registro_cada: int = 10,
+    registro_puntos: int = 100,
+    modo_rng: str = "compatible",
+    precision: str = "float64",
+    compacto: bool = False,
+    almacenar_poblacion: str = "float64",
+) -> List[Union[dict, ResultadoCorrida]]:
+    """
+    Ejecuta una repetición por semilla de la misma configuración, todas juntas en un
+    tensor (R, N, D) (ver motor_apilado.py). Cada repetición usa sus propios
+    generadores y retorna el mismo diccionario que `ejecutar_ga_real` con
+    motor='matricial' y esa semilla (salvo 'tiempo_total', que es su parte del
+    tiempo del lote), o su ResultadoCorrida con compacto=True. Los parámetros son
+    los de `ejecutar_ga_real`; no admite diversidad incremental, caché de
+    evaluación ni perfilado.
+    """
+    if nombre_func not in MAPA_FUNCIONES:
+        raise ValueError(f"Benchmark desconocido: {nombre_func}")
+
+    if modo_rng not in MODOS_RNG:
+        raise ValueError(f"Modo de generador no reconocido: {modo_rng}")
+
+    if metrica_diversidad not in METRICAS_DIVERSIDAD:
+        raise ValueError(f"Métrica de diversidad no reconocida: {metrica_diversidad}")
+
+    if almacenar_poblacion not in ALMACENAMIENTO_POBLACION:
+        raise ValueError(f"Almacenamiento de población no reconocido: {almacenar_poblacion}")
+
+    if diversidad_incremental or cache_evaluacion or perfilar:
+        raise ValueError("El motor apilado no admite diversidad incremental, caché de evaluación ni perfilado.")
+
+    f, (a, b) = MAPA_FUNCIONES[nombre_func]
+
+    paro = CriteriosParo(
+        max_evaluaciones=max_evaluaciones,
+        tiempo_max=tiempo_max,
+        costo_objetivo=costo_objetivo,
+        ventana_estancamiento=ventana_estancamiento,
+        tol_estancamiento=tol_estancamiento,
+        diversidad_minima=diversidad_minima,
+    )
+
+    resultados = ejecutar_ga_apilado(
+        nombre_func=nombre_func,
+        f=f,
+        limites=(a, b),
+        semillas=semillas,
+        dim=dim,
+        tam_pob=tam_pob,
+        generaciones=generaciones,
+        pc=pc,
+        tipo_cruza=tipo_cruza,
+        porcentaje_reemplazo=porcentaje_reemplazo,
+        elitismo=elitismo,
+        alpha_blx=alpha_blx,
+        eta_c_sbx=eta_c_sbx,
+        amplitud_mut=amplitud_mut,
+        mutacion=mutacion,
+        metrica_diversidad=metrica_diversidad,
+        seleccion=seleccion,
+        paro=paro,
+        registro=registro,
+        registro_cada=registro_cada,
+        registro_puntos=registro_puntos,
+        modo_rng=modo_rng,
+        precision=precision,
+    )
+    return [_empaquetar(resultado, compacto, almacenar_poblacion) for resultado in resultados]
 
 # =========================================
 # 4. Ejecución de Experimentos
 # =========================================
 
+ENCABEZADO_RESUMEN = [
+    "funcion",
+    "tipo_cruza",
+    "dim",
+    "tam_pob",
+    "generaciones",
+    "repeticion",
+    "semilla",
+    "mejor_final",
+    "peor_final",
+    "promedio_final",
+    "tiempo_total_seg",
+    "diversidad",
+    "criterio_paro",
+    "evaluaciones",
+]
+
+ENCABEZADO_CURVAS = [
+    "funcion",
+    "tipo_cruza",
+    "dim",
+    "tam_pob",
+    "generaciones",
+    "repeticion",
+    "semilla",
+    "generacion",
+    "mejor_generacion",
+    "promedio_generacion",
+    "diversidad"
+]
+
+
+def generar_tareas(
+    funciones: List[str],
+    cruzas: List[str],
+    repeticiones: int,
+    modo_semillas: str = "independientes",
+    base_semilla: int | None = None,
+) -> List[Tuple[str, str, int, int]]:
+    """
+    Enumera las corridas del experimento en el orden de escritura de los CSV.
+    Cada tarea es (nombre_func, tipo_cruza, repeticion, semilla).
+
+    Modos: 'independientes' (1000 * índice global + 123), 'bloques' (base_semilla + rep,
+    compartida por todas las configuraciones de una repetición) o 'derivadas' (una
+    semilla por corrida derivada de SeedSequence(base_semilla).spawn).
+    """
+    tareas: List[Tuple[str, str, int, int]] = []
+
+    # === Semillas independientes ===
+    if modo_semillas == "independientes":
+        rep_global = 0
+        for nombre_func in funciones:
+            for tipo_cruza in cruzas:
+                for rep in range(repeticiones):
+                    # Semilla única derivada del índice global para evitar colisiones
+                    semilla = 1000 * rep_global + 123
+                    rep_global += 1
+                    tareas.append((nombre_func, tipo_cruza, rep, semilla))
+
+    # === Semillas por bloques (secuencial) ===
+    elif modo_semillas == "bloques":
+        if base_semilla is None:
+            base_semilla = 42
+
+        for rep in range(repeticiones):
+            semilla = base_semilla + rep
+            for nombre_func in funciones:
+                for tipo_cruza in cruzas:
+                    tareas.append((nombre_func, tipo_cruza, rep, semilla))
+
+    # === Semillas derivadas (SeedSequence.spawn) ===
+    elif modo_semillas == "derivadas":
+        if base_semilla is None:
+            base_semilla = 42
+
+        semillas = iter(semillas_derivadas(base_semilla, len(funciones) * len(cruzas) * repeticiones))
+        for nombre_func in funciones:
+            for tipo_cruza in cruzas:
+                for rep in range(repeticiones):
+                    tareas.append((nombre_func, tipo_cruza, rep, next(semillas)))
+    else:
+        raise ValueError(f"Modo de semillas no válido: {modo_semillas}")
+
+    return tareas
+
+
+def _ejecutar_tarea(args: Tuple[Tuple[str, str, int, int], dict]) -> Union[dict, ResultadoCorrida]:
+    """Ejecuta una tarea de `generar_tareas`. Función de nivel módulo para poder enviarse a procesos."""
+    (nombre_func, tipo_cruza, _rep, semilla), parametros = args
+    return ejecutar_ga_real(
+        nombre_func=nombre_func,
+        tipo_cruza=tipo_cruza,
+        semilla=semilla,
+        **parametros,
+    )
+
+
+def _ejecutar_lote(args: Tuple[List[Tuple[str, str, int, int]], dict]) -> List[Union[dict, ResultadoCorrida]]:
+    """
+    Ejecuta un lote de tareas de `generar_tareas`. Con motor='apilado' el lote son las
+    repeticiones pendientes de una configuración y corren juntas; con otro motor, una tarea.
+    """
+    tareas, parametros = args
+    if parametros["motor"] != "apilado":
+        return [_ejecutar_tarea((tarea, parametros)) for tarea in tareas]
+
+    # Parámetros exclusivos de otros motores
+    parametros = {
+        clave: valor for clave, valor in parametros.items()
+        if clave not in ("motor", "reemplazo", "num_islas", "trabajadores_eval")
+    }
+    nombre_func, tipo_cruza = tareas[0][:2]
+    return ejecutar_ga_repeticiones(
+        nombre_func=nombre_func,
+        tipo_cruza=tipo_cruza,
+        semillas=[semilla for *_, semilla in tareas],
+        **parametros,
+    )
+
+
+def _formar_lotes(
+    tareas: List[Tuple[str, str, int, int]],
+    motor: str,
+) -> List[List[Tuple[str, str, int, int]]]:
+    """
+    Lotes de `_ejecutar_lote`. Con motor='apilado' las tareas de cada configuración
+    forman un lote (el resumen queda agrupado por configuración); con otro motor, una tarea.
+    """
+    if motor != "apilado":
+        return [[tarea] for tarea in tareas]
+
+    grupos: Dict[Tuple[str, str], List[Tuple[str, str, int, int]]] = {}
+    for tarea in tareas:
+        grupos.setdefault(tarea[:2], []).append(tarea)
+    return list(grupos.values())
+
+
+def escribir_resumen(writer_res, resultado: dict, rep: int) -> None:
+    """Escribe la fila de resumen de una corrida (con el desglose por fase si se perfiló)."""
+    fila = [
+        resultado["nombre_func"],
+        resultado["tipo_cruza"],
+        resultado["dim"],
+        resultado["tam_pob"],
+        resultado["generaciones"],
+        rep,
+        resultado["semilla"],
+        resultado["mejor_final"],
+        resultado["peor_final"],
+        resultado["promedio_final"],
+        resultado["tiempo_total"],
+        float(resultado["curva_diversidad"][-1]),
+        resultado["criterio_paro"],
+        resultado["evaluaciones"],
+    ]
+    if "perfil" in resultado:
+        fila.extend(valores_perfil(resultado["perfil"]))
+    writer_res.writerow(fila)
+
+
+def _valores(secuencia) -> list:
+    """Lista de valores de Python de un arreglo NumPy o de cualquier secuencia."""
+    return secuencia.tolist() if hasattr(secuencia, "tolist") else list(secuencia)
+
+
+def escribir_curvas(writer_curv, resultado: dict, rep: int) -> None:
+    """Escribe una fila por generación registrada con las curvas de una corrida."""
+    # Las curvas llegan como arreglos NumPy (o listas en el motor asíncrono); se
+    # convierten a valores de Python aquí, una sola vez, para el CSV
+    curva_mejor = _valores(resultado["curva_mejor"])
+    curva_prom = _valores(resultado["curva_promedio"])
+    curva_div = _valores(resultado["curva_diversidad"])
+    generaciones = _valores(resultado.get("generaciones_registradas", range(len(curva_mejor))))
+
+    for gen, mejor_g, prom_g, div_g in zip(generaciones, curva_mejor, curva_prom, curva_div):
+        writer_curv.writerow([
+            resultado["nombre_func"],
+            resultado["tipo_cruza"],
+            resultado["dim"],
+            resultado["tam_pob"],
+            resultado["generaciones"],
+            rep,
+            resultado["semilla"],
+            gen,
+            mejor_g,
+            prom_g,
+            div_g,
+        ])
+
+
 def correr_experimentos(
     nombre_archivo: str = "resultados_ga.csv",
     funciones: List[str] = None,
@@ -242,10 +942,70 @@ def correr_experimentos(
     repeticiones: int = 20,
     modo_semillas: str = "independientes",
     base_semilla: int | None = None,
+    motor: str = "listas",
+    mutacion: str = "densa",
+    diversidad_incremental: bool = False,
+    metrica_diversidad: str = "desviacion",
+    seleccion: str = "ruleta",
+    reemplazo: str = "ordenado",
+    cache_evaluacion: bool = False,
+    num_islas: int = 4,
+    trabajadores_eval: int = 2,
+    criterios_paro: dict = None,
+    perfilar: bool = False,
+    registro: str = "todas",
+    registro_cada: int = 10,
+    registro_puntos: int = 100,
+    modo_rng: str = "compatible",
+    precision: str = "float64",
+    workers: int = 1,
+    reanudar: bool = False,
+    salida_curvas: str = "csv",
+    carrera: str = None,
+    alfa_carrera: float = 0.05,
+    bloque_carrera: int = 5,
 ):
     """
     Orquesta la ejecución de múltiples corridas experimentales.
     Genera dos archivos CSV: uno con estadísticas finales y otro con la traza generacional completa.
+
+    Args:
+        motor: Motor de cada corrida (ver `ejecutar_ga_real`). Con 'apilado' las
+                 repeticiones pendientes de cada (funcion, tipo_cruza) corren juntas en
+                 un tensor (R, N, D) (ver motor_apilado.py) y sus filas se escriben
+                 agrupadas por configuración.
+        num_islas: Subpoblaciones por corrida con motor='islas' (un proceso cada una).
+        trabajadores_eval: Procesos de evaluación por corrida con motor='asincrono'.
+        criterios_paro: Criterios de paro comunes a todas las corridas, con los nombres
+                 de `ejecutar_ga_real` (p. ej. {'costo_objetivo': 1e-8,
+                 'ventana_estancamiento': 100}). El resumen registra qué criterio
+                 detuvo cada corrida y sus evaluaciones.
+        perfilar: Si es True, el resumen agrega las columnas 'tiempo_<fase>' y
+                  'llamadas_<fase>' (ver perfilado.py).
+        registro, registro_cada, registro_puntos: Programa de registro de las curvas
+                  (ver registro_metricas.py); los archivos de curvas solo contienen
+                  las generaciones registradas.
+        modo_rng: Generadores de cada corrida: 'compatible' o 'secuencia' (ver
+                  generadores.py). Con modo_semillas='derivadas' las semillas de las
+                  corridas también salen de SeedSequence(base_semilla).spawn.
+        precision: 'float64' o 'float32' (motores 'matricial' y 'apilado'; ver
+                  `ejecutar_ga_real`).
+        workers: Número de procesos. Con workers > 1 las corridas se reparten en un
+                 pool de procesos; los resultados se escriben en el mismo orden y con
+                 las mismas semillas que la ejecución secuencial.
+        reanudar: Si es True, lee la bitácora '<nombre>_bitacora.csv', omite las
+                  corridas ya completadas, trunca filas escritas a medias y agrega
+                  solo las faltantes. Los parámetros de las corridas y salida_curvas
+                  deben ser los registrados en la bitácora (ValueError si difieren).
+                  Si es False, los archivos se reescriben.
+        salida_curvas: 'csv' (una fila por generación en '<nombre>_curvas.csv') o 'npz'
+                       (curvas completas como arreglos en '<nombre>_curvas_npz/', ver
+                       salida_columnar.py).
+        carrera: None (todas las corridas) o 'friedman' / 'wilcoxon' (ver carrera.py):
+                 las repeticiones se ejecutan en bloques de `bloque_carrera` y tras cada
+                 bloque se dejan de correr las cruzas significativamente peores (nivel
+                 `alfa_carrera`) que la mejor en cada función. El formato del resumen no
+                 cambia; al final se informa cuántas corridas se ahorraron.
     """
 
     if funciones is None:
@@ -254,180 +1014,175 @@ def correr_experimentos(
     if cruzas is None:
         cruzas = ["un_punto", "uniforme", "blx", "sbx"]
 
+    if workers < 1:
+        raise ValueError("workers debe ser >= 1")
+
+    if salida_curvas not in ("csv", "npz"):
+        raise ValueError(f"Formato de salida de curvas no válido: {salida_curvas}")
+
+    tareas = generar_tareas(funciones, cruzas, repeticiones, modo_semillas, base_semilla)
+
+    # Parámetros comunes a todas las corridas
+    parametros = dict(
+        dim=dim,
+        tam_pob=tam_pob,
+        generaciones=generaciones,
+        pc=0.9,
+        porcentaje_reemplazo=1.0,
+        elitismo=1,
+        alpha_blx=0.5,
+        eta_c_sbx=10.0,
+        amplitud_mut=0.1,
+        motor=motor,
+        mutacion=mutacion,
+        diversidad_incremental=diversidad_incremental,
+        metrica_diversidad=metrica_diversidad,
+        seleccion=seleccion,
+        reemplazo=reemplazo,
+        cache_evaluacion=cache_evaluacion,
+        num_islas=num_islas,
+        trabajadores_eval=trabajadores_eval,
+        perfilar=perfilar,
+        registro=registro,
+        registro_cada=registro_cada,
+        registro_puntos=registro_puntos,
+        modo_rng=modo_rng,
+        precision=precision,
+        # Los procesos devuelven registros compactos: el resumen y las curvas no usan la población final
+        compacto=True,
+        almacenar_poblacion="no",
+    )
+    if criterios_paro:
+        parametros.update(criterios_paro)
+
     # Definición de nombres para archivos de salida
-    nombre_curvas = nombre_archivo.replace(".csv", "_curvas.csv")
+    if salida_curvas == "csv":
+        nombre_curvas = nombre_archivo.replace(".csv", "_curvas.csv")
+    else:
+        nombre_curvas = nombre_archivo.replace(".csv", "_curvas_npz")
+    nombre_bitacora = nombre_archivo.replace(".csv", "_bitacora.csv")
+
+    # Parámetros que definen el contenido de las salidas (quedan en la bitácora)
+    parametros_bateria = {**parametros, "salida_curvas": salida_curvas}
+
+    # Reanudación: se omiten las corridas registradas y se truncan escrituras parciales
+    completadas: set = set()
+    offsets = None
+    if reanudar:
+        completadas, offsets, registrados = leer_bitacora(nombre_bitacora)
+        if offsets is not None:
+            verificar_parametros(nombre_bitacora, registrados, parametros_bateria)
+
+    if offsets is None:
+        modo_apertura = "w"
+    else:
+        truncar_archivo(nombre_archivo, offsets[0])
+        if salida_curvas == "csv":
+            truncar_archivo(nombre_curvas, offsets[1])
+        else:
+            truncar_partes(nombre_curvas, offsets[1])
+        modo_apertura = "a"
+        print(f"[INFO] Reanudando: {len(completadas)} corridas completadas en {nombre_bitacora}")
+
+    pendientes = [tarea for tarea in tareas if tarea not in completadas]
+
+    # Carrera estadística: al reanudar, los costos de las corridas ya escritas
+    # reproducen los descartes de la ejecución interrumpida
+    estado_carrera = None
+    if carrera is not None:
+        estado_carrera = CarreraEstadistica(
+            funciones, cruzas, repeticiones, carrera, alfa_carrera, bloque_carrera
+        )
+        if offsets is not None:
+            estado_carrera.cargar_resumen(nombre_archivo)
 
-    with open(nombre_archivo, mode="w", newline="") as f_res, \
-         open(nombre_curvas, mode="w", newline="") as f_curv:
+    with open(nombre_archivo, mode=modo_apertura, newline="") as f_res, \
+         open(nombre_bitacora, mode=modo_apertura, newline="") as f_bit, \
+         ExitStack() as pila:
 
         writer_res = csv.writer(f_res)
-        writer_curv = csv.writer(f_curv)
-
-        # Encabezados: Archivo de Resumen
-        writer_res.writerow([
-            "funcion",
-            "tipo_cruza",
-            "dim",
-            "tam_pob",
-            "generaciones",
-            "repeticion",
-            "semilla",
-            "mejor_final",
-            "peor_final",
-            "promedio_final",
-            "tiempo_total_seg",
-            "diversidad",
-        ])
+        writer_bit = csv.writer(f_bit)
 
-        # Encabezados: Archivo de Curvas
-        writer_curv.writerow([
-            "funcion",
-            "tipo_cruza",
-            "dim",
-            "tam_pob",
-            "generaciones",
-            "repeticion",
-            "semilla",
-            "generacion",
-            "mejor_generacion",
-            "promedio_generacion",
-            "diversidad"
-        ])
+        if salida_curvas == "csv":
+            f_curv = pila.enter_context(open(nombre_curvas, mode=modo_apertura, newline=""))
+            writer_curv = csv.writer(f_curv)
+        else:
+            escritor_npz = EscritorCurvasNPZ(nombre_curvas, modo=modo_apertura)
 
-        # === Ejecución con semillas independientes ===
-        if modo_semillas == "independientes":
-            rep_global = 0
-            for nombre_func in funciones:
-                for tipo_cruza in cruzas:
-                    for rep in range(repeticiones):
-                        # Semilla única derivada del índice global para evitar colisiones
-                        semilla = 1000 * rep_global + 123
-                        rep_global += 1
-
-                        print(f"[INFO] Función={nombre_func}, cruza={tipo_cruza}, "
-                              f"rep={rep+1}/{repeticiones}, semilla={semilla}")
-
-                        resultado = ejecutar_ga_real(
-                            nombre_func=nombre_func,
-                            dim=dim,
-                            tam_pob=tam_pob,
-                            generaciones=generaciones,
-                            pc=0.9,
-                            tipo_cruza=tipo_cruza,
-                            porcentaje_reemplazo=1.0,
-                            elitismo=1,
-                            semilla=semilla,
-                            alpha_blx=0.5,
-                            eta_c_sbx=10.0,
-                            amplitud_mut=0.1,
-                        )
-
-                        # Escritura de resumen
-                        writer_res.writerow([
-                            resultado["nombre_func"],
-                            resultado["tipo_cruza"],
-                            resultado["dim"],
-                            resultado["tam_pob"],
-                            resultado["generaciones"],
-                            rep,
-                            resultado["semilla"],
-                            resultado["mejor_final"],
-                            resultado["peor_final"],
-                            resultado["promedio_final"],
-                            resultado["tiempo_total"],
-                        ])
-
-                        # Escritura de curvas detalladas
-                        curva_mejor = resultado["curva_mejor"]
-                        curva_prom = resultado["curva_promedio"]
-                        curva_div = resultado["curva_diversidad"]
-
-                        for gen, (mejor_g, prom_g, div_g) in enumerate(
-                            zip(curva_mejor, curva_prom, curva_div)
-                        ):
-                            writer_curv.writerow([
-                                resultado["nombre_func"],
-                                resultado["tipo_cruza"],
-                                resultado["dim"],
-                                resultado["tam_pob"],
-                                resultado["generaciones"],
-                                rep,
-                                resultado["semilla"],
-                                gen,
-                                mejor_g,
-                                prom_g,
-                                div_g,
-                            ])
-
-        # === Ejecución con semillas por bloques (secuencial) ===
-        elif modo_semillas == "bloques":
-            if base_semilla is None:
-                base_semilla = 42
-
-            for rep in range(repeticiones):
-                semilla = base_semilla + rep
-
-                for nombre_func in funciones:
-                    for tipo_cruza in cruzas:
-                        print(f"[INFO] Función={nombre_func}, cruza={tipo_cruza}, "
-                              f"rep={rep+1}/{repeticiones}, semilla={semilla}")
-
-                        resultado = ejecutar_ga_real(
-                            nombre_func=nombre_func,
-                            dim=dim,
-                            tam_pob=tam_pob,
-                            generaciones=generaciones,
-                            pc=0.9,
-                            tipo_cruza=tipo_cruza,
-                            porcentaje_reemplazo=1.0,
-                            elitismo=1,
-                            semilla=semilla,
-                            alpha_blx=0.5,
-                            eta_c_sbx=10.0,
-                            amplitud_mut=0.1,
-                        )
-
-                        # Escritura de resumen
-                        diversidad_final = resultado["curva_diversidad"][-1]
-
-                        writer_res.writerow([
-                            resultado["nombre_func"],
-                            resultado["tipo_cruza"],
-                            resultado["dim"],
-                            resultado["tam_pob"],
-                            resultado["generaciones"],
-                            rep,
-                            resultado["semilla"],
-                            resultado["mejor_final"],
-                            resultado["peor_final"],
-                            resultado["promedio_final"],
-                            resultado["tiempo_total"],
-                            diversidad_final,
-                        ])
-
-                        # Escritura de curvas detalladas
-                        curva_mejor = resultado["curva_mejor"]
-                        curva_prom = resultado["curva_promedio"]
-                        curva_diversidad = resultado["curva_diversidad"]
-                        
-                        for gen, (mejor_g, prom_g, div_g) in enumerate(
-                            zip(curva_mejor, curva_prom, curva_diversidad)
-                        ):
-                            writer_curv.writerow([
-                                resultado["nombre_func"],
-                                resultado["tipo_cruza"],
-                                resultado["dim"],
-                                resultado["tam_pob"],
-                                resultado["generaciones"],
-                                rep,
-                                resultado["semilla"],
-                                gen,
-                                mejor_g,
-                                prom_g,
-                                div_g,
-                            ])
+        if modo_apertura == "w":
+            writer_res.writerow(ENCABEZADO_RESUMEN + (columnas_perfil() if perfilar else []))
+            escribir_encabezado(f_bit, writer_bit, parametros_bateria)
+            if salida_curvas == "csv":
+                writer_curv.writerow(ENCABEZADO_CURVAS)
+
+        # Corridas escritas cuyo bloque .npz aún no está en disco
+        sin_registrar: List[Tuple[str, str, int, int]] = []
+
+        def registrar_pendientes(pos_curvas: int) -> None:
+            bytes_resumen = sincronizar(f_res)
+            for clave in sin_registrar:
+                registrar_corrida(f_bit, writer_bit, clave, bytes_resumen, pos_curvas)
+            sin_registrar.clear()
+
+        def informar(tarea: Tuple[str, str, int, int]) -> None:
+            nombre_func, tipo_cruza, rep, semilla = tarea
+            print(f"[INFO] Función={nombre_func}, cruza={tipo_cruza}, "
+                  f"rep={rep+1}/{repeticiones}, semilla={semilla}")
+
+        def guardar(tarea: Tuple[str, str, int, int], resultado: dict) -> None:
+            escribir_resumen(writer_res, resultado, tarea[2])
+            sin_registrar.append(tarea)
+            if salida_curvas == "csv":
+                escribir_curvas(writer_curv, resultado, tarea[2])
+                registrar_pendientes(sincronizar(f_curv))
+            elif escritor_npz.agregar(resultado, tarea[2]):
+                registrar_pendientes(escritor_npz.num_partes)
+
+        pool = None
+        if workers > 1:
+            pool = pila.enter_context(ProcessPoolExecutor(max_workers=workers))
+
+        def ejecutar(tareas_bloque: List[Tuple[str, str, int, int]]) -> None:
+            lotes = _formar_lotes(tareas_bloque, motor)
+            trabajos = [(lote, parametros) for lote in lotes]
+            if pool is None:
+                resultados = map(_ejecutar_lote, trabajos)
+            else:
+                # map() entrega los resultados en el orden de envío conforme terminan,
+                # de modo que un único escritor conserva el orden de la ruta secuencial
+                resultados = pool.map(_ejecutar_lote, trabajos, chunksize=1)
+            for lote, resultados_lote in zip(lotes, resultados):
+                for tarea, resultado in zip(lote, resultados_lote):
+                    informar(tarea)
+                    guardar(tarea, resultado)
+                    if estado_carrera is not None:
+                        estado_carrera.registrar(*tarea[:3], resultado["mejor_final"])
+
+        if estado_carrera is None:
+            ejecutar(pendientes)
         else:
-            raise ValueError(f"Modo de semillas no válido: {modo_semillas}")
+            # Bloques de repeticiones; tras cada uno se descartan las configuraciones peores
+            bloques = estado_carrera.bloques()
+            for i, reps in enumerate(bloques):
+                ejecutar([
+                    tarea for tarea in pendientes
+                    if tarea[2] in reps and estado_carrera.sigue(*tarea[:2])
+                ])
+                if i < len(bloques) - 1:
+                    for nombre_func, tipo_cruza, p in estado_carrera.evaluar(reps.stop):
+                        print(f"[INFO] Carrera ({nombre_func}): se descarta {tipo_cruza} "
+                              f"tras {reps.stop} repeticiones (p={p:.3g})")
+
+        # Último bloque incompleto de la salida columnar
+        if salida_curvas == "npz":
+            escritor_npz.vaciar()
+            registrar_pendientes(escritor_npz.num_partes)
+
+    if estado_carrera is not None:
+        total = len(tareas)
+        ahorradas = estado_carrera.corridas_ahorradas()
+        print(f"\n[INFO] Carrera '{carrera}': {ahorradas} de {total} corridas ahorradas "
+              f"({ahorradas / total:.0%})")
 
     print(f"\n[OK] Resumen guardado en: {nombre_archivo}")
     print(f"[OK] Curvas guardadas en: {nombre_curvas}")
@@ -438,29 +1193,8 @@ def correr_experimentos(
 # =========================================
 
 if __name__ == "__main__":
-    # Gestión básica de argumentos para control de semillas
-    # Uso: python main_ga.py [-s SEED]
-    args = sys.argv[1:]
-    modo_semillas = "independientes"
-    base_semilla = None
-
-    if len(args) >= 2 and args[0] in ("-s", "--seed"):
-        try:
-            base_semilla = int(args[1])
-            modo_semillas = "bloques"
-            print(f"[INFO] Modo de semillas 'bloques' activo. Base: {base_semilla}")
-        except ValueError:
-            print(f"[WARN] Semilla inválida '{args[1]}', revirtiendo a modo 'independientes'.")
-
-    # Inicio de la batería de experimentos
-    correr_experimentos(
-        nombre_archivo="resultados_ga_sphere_rastrigin_rosenbrock.csv",
-        funciones=["sphere", "rastrigin", "rosenbrock"],
-        cruzas=["un_punto", "uniforme", "blx", "sbx"],
-        dim=10,
-        tam_pob=100,
-        generaciones=1000,
-        repeticiones=30,
-        modo_semillas=modo_semillas,
-        base_semilla=base_semilla,
-    )
\ No newline at end of file
+    # Equivale a `python linea_comandos.py run [opciones]`; conserva el uso histórico
+    # `python main_ga.py [-s SEED]` con la batería publicada como valores por defecto.
+    from linea_comandos import main
+
+    sys.exit(main(["run"] + sys.argv[1:]))
@@ -0,0 +1,217 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List, Optional, Tuple
+
+from seleccion_ruleta import transformar_aptitud_vector, seleccion_ruleta_indices
+from calcular_diversidad import medir_diversidad
+from criterios_paro import CriteriosParo, CRITERIO_GENERACIONES
+from generadores import generadores_corrida
+
+# =========================================
+# Modo estacionario asíncrono
+# =========================================
+# Para funciones objetivo costosas y de duración variable. En lugar de evaluar
+# una generación completa y esperar al hijo más lento, un pool de procesos
+# evalúa hijos individuales de forma continua: cada costo que llega se inserta
+# de inmediato en la población y el trabajador libre recibe un nuevo hijo.
+#
+# Las reglas son las del motor de listas aplicadas a un hijo a la vez:
+# padres por ruleta (seleccion_ruleta_indices) y reemplazo del peor individuo
+# si el hijo lo mejora, con lo que el mejor nunca se pierde.
+# El orden de llegada depende de los tiempos de evaluación, por lo que las
+# trayectorias no son reproducibles bit a bit aunque se fije la semilla.
+
+# Función objetivo de cada trabajador (se fija una vez al crear el pool)
+_f_trabajador = None
+
+
+def _inicializar_trabajador(f: Callable[[List[float]], float]) -> None:
+    global _f_trabajador
+    _f_trabajador = f
+
+
+def _evaluar_en_trabajador(individuo: List[float]) -> float:
+    return _f_trabajador(individuo)
+
+
+def ejecutar_ga_asincrono(
+    nombre_func: str,
+    f: Callable[[List[float]], float],
+    limites: Tuple[float, float],
+    crear_hijos: Callable[..., Tuple[List[float], List[float]]],
+    dim: int = 10,
+    tam_pob: int = 50,
+    generaciones: int = 1000,
+    pc: float = 0.9,
+    tipo_cruza: str = "un_punto",
+    porcentaje_reemplazo: float = 1.0,
+    elitismo: int = 1,
+    semilla: int = 42,
+    alpha_blx: float = 0.5,
+    eta_c_sbx: float = 10.0,
+    amplitud_mut: float = 0.1,
+    metrica_diversidad: str = "desviacion",
+    trabajadores: int = 2,
+    evaluaciones_por_registro: int = None,
+    paro: Optional[CriteriosParo] = None,
+    modo_rng: str = "compatible",
+) -> dict:
+    """
+    Ejecuta el AG en modo estacionario asíncrono con un pool de `trabajadores` procesos.
+
+    El presupuesto es el mismo que el del modo generacional: `tam_pob * generaciones`
+    evaluaciones de descendencia. Las curvas se registran cada
+    `evaluaciones_por_registro` evaluaciones completadas (por defecto `tam_pob`,
+    equivalente a una generación), de modo que cada punto de la curva corresponde
+    a un número fijo de evaluaciones y no a una generación. El estado final
+    siempre se registra, aunque el presupuesto no sea múltiplo del intervalo o
+    la corrida se detenga antes.
+
+    Args:
+        f (Callable): Función objetivo sobre listas; debe poder enviarse a procesos.
+        crear_hijos (Callable): Reproducción `crear_hijos(p1, p2, rng=rng)` con los
+            parámetros de cruza y mutación ya fijados (ver `crear_hijos_reales`).
+        trabajadores (int): Evaluaciones simultáneas.
+        evaluaciones_por_registro (int): Evaluaciones entre puntos de las curvas.
+        paro (CriteriosParo): Criterios de paro adicionales. Evaluaciones y tiempo
+            se revisan tras cada evaluación; los demás, en cada registro. Al
+            detenerse se cancelan los hijos aún no iniciados.
+        modo_rng (str): Generadores de la corrida (ver generadores.py). Los
+            trabajadores solo evalúan, por lo que no consumen números aleatorios.
+
+    Returns:
+        dict: Mismas llaves que `ejecutar_ga_real` más 'evaluaciones_por_registro'.
+    """
+    if trabajadores < 1:
+        raise ValueError("trabajadores debe ser >= 1")
+    if evaluaciones_por_registro is None:
+        evaluaciones_por_registro = tam_pob
+    if evaluaciones_por_registro < 1:
+        raise ValueError("evaluaciones_por_registro debe ser >= 1")
+
+    presupuesto = tam_pob * generaciones
+    if evaluaciones_por_registro > presupuesto:
+        raise ValueError(
+            f"evaluaciones_por_registro ({evaluaciones_por_registro}) no puede superar el "
+            f"presupuesto de {presupuesto} evaluaciones (tam_pob * generaciones)"
+        )
+    if paro is None:
+        paro = CriteriosParo()
+
+    rng, rng_diversidad = generadores_corrida(semilla, modo_rng)
+    a, b = limites
+
+    curva_mejor: List[float] = []
+    curva_promedio: List[float] = []
+    curva_diversidad: List[float] = []
+
+    criterio_paro = CRITERIO_GENERACIONES
+    paro.iniciar()
+    t0 = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=trabajadores,
+        initializer=_inicializar_trabajador,
+        initargs=(f,),
+    ) as pool:
+        # Inicialización y evaluación base (en paralelo, sin orden de llegada)
+        poblacion = [[rng.uniform(a, b) for _ in range(dim)] for _ in range(tam_pob)]
+        costos = list(pool.map(_evaluar_en_trabajador, poblacion,
+                               chunksize=max(1, tam_pob // (4 * trabajadores))))
+
+        en_vuelo = {}
+        pendientes: List[List[float]] = []
+        enviados = 0
+        completadas = 0
+        # Evaluaciones completadas en el último punto registrado
+        registradas = 0
+
+        def registrar() -> None:
+            nonlocal registradas
+            curva_mejor.append(min(costos))
+            curva_promedio.append(sum(costos) / tam_pob)
+            curva_diversidad.append(medir_diversidad(poblacion, metrica_diversidad, rng_diversidad))
+            registradas = completadas
+
+        def enviar() -> None:
+            nonlocal enviados
+            # Cada cruza produce dos hijos; el segundo espera al siguiente trabajador libre
+            if not pendientes:
+                ia, ib = seleccion_ruleta_indices(transformar_aptitud_vector(costos), 2, rng)
+                pendientes.extend(crear_hijos(poblacion[ia], poblacion[ib], rng=rng))
+            hijo = pendientes.pop(0)
+            en_vuelo[pool.submit(_evaluar_en_trabajador, hijo)] = hijo
+            enviados += 1
+
+        # Se mantienen dos hijos por trabajador para que ninguno quede ocioso
+        while enviados < presupuesto and len(en_vuelo) < 2 * trabajadores:
+            enviar()
+
+        while en_vuelo:
+            listos, _ = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for futuro in listos:
+                hijo = en_vuelo.pop(futuro)
+                costo = futuro.result()
+                completadas += 1
+
+                # Reemplazo del peor si el hijo lo mejora
+                idx_peor = max(range(tam_pob), key=costos.__getitem__)
+                if costo < costos[idx_peor]:
+                    poblacion[idx_peor] = hijo
+                    costos[idx_peor] = costo
+
+                if completadas % evaluaciones_por_registro == 0:
+                    registrar()
+                    if paro.activos():
+                        motivo = paro.revisar(tam_pob + completadas, curva_mejor[-1], curva_diversidad[-1])
+                        if motivo is not None:
+                            criterio_paro = motivo
+                            break
+                elif paro.activos():
+                    motivo = paro.revisar_presupuesto(tam_pob + completadas)
+                    if motivo is not None:
+                        criterio_paro = motivo
+                        break
+
+                if enviados < presupuesto:
+                    enviar()
+
+            if criterio_paro != CRITERIO_GENERACIONES:
+                break
+
+        # Último estado (presupuesto no múltiplo del intervalo o paro entre registros)
+        if registradas != completadas:
+            registrar()
+        if criterio_paro != CRITERIO_GENERACIONES:
+            # Los hijos que ya se estaban evaluando cuentan como evaluaciones realizadas
+            completadas += sum(not futuro.cancel() for futuro in en_vuelo)
+
+    t1 = time.perf_counter()
+
+    return {
+        "nombre_func": nombre_func,
+        "dim": dim,
+        "tam_pob": tam_pob,
+        "generaciones": generaciones,
+        "pc": pc,
+        "tipo_cruza": tipo_cruza,
+        "porcentaje_reemplazo": porcentaje_reemplazo,
+        "elitismo": elitismo,
+        "semilla": semilla,
+        "alpha_blx": alpha_blx,
+        "eta_c_sbx": eta_c_sbx,
+        "amplitud_mut": amplitud_mut,
+        "mejor_final": min(costos),
+        "peor_final": max(costos),
+        "promedio_final": sum(costos) / tam_pob,
+        "curva_mejor": curva_mejor,
+        "curva_promedio": curva_promedio,
+        "curva_diversidad": curva_diversidad,
+        "poblacion_final": poblacion,
+        "costos_finales": costos,
+        "tiempo_total": t1 - t0,
+        "criterio_paro": criterio_paro,
+        "generaciones_ejecutadas": len(curva_mejor),
+        "evaluaciones": tam_pob + completadas,
+        "evaluaciones_por_registro": evaluaciones_por_registro,
+    }
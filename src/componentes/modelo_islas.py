@@ -0,0 +1,331 @@
+import multiprocessing as mp
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from cache_evaluacion import EvaluadorCache
+from motor_matricial import generacion_matricial
+from criterios_paro import CRITERIO_GENERACIONES
+from generadores import semillas_islas
+
+# =========================================
+# Modelo de islas multiproceso
+# =========================================
+# La población total se reparte en K subpoblaciones (islas). Cada isla evoluciona
+# en su propio proceso con el mismo flujo del motor matricial y cada M
+# generaciones intercambia migrantes con sus vecinas a través de buffers de
+# memoria compartida. Una barrera sincroniza la escritura y lectura de buzones.
+#
+# La diversidad global exacta se combina cada generación: cada isla publica la
+# media y M2 por dimensión de su población, espera en la barrera y la isla 0
+# los combina. Los momentos usan dos ranuras alternadas (generaciones pares e
+# impares), de modo que la memoria no crece con G y basta una barrera por generación:
+# una isla solo vuelve a escribir la ranura de g en g + 2, después de la
+# barrera de g + 1, a la que la isla 0 llega tras combinar g.
+#
+# Buffers compartidos (float64):
+#   buzon              (K, m, D)     migrantes que publica cada isla
+#   buzon_costos       (K, m)
+#   curvas             (3, K, G)     mejor, promedio y diversidad por isla y generación
+#   momentos           (2, 2, K, D)  ranura, media/M2, isla, dimensión
+#   diversidad_global  (G,)          diversidad de la unión de las islas
+#   poblacion_final    (N, D)        islas concatenadas al terminar
+#   costos_finales   (N,)
+#   contadores       (K, 4)        contadores del EvaluadorCache de cada isla
+
+TOPOLOGIAS = ("anillo", "completa")
+POLITICAS_MIGRACION = ("mejor_reemplaza_peor", "aleatorio_reemplaza_peor")
+
+
+def _vecinos(isla: int, num_islas: int, topologia: str) -> List[int]:
+    """Islas de las que `isla` recibe migrantes."""
+    if topologia == "anillo":
+        return [(isla - 1) % num_islas]
+    return [k for k in range(num_islas) if k != isla]
+
+
+def _crear_buffers(formas: Dict[str, Tuple[int, ...]]) -> Dict[str, SharedMemory]:
+    bloques = {}
+    for nombre, forma in formas.items():
+        tam = max(1, int(np.prod(forma)) * 8)
+        bloques[nombre] = SharedMemory(create=True, size=tam)
+    return bloques
+
+
+def _vistas(bloques: Dict[str, SharedMemory], formas: Dict[str, Tuple[int, ...]]) -> Dict[str, np.ndarray]:
+    return {
+        nombre: np.ndarray(formas[nombre], dtype=np.float64, buffer=bloques[nombre].buf)
+        for nombre in formas
+    }
+
+
+def _diversidad_global(medias: np.ndarray, m2: np.ndarray, tamanos: np.ndarray) -> float:
+    """
+    Diversidad ('desviacion') de la unión de las islas a partir de la media y M2
+    por dimensión (K, D) de cada una y sus tamaños (K,).
+    """
+    n_k = tamanos[:, None]
+    total = tamanos.sum()
+    media_global = (medias * n_k).sum(axis=0) / total
+    m2_global = (m2 + n_k * (medias - media_global) ** 2).sum(axis=0)
+    return float(np.sqrt(m2_global / total).mean())
+
+
+def _migrar(
+    isla: int,
+    poblacion: np.ndarray,
+    costos: np.ndarray,
+    vistas: Dict[str, np.ndarray],
+    vecinos: List[int],
+    num_migrantes: int,
+    politica: str,
+    barrera,
+    rng: np.random.Generator,
+) -> None:
+    """Publica migrantes, espera a las demás islas y sustituye a los peores (en sitio)."""
+    m = num_migrantes
+
+    # 1. Publicación en el buzón propio
+    if politica == "mejor_reemplaza_peor":
+        salientes = np.argpartition(costos, m - 1)[:m]
+    else:
+        salientes = rng.choice(len(costos), size=m, replace=False)
+    vistas["buzon"][isla] = poblacion[salientes]
+    vistas["buzon_costos"][isla] = costos[salientes]
+    barrera.wait()
+
+    # 2. Lectura de vecinos (con topología completa se toman los m mejores recibidos)
+    entrantes = vistas["buzon"][vecinos].reshape(-1, poblacion.shape[1])
+    costos_entrantes = vistas["buzon_costos"][vecinos].reshape(-1)
+    if len(costos_entrantes) > m:
+        mejores = np.argpartition(costos_entrantes, m - 1)[:m]
+        entrantes = entrantes[mejores]
+        costos_entrantes = costos_entrantes[mejores]
+    entrantes = entrantes.copy()
+    costos_entrantes = costos_entrantes.copy()
+
+    # Nadie vuelve a escribir su buzón hasta que todas las islas leyeron
+    barrera.wait()
+
+    # 3. Los migrantes sustituyen a los peores de la isla
+    peores = np.argpartition(-costos, m - 1)[:m]
+    poblacion[peores] = entrantes
+    costos[peores] = costos_entrantes
+
+
+def _evolucionar_isla(isla: int, config: dict, nombres: Dict[str, str], formas: dict, barrera) -> None:
+    """Proceso de una isla. Escribe curvas, momentos y población final en memoria compartida; la isla 0 combina la diversidad global."""
+    bloques = {nombre: SharedMemory(name=nombres[nombre]) for nombre in formas}
+    try:
+        vistas = _vistas(bloques, formas)
+
+        f = config["f"]
+        a, b = config["limites"]
+        dim = config["dim"]
+        inicio, fin = config["rangos"][isla]
+        generaciones = config["generaciones"]
+        intervalo = config["intervalo_migracion"]
+        vecinos = _vecinos(isla, config["num_islas"], config["topologia"])
+        tamanos = np.array([fin_k - inicio_k for inicio_k, fin_k in config["rangos"]], dtype=float)
+
+        rng = np.random.default_rng(config["semillas_islas"][isla])
+        evaluador = EvaluadorCache(f, tam_max=config["tam_cache"]) if config["cache_evaluacion"] else None
+
+        poblacion = rng.uniform(a, b, size=(fin - inicio, dim))
+        if evaluador is None:
+            costos = np.asarray(f(poblacion), dtype=float)
+        else:
+            costos = evaluador.evaluar_matriz(poblacion)
+
+        for g in range(generaciones):
+            poblacion, costos = generacion_matricial(
+                poblacion, costos, f, a, b, config["pc"], config["tipo_cruza"],
+                config["pm_gen"], config["amplitud_mut"], config["alpha_blx"],
+                config["eta_c_sbx"], config["elitismo"], config["mutacion"],
+                config["seleccion"], rng, evaluador=evaluador,
+            )
+
+            if config["num_islas"] > 1 and intervalo > 0 and (g + 1) % intervalo == 0:
+                _migrar(isla, poblacion, costos, vistas, vecinos, config["num_migrantes"],
+                        config["politica_migracion"], barrera, rng)
+
+            # Registro de métricas de la isla
+            media = poblacion.mean(axis=0)
+            m2 = ((poblacion - media) ** 2).sum(axis=0)
+            vistas["curvas"][0, isla, g] = costos.min()
+            vistas["curvas"][1, isla, g] = costos.mean()
+            vistas["curvas"][2, isla, g] = np.sqrt(m2 / len(poblacion)).mean()
+            momentos = vistas["momentos"][g % 2]
+            momentos[0, isla] = media
+            momentos[1, isla] = m2
+            barrera.wait()
+            if isla == 0:
+                vistas["diversidad_global"][g] = _diversidad_global(momentos[0], momentos[1], tamanos)
+
+        vistas["poblacion_final"][inicio:fin] = poblacion
+        vistas["costos_finales"][inicio:fin] = costos
+        if evaluador is not None:
+            vistas["contadores"][isla] = list(evaluador.contadores().values())
+        del vistas
+    except BaseException:
+        # Libera a las demás islas si esta falla a mitad de una migración
+        barrera.abort()
+        raise
+    finally:
+        for bloque in bloques.values():
+            bloque.close()
+
+
+def ejecutar_ga_islas(
+    nombre_func: str,
+    f: Callable[[np.ndarray], np.ndarray],
+    limites: Tuple[float, float],
+    dim: int = 10,
+    tam_pob: int = 400,
+    generaciones: int = 1000,
+    pc: float = 0.9,
+    tipo_cruza: str = "un_punto",
+    porcentaje_reemplazo: float = 1.0,
+    elitismo: int = 1,
+    semilla: int = 42,
+    alpha_blx: float = 0.5,
+    eta_c_sbx: float = 10.0,
+    amplitud_mut: float = 0.1,
+    mutacion: str = "densa",
+    seleccion: str = "ruleta",
+    cache_evaluacion: bool = False,
+    tam_cache: int = 4096,
+    num_islas: int = 4,
+    intervalo_migracion: int = 20,
+    num_migrantes: int = 2,
+    topologia: str = "anillo",
+    politica_migracion: str = "mejor_reemplaza_peor",
+    modo_rng: str = "compatible",
+) -> dict:
+    """
+    Ejecuta el AG con un modelo de islas: `num_islas` subpoblaciones, una por proceso.
+
+    `tam_pob` es el tamaño total; se reparte entre las islas. Cada
+    `intervalo_migracion` generaciones, cada isla publica `num_migrantes`
+    individuos y recibe los de sus vecinas según la `topologia` ('anillo':
+    de la isla anterior; 'completa': los mejores de todas las demás), que
+    sustituyen a sus peores individuos.
+
+    Retorna el diccionario de `ejecutar_ga_real` con curvas globales (mejor,
+    promedio y diversidad exacta de la unión de las islas) y, además,
+    'curvas_islas' con las curvas de cada isla.
+    Con modo_rng='secuencia' cada isla usa un flujo hijo de SeedSequence(semilla).
+    """
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"Topología no reconocida: {topologia}")
+    if politica_migracion not in POLITICAS_MIGRACION:
+        raise ValueError(f"Política de migración no reconocida: {politica_migracion}")
+    if num_islas < 1:
+        raise ValueError("num_islas debe ser >= 1")
+
+    # Reparto de la población total entre islas
+    tamanos = [tam_pob // num_islas + (1 if k < tam_pob % num_islas else 0) for k in range(num_islas)]
+    if min(tamanos) < 2:
+        raise ValueError("Cada isla necesita al menos 2 individuos.")
+    if num_islas > 1 and not 1 <= num_migrantes <= min(tamanos):
+        raise ValueError("num_migrantes debe estar entre 1 y el tamaño de la isla más pequeña.")
+    limites_islas = np.cumsum([0] + tamanos)
+    rangos = [(int(limites_islas[k]), int(limites_islas[k + 1])) for k in range(num_islas)]
+
+    formas = {
+        "buzon": (num_islas, max(num_migrantes, 1), dim),
+        "buzon_costos": (num_islas, max(num_migrantes, 1)),
+        "curvas": (3, num_islas, generaciones),
+        "momentos": (2, 2, num_islas, dim),
+        "diversidad_global": (generaciones,),
+        "poblacion_final": (tam_pob, dim),
+        "costos_finales": (tam_pob,),
+        "contadores": (num_islas, 4),
+    }
+
+    config = dict(
+        f=f, limites=limites, dim=dim, generaciones=generaciones, pc=pc,
+        tipo_cruza=tipo_cruza.lower(), pm_gen=1.0 / dim, amplitud_mut=amplitud_mut,
+        alpha_blx=alpha_blx, eta_c_sbx=eta_c_sbx, elitismo=elitismo, mutacion=mutacion,
+        seleccion=seleccion, semillas_islas=semillas_islas(semilla, num_islas, modo_rng),
+        cache_evaluacion=cache_evaluacion,
+        tam_cache=tam_cache, num_islas=num_islas, rangos=rangos,
+        intervalo_migracion=intervalo_migracion, num_migrantes=num_migrantes,
+        topologia=topologia, politica_migracion=politica_migracion,
+    )
+
+    bloques = _crear_buffers(formas)
+    try:
+        nombres = {nombre: bloque.name for nombre, bloque in bloques.items()}
+        barrera = mp.Barrier(num_islas)
+        procesos = [
+            mp.Process(target=_evolucionar_isla, args=(k, config, nombres, formas, barrera))
+            for k in range(num_islas)
+        ]
+
+        t0 = time.perf_counter()
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join()
+        t1 = time.perf_counter()
+
+        fallidas = [k for k, proceso in enumerate(procesos) if proceso.exitcode != 0]
+        if fallidas:
+            raise RuntimeError(f"Las islas {fallidas} terminaron con error.")
+
+        vistas = _vistas(bloques, formas)
+        curvas = vistas["curvas"].copy()
+        curva_diversidad = vistas["diversidad_global"].copy()
+        poblacion = vistas["poblacion_final"].copy()
+        costos = vistas["costos_finales"].copy()
+        contadores = vistas["contadores"].sum(axis=0)
+        del vistas
+    finally:
+        for bloque in bloques.values():
+            bloque.close()
+            bloque.unlink()
+
+    # Curvas globales (la diversidad global ya la combinó la isla 0 en cada generación)
+    n_k = np.array(tamanos, dtype=float)[:, None]
+    curva_mejor = curvas[0].min(axis=0)
+    curva_promedio = (curvas[1] * n_k).sum(axis=0) / tam_pob
+
+    resultado = {
+        "nombre_func": nombre_func,
+        "dim": dim,
+        "tam_pob": tam_pob,
+        "generaciones": generaciones,
+        "pc": pc,
+        "tipo_cruza": tipo_cruza,
+        "porcentaje_reemplazo": porcentaje_reemplazo,
+        "elitismo": elitismo,
+        "semilla": semilla,
+        "alpha_blx": alpha_blx,
+        "eta_c_sbx": eta_c_sbx,
+        "amplitud_mut": amplitud_mut,
+        "mejor_final": float(costos.min()),
+        "peor_final": float(costos.max()),
+        "promedio_final": float(costos.mean()),
+        "curva_mejor": curva_mejor,
+        "curva_promedio": curva_promedio,
+        "curva_diversidad": curva_diversidad,
+        "poblacion_final": poblacion.tolist(),
+        "costos_finales": costos.tolist(),
+        "tiempo_total": t1 - t0,
+        "criterio_paro": CRITERIO_GENERACIONES,
+        "generaciones_ejecutadas": generaciones,
+        "evaluaciones": tam_pob * (generaciones + 1),
+        "num_islas": num_islas,
+        "curvas_islas": {
+            "mejor": curvas[0].tolist(),
+            "promedio": curvas[1].tolist(),
+            "diversidad": curvas[2].tolist(),
+        },
+    }
+    if cache_evaluacion:
+        claves = ("evaluaciones", "cache_aciertos", "cache_fallos", "costos_heredados")
+        resultado.update({clave: int(valor) for clave, valor in zip(claves, contadores)})
+    return resultado
@@ -0,0 +1,302 @@
+import copy
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from motor_matricial import _cruzar_matricial, _mutar_matricial, PRECISIONES
+from mutacion_real import mutacion_real_lote
+from seleccion_ruleta import transformar_aptitud_vector, seleccion_ruleta_lote
+from reemplazo_peores import reemplazo_peores_lote
+from calcular_diversidad import medir_diversidad, calcular_diversidad_apilada
+from criterios_paro import CriteriosParo, CRITERIO_GENERACIONES
+from registro_metricas import RegistroMetricas
+from generadores import GeneradoresApilados, generadores_corrida
+
+# =========================================
+# Motor apilado: todas las repeticiones a la vez
+# =========================================
+# Las R repeticiones de una configuración evolucionan juntas en un tensor
+# (R, N, D) con costos (R, N). Cruza, mutación densa, evaluación y reemplazo
+# con elitismo 1 operan sobre el tensor completo; la selección, la mutación
+# dispersa y las métricas registradas recorren las repeticiones, porque sus
+# sorteos y su aritmética dependen de cada población.
+#
+# Cada repetición conserva su semilla y sus propios generadores (ver
+# GeneradoresApilados), por lo que su trayectoria es la misma que la del motor
+# matricial con esa semilla: las repeticiones son independientes y cada una
+# produce sus curvas y su fila de resumen.
+
+
+def _reemplazo_apilado(
+    poblacion: np.ndarray,
+    hijos: np.ndarray,
+    costos: np.ndarray,
+    costos_hijos: np.ndarray,
+    elitismo: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `reemplazo_peores_lote` para cada repetición del tensor (M == N).
+    Con elitismo 1 el mejor padre de cada repetición sustituye a su peor hijo si lo mejora.
+    """
+    if elitismo == 1:
+        filas = np.arange(len(poblacion))
+        peores = np.argmax(costos_hijos, axis=1)
+        mejores = np.argmin(costos, axis=1)
+        entra = np.flatnonzero(costos[filas, mejores] < costos_hijos[filas, peores])
+        hijos[entra, peores[entra]] = poblacion[entra, mejores[entra]]
+        costos_hijos[entra, peores[entra]] = costos[entra, mejores[entra]]
+        return hijos, costos_hijos
+
+    for r in range(len(poblacion)):
+        hijos[r], costos_hijos[r] = reemplazo_peores_lote(
+            poblacion[r], hijos[r], costos[r], costos_hijos[r], elitismo
+        )
+    return hijos, costos_hijos
+
+
+def generacion_apilada(
+    poblacion: np.ndarray,
+    costos: np.ndarray,
+    f: Callable[[np.ndarray], np.ndarray],
+    a: float,
+    b: float,
+    pc: float,
+    tipo_cruza: str,
+    pm_gen: float,
+    amplitud_mut: float,
+    alpha_blx: float,
+    eta_c_sbx: float,
+    elitismo: int,
+    mutacion: str,
+    seleccion: str,
+    generadores: List[np.random.Generator],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ejecuta una generación de `generacion_matricial` en cada una de las R poblaciones.
+
+    Args:
+        poblacion (np.ndarray): Tensor (R, N, D).
+        costos (np.ndarray): Costos (R, N).
+        generadores (List[np.random.Generator]): Generador de operadores de cada repetición.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Nuevas poblaciones (R, N, D) y sus costos (R, N).
+    """
+    num_rep, tam_pob, dim = poblacion.shape
+    apilado = GeneradoresApilados(generadores)
+
+    # Emparejamiento fijo: (0,1), (2,3), ... con wrap-around para población impar
+    idx_p1 = np.arange(0, tam_pob, 2)
+    idx_p2 = (idx_p1 + 1) % tam_pob
+    num_parejas = len(idx_p1)
+
+    # Selección de padres por índice (una ruleta por repetición)
+    aptitudes = transformar_aptitud_vector(costos)
+    padres = np.stack([
+        seleccion_ruleta_lote(aptitudes[r], tam_pob, rng, metodo=seleccion)
+        for r, rng in enumerate(generadores)
+    ])
+    filas = np.arange(num_rep)[:, None]
+    P1 = poblacion[filas, padres[:, idx_p1]].reshape(num_rep * num_parejas, dim)
+    P2 = poblacion[filas, padres[:, idx_p2]].reshape(num_rep * num_parejas, dim)
+
+    # Reproducción de las parejas de todas las repeticiones en bloque
+    H1, H2 = _cruzar_matricial(P1, P2, pc, a, b, tipo_cruza, apilado, alpha_blx, eta_c_sbx)
+
+    # Intercalado h1, h2, h1, h2, ... y recorte de excedentes
+    hijos = np.empty((num_rep, 2 * num_parejas, dim), dtype=poblacion.dtype)
+    hijos[:, 0::2] = H1.reshape(num_rep, num_parejas, dim)
+    hijos[:, 1::2] = H2.reshape(num_rep, num_parejas, dim)
+    if 2 * num_parejas != tam_pob:
+        hijos = np.ascontiguousarray(hijos[:, :tam_pob])
+
+    if mutacion == "dispersa":
+        for r, rng in enumerate(generadores):
+            mutacion_real_lote(hijos[r], pm_gen, a, b, amplitud_mut, rng)
+    else:
+        hijos = _mutar_matricial(
+            hijos.reshape(num_rep * tam_pob, dim), pm_gen, a, b, amplitud_mut, apilado
+        ).reshape(num_rep, tam_pob, dim)
+
+    costos_hijos = np.asarray(f(hijos.reshape(num_rep * tam_pob, dim)), dtype=hijos.dtype)
+    costos_hijos = costos_hijos.reshape(num_rep, tam_pob)
+
+    return _reemplazo_apilado(poblacion, hijos, costos, costos_hijos, elitismo)
+
+
+def ejecutar_ga_apilado(
+    nombre_func: str,
+    f: Callable[[np.ndarray], np.ndarray],
+    limites: Tuple[float, float],
+    semillas: List[int],
+    dim: int = 10,
+    tam_pob: int = 50,
+    generaciones: int = 1000,
+    pc: float = 0.9,
+    tipo_cruza: str = "un_punto",
+    porcentaje_reemplazo: float = 1.0,
+    elitismo: int = 1,
+    alpha_blx: float = 0.5,
+    eta_c_sbx: float = 10.0,
+    amplitud_mut: float = 0.1,
+    mutacion: str = "densa",
+    metrica_diversidad: str = "desviacion",
+    seleccion: str = "ruleta",
+    paro: CriteriosParo = None,
+    registro: str = "todas",
+    registro_cada: int = 10,
+    registro_puntos: int = 100,
+    modo_rng: str = "compatible",
+    precision: str = "float64",
+) -> List[dict]:
+    """
+    Ejecuta una repetición del AG por semilla, todas en un mismo tensor (R, N, D).
+
+    Retorna, en el orden de `semillas`, el diccionario de resultados de
+    `ejecutar_ga_matricial` para cada repetición, con la misma trayectoria.
+    Cada repetición revisa sus propios criterios de paro (`paro` se copia) y
+    deja el tensor al detenerse. `tiempo_total` es la parte que le corresponde
+    del tiempo de cada generación, repartido entre las repeticiones activas; el
+    criterio `tiempo_max` se revisa contra esa parte, no contra el reloj
+    compartido, así que cada repetición dispone del mismo tiempo que tendría
+    corriendo sola.
+    `precision` es la del motor matricial: con 'float32' el tensor y los costos
+    son float32 y las métricas se calculan en float64.
+    """
+    a, b = limites
+    tipo = tipo_cruza.lower()
+    num_rep = len(semillas)
+
+    if num_rep < 1:
+        raise ValueError("Se requiere al menos una semilla.")
+    if mutacion not in ("densa", "dispersa"):
+        raise ValueError(f"Modo de mutación no reconocido: {mutacion}")
+    if precision not in PRECISIONES:
+        raise ValueError(f"Precisión no reconocida: {precision}")
+
+    pm_gen = 1.0 / dim
+    if paro is None:
+        paro = CriteriosParo()
+
+    # Generadores de cada repetición (operadores, diversidad muestreada)
+    flujos = [generadores_corrida(semilla, modo_rng, vectorial=True) for semilla in semillas]
+    rngs = [rng for rng, _ in flujos]
+    rngs_diversidad = [rng_div for _, rng_div in flujos]
+
+    poblacion = GeneradoresApilados(rngs).uniform(a, b, size=(num_rep * tam_pob, dim))
+    poblacion = poblacion.astype(precision, copy=False)
+    costos = np.asarray(f(poblacion), dtype=precision).reshape(num_rep, tam_pob)
+    poblacion = poblacion.reshape(num_rep, tam_pob, dim)
+
+    trazas = [
+        RegistroMetricas(generaciones, registro, registro_cada, registro_puntos)
+        for _ in range(num_rep)
+    ]
+    paros = [copy.copy(paro) for _ in range(num_rep)]
+    criterios = [CRITERIO_GENERACIONES] * num_rep
+    ejecutadas = [generaciones] * num_rep
+    tiempos = np.zeros(num_rep)
+    resultados: List[dict] = [None] * num_rep
+
+    # Índices originales de las repeticiones que siguen en el tensor
+    activas = list(range(num_rep))
+
+    def cerrar(j: int, i: int) -> None:
+        """Arma el resultado de la repetición `i` (fila `j` del tensor)."""
+        resultados[i] = {
+            "nombre_func": nombre_func,
+            "dim": dim,
+            "tam_pob": tam_pob,
+            "generaciones": generaciones,
+            "pc": pc,
+            "tipo_cruza": tipo_cruza,
+            "porcentaje_reemplazo": porcentaje_reemplazo,
+            "elitismo": elitismo,
+            "semilla": semillas[i],
+            "alpha_blx": alpha_blx,
+            "eta_c_sbx": eta_c_sbx,
+            "amplitud_mut": amplitud_mut,
+            "mejor_final": float(costos[j].min()),
+            "peor_final": float(costos[j].max()),
+            "promedio_final": float(costos[j].mean(dtype=np.float64)),
+            **trazas[i].curvas(),
+            "poblacion_final": poblacion[j].tolist(),
+            "costos_finales": costos[j].tolist(),
+            "tiempo_total": float(tiempos[i]),
+            "criterio_paro": criterios[i],
+            "generaciones_ejecutadas": ejecutadas[i],
+            "evaluaciones": tam_pob * (ejecutadas[i] + 1),
+        }
+
+    for criterio in paros:
+        criterio.iniciar()
+    t_previo = time.perf_counter()
+
+    for g in range(generaciones):
+        poblacion, costos = generacion_apilada(
+            poblacion, costos, f, a, b, pc, tipo, pm_gen, amplitud_mut,
+            alpha_blx, eta_c_sbx, elitismo, mutacion, seleccion,
+            [rngs[i] for i in activas],
+        )
+
+        # Registro de métricas: promedio y diversidad solo de las repeticiones que registran;
+        # la desviación se calcula para todas ellas en una sola pasada sobre el tensor
+        mejores = costos.min(axis=1)
+        registran = [j for j, i in enumerate(activas) if trazas[i].debe_registrar(g, mejores[j])]
+        if registran:
+            promedios = costos[registran].mean(axis=1, dtype=np.float64)
+            if metrica_diversidad == "desviacion":
+                diversidades = calcular_diversidad_apilada(poblacion[registran])
+            else:
+                diversidades = [
+                    medir_diversidad(poblacion[j], metrica_diversidad, rngs_diversidad[activas[j]])
+                    for j in registran
+                ]
+            for j, promedio, diversidad in zip(registran, promedios, diversidades):
+                trazas[activas[j]].registrar(g, mejores[j], promedio, diversidad)
+        registradas = dict(zip(registran, diversidades)) if registran else {}
+
+        # Tiempo de la generación, repartido antes de revisar `tiempo_max`; la revisión
+        # de los criterios se cobra en la generación siguiente
+        ahora = time.perf_counter()
+        tiempos[activas] += (ahora - t_previo) / len(activas)
+        t_previo = ahora
+
+        terminadas = []
+        for j, i in enumerate(activas):
+            mejor = mejores[j]
+            diversidad = registradas.get(j)
+
+            if paros[i].activos():
+                if diversidad is None and paros[i].requiere_diversidad():
+                    diversidad = medir_diversidad(poblacion[j], metrica_diversidad, rngs_diversidad[i])
+                motivo = paros[i].revisar(tam_pob * (g + 2), mejor, diversidad, float(tiempos[i]))
+                if motivo is not None:
+                    criterios[i] = motivo
+                    ejecutadas[i] = g + 1
+                    # La generación de paro se registra siempre
+                    if trazas[i].ultima() != g:
+                        if diversidad is None:
+                            diversidad = medir_diversidad(
+                                poblacion[j], metrica_diversidad, rngs_diversidad[i]
+                            )
+                        trazas[i].registrar(g, mejor, costos[j].mean(dtype=np.float64), diversidad)
+                    terminadas.append(j)
+
+        # Las repeticiones detenidas salen del tensor
+        if terminadas:
+            for j in terminadas:
+                cerrar(j, activas[j])
+            siguen = [j for j in range(len(activas)) if j not in terminadas]
+            poblacion = poblacion[siguen]
+            costos = costos[siguen]
+            activas = [activas[j] for j in siguen]
+            if not activas:
+                break
+
+    if activas:
+        tiempos[activas] += (time.perf_counter() - t_previo) / len(activas)
+    for j, i in enumerate(activas):
+        cerrar(j, i)
+    return resultados
@@ -0,0 +1,322 @@
+import time
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from cruza_un_punto import cruza_un_punto_lote
+from cruza_uniforme import cruza_uniforme_lote
+from cruza_blx import cruza_blx_lote
+from cruza_sbx import cruza_sbx_lote
+from mutacion_real import mutacion_real_lote
+from seleccion_ruleta import transformar_aptitud_vector, seleccion_ruleta_lote
+from reemplazo_peores import reemplazo_peores_lote
+from cache_evaluacion import EvaluadorCache
+from calcular_diversidad import RastreadorDiversidad, PERIODO_REINICIO_DIVERSIDAD, medir_diversidad
+from criterios_paro import CriteriosParo, CRITERIO_GENERACIONES
+from perfilado import PerfiladorFases
+from registro_metricas import RegistroMetricas
+from generadores import generadores_corrida
+
+# =========================================
+# Motor matricial del AG
+# =========================================
+# La población, la descendencia y los costos viven en arreglos contiguos
+# (N, D) y (N,) durante toda la corrida. Cada fase de la generación opera
+# sobre la matriz completa en lugar de recorrer pares de individuos.
+#
+# Con precision='float32' la población, los hijos, los sorteos de cruza y
+# mutación y los costos se guardan y calculan en float32 (la mitad de memoria
+# y de tráfico por generación). La selección y las métricas registradas (mejor,
+# promedio, diversidad y resultados finales) se calculan en float64.
+
+PRECISIONES = ("float64", "float32")
+
+
+def _cruzar_matricial(
+    P1: np.ndarray,
+    P2: np.ndarray,
+    pc: float,
+    a: float,
+    b: float,
+    tipo_cruza: str,
+    rng: np.random.Generator,
+    alpha_blx: float,
+    eta_c_sbx: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Aplica el operador de cruza por lotes a todas las parejas (filas de P1 y P2).
+    Equivalente matricial de la selección de operador en `crear_hijos_reales`.
+    """
+    if tipo_cruza == "un_punto":
+        return cruza_un_punto_lote(P1, P2, prob_cruza=pc, rng=rng)
+    elif tipo_cruza == "uniforme":
+        return cruza_uniforme_lote(P1, P2, prob_cruza=pc, rng=rng)
+    elif tipo_cruza == "blx":
+        return cruza_blx_lote(P1, P2, prob_cruza=pc, alpha=alpha_blx, rng=rng,
+                              limite_inf=a, limite_sup=b)
+    elif tipo_cruza == "sbx":
+        return cruza_sbx_lote(P1, P2, prob_cruza=pc, eta_c=eta_c_sbx, rng=rng,
+                              limite_inf=a, limite_sup=b)
+    else:
+        raise ValueError(f"Operador de cruza no reconocido: {tipo_cruza}")
+
+
+def _mutar_matricial(
+    H: np.ndarray,
+    pm_gen: float,
+    a: float,
+    b: float,
+    amplitud: float,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """Mutación uniforme con saturación aplicada a toda la matriz de hijos."""
+    max_cambio = amplitud * (b - a)
+    mascara = rng.random(H.shape, dtype=H.dtype) < pm_gen
+    if H.dtype == np.float32:
+        # `uniform` solo produce float64: se escala un sorteo float32
+        ruido = -max_cambio + (2 * max_cambio) * rng.random(H.shape, dtype=np.float32)
+    else:
+        ruido = rng.uniform(-max_cambio, max_cambio, size=H.shape)
+    return np.where(mascara, np.clip(H + ruido, a, b), H)
+
+
+def generacion_matricial(
+    poblacion: np.ndarray,
+    costos: np.ndarray,
+    f: Callable[[np.ndarray], np.ndarray],
+    a: float,
+    b: float,
+    pc: float,
+    tipo_cruza: str,
+    pm_gen: float,
+    amplitud_mut: float,
+    alpha_blx: float,
+    eta_c_sbx: float,
+    elitismo: int,
+    mutacion: str,
+    seleccion: str,
+    rng: np.random.Generator,
+    evaluador: Optional[EvaluadorCache] = None,
+    rastreador: Optional[RastreadorDiversidad] = None,
+    perfil: Optional[PerfiladorFases] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ejecuta una generación completa sobre la matriz de población:
+    selección, cruza, mutación, evaluación y reemplazo.
+    Con `perfil` se acumula el tiempo de cada fase.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Nueva población (N, D) y sus costos (N,).
+    """
+    tam_pob, dim = poblacion.shape
+    if perfil is not None:
+        t = perfil.reloj()
+
+    # Emparejamiento fijo: (0,1), (2,3), ... con wrap-around para población impar
+    idx_p1 = np.arange(0, tam_pob, 2)
+    idx_p2 = (idx_p1 + 1) % tam_pob
+    num_parejas = len(idx_p1)
+
+    # Selección de padres por índice
+    aptitudes = transformar_aptitud_vector(costos)
+    if perfil is not None:
+        t = perfil.marcar("transformacion", t)
+    padres = seleccion_ruleta_lote(aptitudes, tam_pob, rng, metodo=seleccion)
+    P1 = poblacion[padres[idx_p1]]
+    P2 = poblacion[padres[idx_p2]]
+    if perfil is not None:
+        t = perfil.marcar("seleccion", t)
+
+    # Reproducción de todas las parejas en bloque
+    H1, H2 = _cruzar_matricial(P1, P2, pc, a, b, tipo_cruza, rng, alpha_blx, eta_c_sbx)
+
+    # Intercalado h1, h2, h1, h2, ... y recorte de excedentes
+    hijos = np.empty((2 * num_parejas, dim), dtype=poblacion.dtype)
+    hijos[0::2] = H1
+    hijos[1::2] = H2
+    hijos = hijos[:tam_pob]
+    if perfil is not None:
+        t = perfil.marcar("cruza", t)
+    if mutacion == "dispersa":
+        mutacion_real_lote(hijos, pm_gen, a, b, amplitud_mut, rng)
+    else:
+        hijos = _mutar_matricial(hijos, pm_gen, a, b, amplitud_mut, rng)
+    if perfil is not None:
+        t = perfil.marcar("mutacion", t)
+
+    if evaluador is None:
+        costos_hijos = np.asarray(f(hijos), dtype=hijos.dtype)
+    else:
+        # Cada hijo tiene como candidatos a los dos padres de su pareja
+        ia = np.repeat(padres[idx_p1], 2)[:tam_pob]
+        ib = np.repeat(padres[idx_p2], 2)[:tam_pob]
+        costos_hijos = evaluador.evaluar_matriz(
+            hijos, poblacion[ia], costos[ia], poblacion[ib], costos[ib]
+        )
+    if perfil is not None:
+        t = perfil.marcar("evaluacion", t)
+
+    # Reemplazo por selección parcial (elitismo > 1 conserva a los e mejores padres)
+    nueva, nuevos_costos = reemplazo_peores_lote(
+        poblacion, hijos, costos, costos_hijos, elitismo, rastreador
+    )
+    if perfil is not None:
+        perfil.marcar("reemplazo", t)
+    return nueva, nuevos_costos
+
+
+def ejecutar_ga_matricial(
+    nombre_func: str,
+    f: Callable[[np.ndarray], np.ndarray],
+    limites: Tuple[float, float],
+    dim: int = 10,
+    tam_pob: int = 50,
+    generaciones: int = 1000,
+    pc: float = 0.9,
+    tipo_cruza: str = "un_punto",
+    porcentaje_reemplazo: float = 1.0,
+    elitismo: int = 1,
+    semilla: int = 42,
+    alpha_blx: float = 0.5,
+    eta_c_sbx: float = 10.0,
+    amplitud_mut: float = 0.1,
+    mutacion: str = "densa",
+    diversidad_incremental: bool = False,
+    metrica_diversidad: str = "desviacion",
+    seleccion: str = "ruleta",
+    cache_evaluacion: bool = False,
+    tam_cache: int = 4096,
+    paro: Optional[CriteriosParo] = None,
+    perfilar: bool = False,
+    registro: str = "todas",
+    registro_cada: int = 10,
+    registro_puntos: int = 100,
+    modo_rng: str = "compatible",
+    precision: str = "float64",
+) -> dict:
+    """
+    Ejecuta una instancia completa del AG con la población en una matriz (N, D).
+
+    `f` debe aceptar una matriz (N, D) y devolver el vector (N,) de costos.
+    Retorna el mismo diccionario de resultados que `ejecutar_ga_real`, por lo
+    que el resto del flujo (CSV y gráficas) no distingue entre motores.
+    Las trayectorias aleatorias no coinciden con el motor de listas.
+    Con mutacion='dispersa' solo se sortean las posiciones de los genes mutados.
+    Con diversidad_incremental=True la diversidad se mantiene con un RastreadorDiversidad.
+    `metrica_diversidad` selecciona la métrica registrada (ver `medir_diversidad`).
+    `seleccion` elige entre ruleta ('ruleta') y Stochastic Universal Sampling ('sus').
+    Con cache_evaluacion=True se usa un EvaluadorCache (herencia de costos + LRU).
+    `paro` agrega criterios de paro al máximo de generaciones (ver criterios_paro.py).
+    Con perfilar=True el resultado incluye el desglose de tiempo por fase en 'perfil'.
+    `registro` elige las generaciones registradas en las curvas (ver registro_metricas.py).
+    `modo_rng` elige los generadores de la corrida (ver generadores.py).
+    `precision` ('float64' o 'float32') es el tipo de la población y los costos.
+    """
+    # El generador de diversidad es aparte: la métrica muestreada no altera la trayectoria
+    rng, rng_diversidad = generadores_corrida(semilla, modo_rng, vectorial=True)
+    a, b = limites
+    tipo = tipo_cruza.lower()
+
+    if mutacion not in ("densa", "dispersa"):
+        raise ValueError(f"Modo de mutación no reconocido: {mutacion}")
+
+    if precision not in PRECISIONES:
+        raise ValueError(f"Precisión no reconocida: {precision}")
+
+    pm_gen = 1.0 / dim
+    if paro is None:
+        paro = CriteriosParo()
+
+    # Inicialización y evaluación base
+    evaluador = EvaluadorCache(f, tam_max=tam_cache) if cache_evaluacion else None
+    perfil = PerfiladorFases() if perfilar else None
+
+    poblacion = rng.uniform(a, b, size=(tam_pob, dim)).astype(precision, copy=False)
+    if evaluador is None:
+        costos = np.asarray(f(poblacion), dtype=precision)
+    else:
+        costos = evaluador.evaluar_matriz(poblacion)
+
+    rastreador = RastreadorDiversidad(poblacion) if diversidad_incremental else None
+
+    # Trazas preasignadas (solo generaciones programadas)
+    traza = RegistroMetricas(generaciones, registro, registro_cada, registro_puntos)
+
+    def diversidad_actual() -> float:
+        if rastreador is None:
+            return medir_diversidad(poblacion, metrica_diversidad, rng_diversidad)
+        return rastreador.diversidad()
+
+    criterio_paro = CRITERIO_GENERACIONES
+    generaciones_ejecutadas = generaciones
+    paro.iniciar()
+    t0 = time.perf_counter()
+
+    for g in range(generaciones):
+        poblacion, costos = generacion_matricial(
+            poblacion, costos, f, a, b, pc, tipo, pm_gen, amplitud_mut,
+            alpha_blx, eta_c_sbx, elitismo, mutacion, seleccion, rng,
+            evaluador=evaluador, rastreador=rastreador, perfil=perfil,
+        )
+        if perfil is not None:
+            t = perfil.reloj()
+
+        # Registro de métricas generacionales (promedio y diversidad solo si se registran)
+        mejor = costos.min()
+        if rastreador is not None and (g + 1) % PERIODO_REINICIO_DIVERSIDAD == 0:
+            rastreador.programar_reinicio(poblacion)
+
+        diversidad = None
+        if traza.debe_registrar(g, mejor):
+            diversidad = diversidad_actual()
+            traza.registrar(g, mejor, costos.mean(dtype=np.float64), diversidad)
+        if perfil is not None:
+            perfil.marcar("metricas", t)
+
+        if paro.activos():
+            evaluaciones = tam_pob * (g + 2) if evaluador is None else evaluador.evaluaciones
+            if diversidad is None and paro.requiere_diversidad():
+                diversidad = diversidad_actual()
+            motivo = paro.revisar(evaluaciones, mejor, diversidad)
+            if motivo is not None:
+                criterio_paro = motivo
+                generaciones_ejecutadas = g + 1
+                # La generación de paro se registra siempre
+                if traza.ultima() != g:
+                    if diversidad is None:
+                        diversidad = diversidad_actual()
+                    traza.registrar(g, mejor, costos.mean(dtype=np.float64), diversidad)
+                break
+
+    t1 = time.perf_counter()
+    tiempo_total = t1 - t0
+
+    resultado = {
+        "nombre_func": nombre_func,
+        "dim": dim,
+        "tam_pob": tam_pob,
+        "generaciones": generaciones,
+        "pc": pc,
+        "tipo_cruza": tipo_cruza,
+        "porcentaje_reemplazo": porcentaje_reemplazo,
+        "elitismo": elitismo,
+        "semilla": semilla,
+        "alpha_blx": alpha_blx,
+        "eta_c_sbx": eta_c_sbx,
+        "amplitud_mut": amplitud_mut,
+        "mejor_final": float(costos.min()),
+        "peor_final": float(costos.max()),
+        "promedio_final": float(costos.mean(dtype=np.float64)),
+        **traza.curvas(),
+        "poblacion_final": poblacion.tolist(),
+        "costos_finales": costos.tolist(),
+        "tiempo_total": tiempo_total,
+        "criterio_paro": criterio_paro,
+        "generaciones_ejecutadas": generaciones_ejecutadas,
+        "evaluaciones": tam_pob * (generaciones_ejecutadas + 1),
+    }
+    if evaluador is not None:
+        resultado.update(evaluador.contadores())
+    if perfil is not None:
+        resultado["perfil"] = perfil.resumen()
+    return resultado
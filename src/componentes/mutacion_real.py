@@ -1,6 +1,9 @@
+import math
 from random import Random
 from typing import List
 
+import numpy as np
+
 def mutacion_real(
     individuo: List[float],
     prob_mutacion_gen: float = 0.1,
@@ -52,4 +55,114 @@ def mutacion_real(
             hijo[i] = nuevo_valor
 
     return hijo
-    
\ No newline at end of file
+
+
+def mutacion_real_dispersa(
+    individuo: List[float],
+    prob_mutacion_gen: float = 0.1,
+    a: float = -5.0,
+    b: float = 5.0,
+    amplitud: float = 0.1,
+    rng: Random = None
+) -> List[float]:
+    """
+    Variante dispersa de `mutacion_real` que modifica al individuo en sitio.
+
+    En lugar de sortear cada gen, salta directamente a la siguiente posición
+    mutada con un muestreo geométrico, por lo que el costo crece con el número
+    de genes mutados (~D * prob_mutacion_gen) y no con D. La distribución de
+    genes mutados es la misma, pero la secuencia aleatoria consumida es distinta.
+
+    Args:
+        individuo (List[float]): Vector de variables de decisión a mutar (se modifica).
+        prob_mutacion_gen (float): Probabilidad de aplicar mutación a un gen específico [0, 1].
+        a (float): Cota inferior del espacio de búsqueda.
+        b (float): Cota superior del espacio de búsqueda.
+        amplitud (float): Factor de escala relativo al tamaño del dominio (b - a).
+        rng (Random): Generador de números aleatorios.
+
+    Returns:
+        List[float]: El mismo individuo, con las mutaciones aplicadas.
+    """
+    if rng is None:
+        raise ValueError("Se debe proporcionar un generador 'rng'")
+
+    if not 0.0 <= prob_mutacion_gen <= 1.0:
+        raise ValueError("prob_mutacion_gen debe estar en [0, 1]")
+
+    if prob_mutacion_gen == 0.0:
+        return individuo
+
+    n = len(individuo)
+    max_cambio = amplitud * (b - a)
+    log_q = math.log1p(-prob_mutacion_gen) if prob_mutacion_gen < 1.0 else None
+
+    def salto() -> int:
+        # Número de genes no mutados antes del siguiente gen mutado ~ Geométrica(p)
+        if log_q is None:
+            return 0
+        return int(math.log(1.0 - rng.random()) / log_q)
+
+    i = salto()
+    while i < n:
+        nuevo_valor = individuo[i] + rng.uniform(-max_cambio, max_cambio)
+
+        # Saturación (clipping) para respetar los límites del dominio
+        if nuevo_valor < a:
+            nuevo_valor = a
+        elif nuevo_valor > b:
+            nuevo_valor = b
+        individuo[i] = nuevo_valor
+
+        i += 1 + salto()
+
+    return individuo
+
+
+def mutacion_real_lote(
+    hijos: np.ndarray,
+    prob_mutacion_gen: float = 0.1,
+    a: float = -5.0,
+    b: float = 5.0,
+    amplitud: float = 0.1,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """
+    Mutación uniforme dispersa sobre una matriz de hijos (N, D), en sitio.
+
+    Sortea primero cuántos genes mutan en toda la matriz (Binomial(N*D, p)) y
+    después sus posiciones sin reemplazo, de modo que el costo es proporcional
+    al número de genes mutados y no a N * D.
+
+    Args:
+        hijos (np.ndarray): Matriz (N, D) de individuos a mutar (se modifica).
+        prob_mutacion_gen (float): Probabilidad de aplicar mutación a un gen específico [0, 1].
+        a (float): Cota inferior del espacio de búsqueda.
+        b (float): Cota superior del espacio de búsqueda.
+        amplitud (float): Factor de escala relativo al tamaño del dominio (b - a).
+        rng (np.random.Generator): Generador de NumPy.
+
+    Returns:
+        np.ndarray: La misma matriz, con las mutaciones aplicadas.
+    """
+    if rng is None:
+        raise ValueError("Se debe proporcionar un generador 'rng'")
+
+    if not 0.0 <= prob_mutacion_gen <= 1.0:
+        raise ValueError("prob_mutacion_gen debe estar en [0, 1]")
+
+    total_genes = hijos.size
+    num_mutados = int(rng.binomial(total_genes, prob_mutacion_gen))
+    if num_mutados == 0:
+        return hijos
+
+    max_cambio = amplitud * (b - a)
+    posiciones = rng.choice(total_genes, size=num_mutados, replace=False, shuffle=False)
+
+    # Las posiciones indexan genes de todos los individuos en orden de filas; se
+    # convierten a (fila, columna) para escribir en la matriz aunque no sea contigua
+    indices = np.unravel_index(posiciones, hijos.shape)
+    valores = hijos[indices] + rng.uniform(-max_cambio, max_cambio, size=num_mutados)
+    hijos[indices] = np.clip(valores, a, b)
+
+    return hijos
@@ -0,0 +1,59 @@
+from time import perf_counter_ns
+from typing import Dict, List
+
+# =========================================
+# Perfilado por fases del ciclo generacional
+# =========================================
+# Acumula tiempo (ns) y número de llamadas por fase. Los motores guardan una
+# marca de tiempo y, al terminar cada fase, llaman a `marcar`, que suma el
+# intervalo y devuelve la marca siguiente:
+#
+#     if perfil is not None: t = perfil.reloj()
+#     ...fase...
+#     if perfil is not None: t = perfil.marcar("seleccion", t)
+#
+# Sin perfilado (perfil=None) el costo es una comparación por fase.
+
+FASES = [
+    "transformacion",
+    "seleccion",
+    "cruza",
+    "mutacion",
+    "evaluacion",
+    "reemplazo",
+    "metricas",
+]
+
+
+class PerfiladorFases:
+    """Acumulador de tiempo y llamadas para cada fase de FASES."""
+
+    def __init__(self):
+        self.tiempos_ns: Dict[str, int] = dict.fromkeys(FASES, 0)
+        self.llamadas: Dict[str, int] = dict.fromkeys(FASES, 0)
+
+    reloj = staticmethod(perf_counter_ns)
+
+    def marcar(self, fase: str, inicio: int) -> int:
+        """Suma el tiempo transcurrido desde `inicio` a `fase` y retorna la marca actual."""
+        ahora = perf_counter_ns()
+        self.tiempos_ns[fase] += ahora - inicio
+        self.llamadas[fase] += 1
+        return ahora
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """Desglose para el diccionario de resultados: segundos y llamadas por fase."""
+        return {
+            fase: {"tiempo": self.tiempos_ns[fase] * 1e-9, "llamadas": self.llamadas[fase]}
+            for fase in FASES
+        }
+
+
+def columnas_perfil() -> List[str]:
+    """Columnas extra del CSV de resumen cuando se perfila."""
+    return [f"tiempo_{fase}" for fase in FASES] + [f"llamadas_{fase}" for fase in FASES]
+
+
+def valores_perfil(perfil: Dict[str, Dict[str, float]]) -> list:
+    """Valores en el orden de `columnas_perfil`."""
+    return [perfil[fase]["tiempo"] for fase in FASES] + [perfil[fase]["llamadas"] for fase in FASES]
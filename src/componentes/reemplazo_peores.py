@@ -1,5 +1,8 @@
-from typing import List, Sequence, Tuple
-import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calcular_diversidad import RastreadorDiversidad
 
 def reemplazo_peores(
     poblacion: List[List[float]],
@@ -7,7 +10,8 @@ def reemplazo_peores(
     apt_pob: Sequence[float],
     apt_hijos: Sequence[float],
     porcentaje: float = 1.0,
-    elitismo: int = 1
+    elitismo: int = 1,
+    rastreador: Optional[RastreadorDiversidad] = None
 ) -> Tuple[List[List[float]], List[float]]:
     """
     Implementa el Reemplazo Generacional con Elitismo.
@@ -23,6 +27,8 @@ def reemplazo_peores(
         apt_hijos (Sequence[float]): Valores de costo de la descendencia (menor es mejor).
         porcentaje (float): (No utilizado en esta versión simplificada, se asume 1.0).
         elitismo (int): Número de mejores padres que se garantiza preservar.
+        rastreador (Optional[RastreadorDiversidad]): Si se proporciona, se actualiza
+            solo con los individuos que entran y salen de la población.
 
     Returns:
         Tuple[List[List[float]], List[float]]: Nueva población y sus costos asociados.
@@ -49,7 +55,8 @@ def reemplazo_peores(
     # Si el mejor padre de la generación anterior es mejor que el peor hijo aceptado,
     # reemplazamos al peor hijo con ese padre élite para no perder calidad.
     e = max(0, min(elitismo, N))
-    
+    idx_elite_entra = None
+
     if e >= 1:
         # Encontramos al peor individuo de la nueva población (el candidato a salir)
         idx_peor_nueva = max(range(N), key=lambda i: nuevas_apt[i])
@@ -61,6 +68,169 @@ def reemplazo_peores(
         if apt_pob[best_padre_idx] < nuevas_apt[idx_peor_nueva]:
             nueva_pob[idx_peor_nueva] = poblacion[best_padre_idx][:]
             nuevas_apt[idx_peor_nueva] = apt_pob[best_padre_idx]
+            idx_elite_entra = (idx_peor_nueva, best_padre_idx)
+
+    # 3. Actualización incremental de la diversidad (solo entrantes y salientes);
+    # el reemplazo generacional cambia casi toda la población y se recalcula al consultar
+    if rastreador is not None and not rastreador.conviene_incremental(N - (idx_elite_entra is not None)):
+        rastreador.programar_reinicio(nueva_pob)
+    elif rastreador is not None:
+        if idx_elite_entra is None:
+            entrantes = nueva_pob
+            salientes = poblacion
+        else:
+            idx_hijo_fuera, idx_padre_queda = idx_elite_entra
+            entrantes = [ind for i, ind in enumerate(nueva_pob) if i != idx_hijo_fuera]
+            salientes = [ind for i, ind in enumerate(poblacion) if i != idx_padre_queda]
+        rastreador.actualizar(salientes, entrantes)
 
     return (nueva_pob, nuevas_apt)
-    
\ No newline at end of file
+
+
+def _indices_reemplazo(
+    apt_pob: np.ndarray,
+    apt_hijos: np.ndarray,
+    elitismo: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Núcleo del reemplazo por selección parcial (sin ordenamientos completos).
+
+    Returns:
+        Tuple: índices de los hijos sobrevivientes, sus costos, posiciones (en la
+        nueva población) que ocupa la élite y los índices de los padres élite.
+    """
+    N = len(apt_pob)
+    M = len(apt_hijos)
+    if M < N:
+        raise ValueError("Se requieren al menos tantos hijos como individuos en la población.")
+
+    # 1. Los N mejores hijos sobreviven, sin ordenar (argpartition: O(M))
+    if M > N:
+        idx_hijos = np.argpartition(apt_hijos, N - 1)[:N]
+    else:
+        idx_hijos = np.arange(N)
+    nuevas_apt = apt_hijos[idx_hijos]
+
+    # 2. Elitismo: los e mejores padres contra los e peores sobrevivientes
+    e = max(0, min(elitismo, N))
+    if e == 0:
+        vacio = np.empty(0, dtype=np.intp)
+        return idx_hijos, nuevas_apt, vacio, vacio
+
+    if e == 1:
+        peores = np.array([np.argmax(nuevas_apt)])
+        mejores_padres = np.array([np.argmin(apt_pob)])
+    else:
+        peores = np.argpartition(-nuevas_apt, e - 1)[:e]
+        peores = peores[np.argsort(-nuevas_apt[peores], kind="stable")]
+        mejores_padres = np.argpartition(apt_pob, e - 1)[:e]
+        mejores_padres = mejores_padres[np.argsort(apt_pob[mejores_padres], kind="stable")]
+
+    # Criterio estricto: el k-ésimo mejor padre entra solo si mejora al k-ésimo peor hijo.
+    # Como ambos están ordenados, la condición es monótona y basta con contar.
+    mejora = apt_pob[mejores_padres] < nuevas_apt[peores]
+    k = int(np.argmin(mejora)) if not mejora.all() else e
+
+    return idx_hijos, nuevas_apt, peores[:k], mejores_padres[:k]
+
+
+def reemplazo_peores_parcial(
+    poblacion: List[List[float]],
+    hijos: List[List[float]],
+    apt_pob: Sequence[float],
+    apt_hijos: Sequence[float],
+    porcentaje: float = 1.0,
+    elitismo: int = 1,
+    rastreador: Optional[RastreadorDiversidad] = None
+) -> Tuple[List[List[float]], List[float]]:
+    """
+    Reemplazo Generacional con Elitismo por selección parcial.
+
+    Conserva a los mismos sobrevivientes que `reemplazo_peores`, pero los elige
+    con argpartition/argmin en lugar de ordenar padres e hijos, y los mantiene
+    por referencia (sin copias) en el orden original de los hijos. Además,
+    `elitismo > 1` se respeta: los e mejores padres sustituyen a los e peores
+    sobrevivientes, cada uno solo si lo mejora estrictamente.
+
+    Args:
+        poblacion (List[List[float]]): Población actual (padres).
+        hijos (List[List[float]]): Descendencia generada (pool de hijos).
+        apt_pob (Sequence[float]): Valores de costo de la población actual (menor es mejor).
+        apt_hijos (Sequence[float]): Valores de costo de la descendencia (menor es mejor).
+        porcentaje (float): (No utilizado en esta versión simplificada, se asume 1.0).
+        elitismo (int): Número de mejores padres que se garantiza preservar.
+        rastreador (Optional[RastreadorDiversidad]): Si se proporciona, se actualiza
+            solo con los individuos que entran y salen de la población.
+
+    Returns:
+        Tuple[List[List[float]], List[float]]: Nueva población y sus costos asociados.
+    """
+    N = len(poblacion)
+
+    # Validación básica de dimensiones
+    if len(apt_pob) != N or len(hijos) != len(apt_hijos):
+        raise ValueError("Dimensiones inconsistentes entre población y costos.")
+
+    apt_pob_arr = np.asarray(apt_pob, dtype=float)
+    idx_hijos, nuevas_apt, posiciones, idx_elite = _indices_reemplazo(
+        apt_pob_arr, np.asarray(apt_hijos, dtype=float), elitismo
+    )
+
+    nueva_pob = [hijos[i] for i in idx_hijos]
+    nuevas_apt[posiciones] = apt_pob_arr[idx_elite]
+
+    if rastreador is not None and not rastreador.conviene_incremental(N - len(posiciones)):
+        rastreador.programar_reinicio(nueva_pob)
+    elif rastreador is not None:
+        excluidos = set(posiciones.tolist())
+        quedan = set(idx_elite.tolist())
+        entrantes = [ind for i, ind in enumerate(nueva_pob) if i not in excluidos]
+        salientes = [ind for i, ind in enumerate(poblacion) if i not in quedan]
+        rastreador.actualizar(salientes, entrantes)
+
+    for pos, i in zip(posiciones.tolist(), idx_elite.tolist()):
+        nueva_pob[pos] = poblacion[i][:]
+
+    return (nueva_pob, nuevas_apt.tolist())
+
+
+def reemplazo_peores_lote(
+    poblacion: np.ndarray,
+    hijos: np.ndarray,
+    apt_pob: np.ndarray,
+    apt_hijos: np.ndarray,
+    elitismo: int = 1,
+    rastreador: Optional[RastreadorDiversidad] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión matricial de `reemplazo_peores_parcial` para poblaciones (N, D).
+    Si M == N, la matriz de hijos se reutiliza como nueva población (sin copia).
+
+    Args:
+        poblacion (np.ndarray): Matriz (N, D) de la población actual.
+        hijos (np.ndarray): Matriz (M, D) de descendientes, M >= N.
+        apt_pob (np.ndarray): Costos (N,) de la población actual.
+        apt_hijos (np.ndarray): Costos (M,) de la descendencia.
+        elitismo (int): Número de mejores padres que se garantiza preservar.
+        rastreador (Optional[RastreadorDiversidad]): Se actualiza con entrantes y salientes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Nueva población (N, D) y sus costos (N,).
+    """
+    idx_hijos, nuevas_apt, posiciones, idx_elite = _indices_reemplazo(
+        apt_pob, apt_hijos, elitismo
+    )
+
+    nueva_pob = hijos if len(hijos) == len(poblacion) else hijos[idx_hijos]
+
+    if rastreador is not None and not rastreador.conviene_incremental(len(nueva_pob) - len(posiciones)):
+        rastreador.programar_reinicio(nueva_pob)
+    elif rastreador is not None:
+        entrantes = np.delete(nueva_pob, posiciones, axis=0)
+        salientes = np.delete(poblacion, idx_elite, axis=0)
+        rastreador.actualizar(salientes, entrantes)
+
+    nueva_pob[posiciones] = poblacion[idx_elite]
+    nuevas_apt[posiciones] = apt_pob[idx_elite]
+
+    return nueva_pob, nuevas_apt
@@ -0,0 +1,112 @@
+import math
+from typing import Dict
+
+import numpy as np
+
+# =========================================
+# Registro diezmado de métricas generacionales
+# =========================================
+# Las curvas se guardan en arreglos preasignados y solo en las generaciones
+# que indica el programa de registro:
+#   'todas'       -> cada generación (comportamiento original)
+#   'cada_k'      -> generaciones 0, k, 2k, ...
+#   'logaritmico' -> ~`puntos` generaciones espaciadas logarítmicamente (más densas al inicio)
+#   'mejora'      -> solo cuando mejora el mejor costo registrado
+# La última generación ejecutada siempre se registra. Los motores calculan el
+# promedio y la diversidad únicamente cuando `debe_registrar` lo indica. Las
+# curvas se entregan como arreglos; solo los escritores de CSV las recorren
+# como valores de Python.
+
+PROGRAMAS_REGISTRO = ("todas", "cada_k", "logaritmico", "mejora")
+
+
+def plan_registro(generaciones: int, programa: str = "todas", cada: int = 10, puntos: int = 100) -> np.ndarray:
+    """
+    Máscara booleana (generaciones,) con las generaciones a registrar para los
+    programas fijos ('todas', 'cada_k', 'logaritmico'). Incluye siempre la última.
+    """
+    plan = np.zeros(generaciones, dtype=bool)
+    if programa == "todas":
+        plan[:] = True
+    elif programa == "cada_k":
+        if cada < 1:
+            raise ValueError("registro_cada debe ser >= 1")
+        plan[::cada] = True
+    elif programa == "logaritmico":
+        if puntos < 1:
+            raise ValueError("registro_puntos debe ser >= 1")
+        gens = np.unique(np.round(np.logspace(0, math.log10(max(generaciones, 1)), puntos)).astype(np.int64))
+        plan[gens[gens <= generaciones] - 1] = True
+    else:
+        raise ValueError(f"Programa de registro no reconocido: {programa}")
+    if generaciones:
+        plan[-1] = True
+    return plan
+
+
+class RegistroMetricas:
+    """
+    Curvas de mejor, promedio y diversidad en arreglos float64 preasignados.
+
+    Args:
+        generaciones (int): Máximo de generaciones de la corrida.
+        programa (str): Uno de PROGRAMAS_REGISTRO.
+        cada (int): Periodo para 'cada_k'.
+        puntos (int): Puntos aproximados para 'logaritmico'.
+    """
+
+    def __init__(self, generaciones: int, programa: str = "todas", cada: int = 10, puntos: int = 100):
+        if programa not in PROGRAMAS_REGISTRO:
+            raise ValueError(f"Programa de registro no reconocido: {programa}")
+
+        self.programa = programa
+        self.generaciones = generaciones
+        if programa == "mejora":
+            self._plan = None
+            capacidad = generaciones
+        else:
+            self._plan = plan_registro(generaciones, programa, cada, puntos)
+            capacidad = int(self._plan.sum())
+
+        # Una posición extra para la generación de un paro anticipado fuera del plan
+        capacidad += 1
+        self.generacion = np.empty(capacidad, dtype=np.int64)
+        self.mejor = np.empty(capacidad)
+        self.promedio = np.empty(capacidad)
+        self.diversidad = np.empty(capacidad)
+        self.n = 0
+        self._mejor_registrado = math.inf
+
+    def debe_registrar(self, g: int, mejor: float) -> bool:
+        """True si la generación `g` (con mejor costo `mejor`) se registra."""
+        if self._plan is None:
+            return mejor < self._mejor_registrado or g == self.generaciones - 1
+        return bool(self._plan[g])
+
+    def ultima(self) -> int:
+        """Última generación registrada (-1 si ninguna)."""
+        return int(self.generacion[self.n - 1]) if self.n else -1
+
+    def registrar(self, g: int, mejor: float, promedio: float, diversidad: float) -> None:
+        """Guarda las métricas de la generación `g`."""
+        i = self.n
+        self.generacion[i] = g
+        self.mejor[i] = mejor
+        self.promedio[i] = promedio
+        self.diversidad[i] = diversidad
+        self.n += 1
+        if mejor < self._mejor_registrado:
+            self._mejor_registrado = mejor
+
+    def _recortar(self, arreglo: np.ndarray) -> np.ndarray:
+        """Las primeras `n` posiciones; se copian solo si sobra capacidad (paro o 'mejora')."""
+        return arreglo if self.n == len(arreglo) else arreglo[:self.n].copy()
+
+    def curvas(self) -> Dict[str, np.ndarray]:
+        """Curvas registradas y sus generaciones, con las llaves del diccionario de resultados."""
+        return {
+            "curva_mejor": self._recortar(self.mejor),
+            "curva_promedio": self._recortar(self.promedio),
+            "curva_diversidad": self._recortar(self.diversidad),
+            "generaciones_registradas": self._recortar(self.generacion),
+        }
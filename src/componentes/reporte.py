@@ -0,0 +1,361 @@
+import hashlib
+import os
+import pickle
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# ============================================================
+# REPORTE DE GRÁFICAS EN UNA SOLA PASADA
+# ============================================================
+# Sustituye la carga independiente de graficas_convergencia.py,
+# graficas_diversidad.py, graficas_boxplot.py y graficas_tiempo.py:
+#   1. Cada archivo de entrada se identifica por el SHA-256 de su contenido.
+#   2. Si no hay agregados en caché para esa huella, se carga una vez con pandas y
+#      se calculan todos los agregados por (funcion, tipo_cruza[, generacion]).
+#      Las curvas solo contienen las generaciones registradas (programas 'mejora'
+#      y 'logaritmico', paros anticipados), que pueden diferir entre corridas: cada
+#      corrida se lleva a la rejilla común de su configuración repitiendo su último
+#      valor registrado antes de promediar, así cada punto promedia todas las corridas.
+#   3. Las figuras se generan desde los agregados en caché. Cambiar el estilo de
+#      una gráfica no vuelve a leer ni a agrupar los datos crudos (ni importa pandas).
+
+# ============================================================
+# CONFIGURACIÓN
+# ============================================================
+
+RUTA_CSV_RESUMEN = "resultados_ga_sphere_rastrigin_rosenbrock.csv"
+RUTA_CSV_CURVAS = "resultados_ga_sphere_rastrigin_rosenbrock_curvas.csv"
+
+# Salida columnar (correr_experimentos con salida_curvas='npz'); tiene prioridad si existe
+RUTA_NPZ_CURVAS = "resultados_ga_sphere_rastrigin_rosenbrock_curvas_npz"
+
+DIR_CACHE = ".cache_reporte"
+
+# Se incrementa cuando cambia el cálculo de los agregados (invalida la caché anterior)
+VERSION_AGREGADOS = 2
+
+funciones = ["sphere", "rastrigin", "rosenbrock"]
+tipos_cruza = ["un_punto", "uniforme", "blx", "sbx"]
+
+# Paleta de colores por operador (consistente en todas las gráficas)
+colores = {
+    "un_punto": "#FF6B6B",    # Rojo
+    "uniforme": "#4ECDC4",    # Turquesa
+    "blx": "#45B7D1",         # Azul
+    "sbx": "#FFA07A"          # Salmón
+}
+
+FIGURAS = ["convergencia", "diversidad", "boxplot", "tiempo"]
+
+Clave = Tuple[str, str]
+
+# ============================================================
+# HUELLAS Y CACHÉ DE AGREGADOS
+# ============================================================
+
+
+def huella(ruta: str) -> str:
+    """SHA-256 del contenido de un archivo o, para un directorio .npz, de todas sus partes."""
+    h = hashlib.sha256()
+    if os.path.isdir(ruta):
+        archivos = sorted(
+            os.path.join(ruta, nombre) for nombre in os.listdir(ruta) if nombre.endswith(".npz")
+        )
+    else:
+        archivos = [ruta]
+
+    for archivo in archivos:
+        h.update(os.path.basename(archivo).encode())
+        with open(archivo, mode="rb") as f:
+            for bloque in iter(lambda: f.read(1 << 20), b""):
+                h.update(bloque)
+    return h.hexdigest()
+
+
+def _cache(tipo: str, ruta: str, calcular, dir_cache: str = DIR_CACHE) -> dict:
+    """Retorna los agregados de `ruta` desde la caché o los calcula y guarda."""
+    ruta_cache = os.path.join(dir_cache, f"{tipo}_v{VERSION_AGREGADOS}_{huella(ruta)}.pkl")
+    if os.path.exists(ruta_cache):
+        with open(ruta_cache, mode="rb") as f:
+            print(f"[INFO] Agregados de '{ruta}' tomados de la caché.")
+            return pickle.load(f)
+
+    agregados = calcular(ruta)
+    os.makedirs(dir_cache, exist_ok=True)
+    ruta_tmp = ruta_cache + ".tmp"
+    with open(ruta_tmp, mode="wb") as f:
+        pickle.dump(agregados, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(ruta_tmp, ruta_cache)
+    return agregados
+
+
+def _agregar_curvas(ruta: str) -> Dict[Clave, Dict[str, np.ndarray]]:
+    """
+    Promedio por (funcion, tipo_cruza, generacion) de mejor y diversidad sobre la
+    unión de las generaciones registradas de la configuración. Cada corrida aporta
+    en cada generación su último valor registrado (desde su primer registro), incluso
+    después de haberse detenido.
+    """
+    # Importación local: pandas solo se necesita cuando la caché no tiene los agregados
+    import pandas as pd
+    from salida_columnar import cargar_curvas_npz, curvas_a_dataframe
+
+    if os.path.isdir(ruta):
+        df = curvas_a_dataframe(cargar_curvas_npz(ruta))
+    else:
+        df = pd.read_csv(ruta)
+    print(f"[INFO] Curvas cargadas: {len(df)} filas.")
+
+    # Detección del nombre de la columna de diversidad
+    col_div = next(
+        (nombre for nombre in ["diversidad", "diversidad_generacion"] if nombre in df.columns),
+        None,
+    )
+    columnas = ["mejor_generacion"] + ([col_div] if col_div else [])
+
+    # Una columna por corrida y una fila por generación registrada por alguna de
+    # ellas; los huecos se llenan con el último valor de cada corrida
+    corrida = ["repeticion", "semilla"]
+    agregados: Dict[Clave, Dict[str, np.ndarray]] = {}
+    for (func, cruza), grupo in df.groupby(["funcion", "tipo_cruza"], sort=True):
+        ancha = grupo.pivot(index="generacion", columns=corrida, values=columnas).sort_index().ffill()
+        agregados[(func, cruza)] = {
+            "generacion": ancha.index.to_numpy(),
+            "mejor": ancha["mejor_generacion"].mean(axis=1).to_numpy(),
+            "diversidad": ancha[col_div].mean(axis=1).to_numpy() if col_div else None,
+        }
+    return agregados
+
+
+def _agregar_resumen(ruta: str) -> Dict[Clave, Dict[str, object]]:
+    """Mejores costos finales y tiempo (media, desviación) por (funcion, tipo_cruza)."""
+    import pandas as pd
+
+    df = pd.read_csv(ruta)
+    print(f"[INFO] Resumen cargado: {len(df)} registros.")
+
+    # Detección dinámica de la columna de tiempo de ejecución
+    col_tiempo = next(
+        (nombre for nombre in ["tiempo_total_seg", "tiempo_total", "tiempo"] if nombre in df.columns),
+        None,
+    )
+
+    agregados: Dict[Clave, Dict[str, object]] = {}
+    for (func, cruza), grupo in df.groupby(["funcion", "tipo_cruza"], sort=False):
+        agregados[(func, cruza)] = {
+            "mejor_final": grupo["mejor_final"].to_numpy(),
+            "tiempo_promedio": float(grupo[col_tiempo].mean()) if col_tiempo else None,
+            "tiempo_desviacion": float(grupo[col_tiempo].std()) if col_tiempo else None,
+        }
+    return agregados
+
+
+def agregados_curvas(ruta_csv: str = RUTA_CSV_CURVAS, ruta_npz: str = RUTA_NPZ_CURVAS,
+                     dir_cache: str = DIR_CACHE) -> Dict[Clave, Dict[str, np.ndarray]]:
+    ruta = ruta_npz if os.path.isdir(ruta_npz) else ruta_csv
+    return _cache("curvas", ruta, _agregar_curvas, dir_cache)
+
+
+def agregados_resumen(ruta: str = RUTA_CSV_RESUMEN, dir_cache: str = DIR_CACHE) -> Dict[Clave, Dict[str, object]]:
+    return _cache("resumen", ruta, _agregar_resumen, dir_cache)
+
+# ============================================================
+# GRÁFICAS
+# ============================================================
+
+
+def _guardar(plt, nombre_archivo: str, dir_salida: str) -> None:
+    plt.tight_layout()
+    ruta = os.path.join(dir_salida, nombre_archivo)
+    plt.savefig(ruta, dpi=300, bbox_inches='tight')
+    print(f"[OK] Gráfica guardada: {ruta}")
+    plt.close()
+
+
+def graficar_curvas(agregados: dict, metrica: str, dir_salida: str = ".") -> None:
+    """Convergencia (metrica='mejor') o pérdida de diversidad (metrica='diversidad'), escala log."""
+    import matplotlib.pyplot as plt
+
+    for func in funciones:
+        if not any((func, cruza) in agregados for cruza in tipos_cruza):
+            print(f"[WARN] No existen datos para la función: {func}")
+            continue
+
+        fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
+
+        for cruza in tipos_cruza:
+            curva = agregados.get((func, cruza))
+            if curva is None:
+                print(f"[WARN] Faltan datos para la combinación: {func} + {cruza}")
+                continue
+            ax.plot(curva["generacion"], curva[metrica], label=cruza,
+                    linewidth=2.5, color=colores[cruza], alpha=0.8)
+
+        ax.set_xlabel("Generación", fontsize=12, fontweight='bold')
+        if metrica == "mejor":
+            ax.set_ylabel("Mejor Fitness Promedio (Log Scale)", fontsize=12, fontweight='bold')
+            ax.set_title(f"Convergencia - Función {func.upper()}",
+                         fontsize=14, fontweight='bold', pad=20)
+            ubicacion, nombre_archivo = 'upper right', f"convergencia_{func}.png"
+        else:
+            ax.set_ylabel("Diversidad Promedio (Escala Log)", fontsize=12, fontweight='bold')
+            ax.set_title(f"Pérdida de Diversidad - Función {func.upper()}",
+                         fontsize=14, fontweight='bold', pad=20)
+            ubicacion, nombre_archivo = 'best', f"diversidad_{func}.png"
+
+        ax.set_yscale("log")
+        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.7, which="both")
+        ax.legend(loc=ubicacion, fontsize=11, framealpha=0.95,
+                  edgecolor='black', fancybox=True, shadow=True)
+
+        _guardar(plt, nombre_archivo, dir_salida)
+
+
+def graficar_boxplot(agregados: dict, dir_salida: str = ".") -> None:
+    """Distribución del mejor costo final por operador (escala log)."""
+    import matplotlib.pyplot as plt
+
+    for func in funciones:
+        if not any((func, cruza) in agregados for cruza in tipos_cruza):
+            print(f"[WARN] No existen datos para la función: {func}")
+            continue
+
+        datos_por_cruza = [
+            agregados.get((func, cruza), {}).get("mejor_final", np.array([])) for cruza in tipos_cruza
+        ]
+
+        fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
+        bplot = ax.boxplot(
+            datos_por_cruza,
+            patch_artist=True,
+            medianprops=dict(color="black", linewidth=1.5),
+            flierprops=dict(marker='o', markerfacecolor='red', markersize=5, linestyle='none')
+        )
+        for patch, cruza in zip(bplot['boxes'], tipos_cruza):
+            patch.set_facecolor(colores[cruza])
+            patch.set_alpha(0.8)
+        # Etiquetas por separado: el argumento labels= de boxplot cambió de nombre en matplotlib 3.9
+        ax.set_xticks(range(1, len(tipos_cruza) + 1), tipos_cruza)
+
+        ax.set_yscale("log")
+        ax.set_xlabel("Operador de Cruza", fontsize=12, fontweight='bold')
+        ax.set_ylabel("Mejor Costo Final (Escala Log)", fontsize=12, fontweight='bold')
+        ax.set_title(f"Distribución de Calidad Final - Función {func.upper()}",
+                     fontsize=14, fontweight='bold', pad=20)
+        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.7, axis='y', which='both')
+
+        _guardar(plt, f"boxplot_calidad_{func}.png", dir_salida)
+
+
+def graficar_tiempo(agregados: dict, dir_salida: str = ".") -> None:
+    """Tiempo promedio por operador con barras de error (desviación estándar)."""
+    import matplotlib.pyplot as plt
+
+    for func in funciones:
+        if not any((func, cruza) in agregados for cruza in tipos_cruza):
+            print(f"[WARN] No existen datos para la función: {func}")
+            continue
+
+        promedios = []
+        desviaciones = []
+        for cruza in tipos_cruza:
+            grupo = agregados.get((func, cruza))
+            if grupo is None:
+                promedios.append(0.0)
+                desviaciones.append(0.0)
+            else:
+                promedios.append(grupo["tiempo_promedio"])
+                desviaciones.append(grupo["tiempo_desviacion"])
+
+        fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
+        x_pos = np.arange(len(tipos_cruza))
+        barras = ax.bar(x_pos, promedios, yerr=desviaciones, align='center', alpha=0.9,
+                        color=[colores[c] for c in tipos_cruza], ecolor='black', capsize=10)
+
+        # Anotación de valores exactos sobre cada barra
+        for barra in barras:
+            height = barra.get_height()
+            ax.annotate(f'{height:.4f}s',
+                        xy=(barra.get_x() + barra.get_width() / 2, height),
+                        xytext=(0, 3), textcoords="offset points",
+                        ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(tipos_cruza, fontsize=11, fontweight='bold')
+        ax.set_ylabel("Tiempo Promedio (segundos)", fontsize=12, fontweight='bold')
+        ax.set_title(f"Costo Computacional - Función {func.upper()}",
+                     fontsize=14, fontweight='bold', pad=20)
+        ax.yaxis.grid(True, linestyle='--', alpha=0.7)
+        if promedios:
+            ax.set_ylim(0, max(promedios) * 1.15)
+
+        _guardar(plt, f"tiempo_{func}.png", dir_salida)
+
+# ============================================================
+# ORQUESTACIÓN
+# ============================================================
+
+
+def generar_reporte(
+    figuras: Optional[List[str]] = None,
+    ruta_resumen: str = RUTA_CSV_RESUMEN,
+    ruta_curvas: str = RUTA_CSV_CURVAS,
+    ruta_npz: str = RUTA_NPZ_CURVAS,
+    dir_cache: str = DIR_CACHE,
+    dir_salida: str = ".",
+) -> None:
+    """
+    Genera las figuras pedidas (todas por defecto) cargando cada entrada a lo más una vez.
+
+    Args:
+        figuras (List[str]): Subconjunto de FIGURAS.
+        dir_cache (str): Carpeta de agregados, indexados por la huella de cada entrada.
+        dir_salida (str): Carpeta de las imágenes.
+    """
+    figuras = FIGURAS if figuras is None else figuras
+    desconocidas = set(figuras) - set(FIGURAS)
+    if desconocidas:
+        raise ValueError(f"Figuras no reconocidas: {sorted(desconocidas)}")
+
+    os.makedirs(dir_salida, exist_ok=True)
+
+    if "convergencia" in figuras or "diversidad" in figuras:
+        try:
+            curvas = agregados_curvas(ruta_curvas, ruta_npz, dir_cache)
+        except FileNotFoundError:
+            print(f"[ERROR] No se encontró el archivo: {ruta_curvas}")
+            raise SystemExit(1)
+        if "convergencia" in figuras:
+            print("\n[INFO] Generando gráficas de convergencia (Escala Logarítmica)...\n")
+            graficar_curvas(curvas, "mejor", dir_salida)
+        if "diversidad" in figuras:
+            if any(curva["diversidad"] is None for curva in curvas.values()):
+                print("[ERROR] No se encontró ninguna columna de diversidad.")
+                raise SystemExit(1)
+            print("\n[INFO] Generando gráficas de diversidad...\n")
+            graficar_curvas(curvas, "diversidad", dir_salida)
+
+    if "boxplot" in figuras or "tiempo" in figuras:
+        try:
+            resumen = agregados_resumen(ruta_resumen, dir_cache)
+        except FileNotFoundError:
+            print(f"[ERROR] No se encontró el archivo: {ruta_resumen}")
+            raise SystemExit(1)
+        if "boxplot" in figuras:
+            print("\n[INFO] Generando diagramas de caja para calidad final...\n")
+            graficar_boxplot(resumen, dir_salida)
+        if "tiempo" in figuras:
+            if any(grupo["tiempo_promedio"] is None for grupo in resumen.values()):
+                print("[ERROR] No se encontró una columna de tiempo válida.")
+                raise SystemExit(1)
+            print("\n[INFO] Generando gráficas de tiempo de ejecución...\n")
+            graficar_tiempo(resumen, dir_salida)
+
+    print("\n[INFO] Proceso finalizado.")
+
+
+if __name__ == "__main__":
+    # Uso: python reporte.py [convergencia diversidad boxplot tiempo]
+    generar_reporte(sys.argv[1:] or None)
@@ -0,0 +1,144 @@
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+# =========================================
+# Registro compacto de una corrida
+# =========================================
+# Alternativa al diccionario de resultados de `ejecutar_ga_real`: los escalares
+# viven en slots y las curvas en arreglos NumPy (float64, 8 bytes por valor en
+# lugar de ~32 de un float de Python dentro de una lista). La población final
+# puede guardarse en float64, en float32 o no guardarse.
+#
+# Admite la lectura por llave del diccionario (`r["mejor_final"]`, `r.get(...)`,
+# `"perfil" in r`), por lo que escribir_resumen, escribir_curvas y
+# EscritorCurvasNPZ lo aceptan sin cambios. `a_dict()` reconstruye el diccionario.
+
+CAMPOS_ESCALARES = (
+    "nombre_func",
+    "dim",
+    "tam_pob",
+    "generaciones",
+    "pc",
+    "tipo_cruza",
+    "porcentaje_reemplazo",
+    "elitismo",
+    "semilla",
+    "alpha_blx",
+    "eta_c_sbx",
+    "amplitud_mut",
+    "mejor_final",
+    "peor_final",
+    "promedio_final",
+    "tiempo_total",
+    "criterio_paro",
+    "generaciones_ejecutadas",
+    "evaluaciones",
+)
+CURVAS = ("curva_mejor", "curva_promedio", "curva_diversidad")
+
+# Campos opcionales: None si la corrida no los tiene
+CAMPOS_ARREGLO = ("generaciones_registradas", "poblacion_final", "costos_finales")
+
+ALMACENAMIENTO_POBLACION = ("float64", "float32", "no")
+
+
+class ResultadoCorrida:
+    """
+    Resultado de una corrida con slots y curvas en arreglos NumPy.
+
+    Las llaves propias de algunos motores o modos (perfil, contadores de la
+    caché, curvas por isla, ...) se guardan tal cual en `extras`.
+    """
+
+    __slots__ = CAMPOS_ESCALARES + CURVAS + CAMPOS_ARREGLO + ("extras",)
+
+    @classmethod
+    def desde_dict(cls, resultado: Dict[str, Any], almacenar_poblacion: str = "float64") -> "ResultadoCorrida":
+        """
+        Crea el registro a partir del diccionario de un motor.
+
+        Args:
+            resultado (Dict[str, Any]): Diccionario de `ejecutar_ga_real`.
+            almacenar_poblacion (str): 'float64' (población y costos finales completos),
+                'float32' (población en float32) o 'no' (sin población ni costos finales).
+        """
+        if almacenar_poblacion not in ALMACENAMIENTO_POBLACION:
+            raise ValueError(f"Almacenamiento de población no reconocido: {almacenar_poblacion}")
+
+        registro = cls.__new__(cls)
+        for campo in CAMPOS_ESCALARES:
+            setattr(registro, campo, resultado[campo])
+        for curva in CURVAS:
+            setattr(registro, curva, np.asarray(resultado[curva], dtype=np.float64))
+
+        generaciones = resultado.get("generaciones_registradas")
+        registro.generaciones_registradas = (
+            None if generaciones is None else np.asarray(generaciones, dtype=np.int32)
+        )
+
+        if almacenar_poblacion == "no":
+            registro.poblacion_final = None
+            registro.costos_finales = None
+        else:
+            registro.poblacion_final = np.asarray(resultado["poblacion_final"], dtype=almacenar_poblacion)
+            registro.costos_finales = np.asarray(resultado["costos_finales"], dtype=np.float64)
+
+        conocidos = set(cls.__slots__)
+        registro.extras = {clave: valor for clave, valor in resultado.items() if clave not in conocidos}
+        return registro
+
+    # --- Acceso con la interfaz del diccionario ---
+
+    def __getitem__(self, clave: str) -> Any:
+        if clave in CAMPOS_ESCALARES or clave in CURVAS:
+            return getattr(self, clave)
+        if clave in CAMPOS_ARREGLO:
+            valor = getattr(self, clave)
+            if valor is None:
+                raise KeyError(clave)
+            return valor
+        return self.extras[clave]
+
+    def __contains__(self, clave: str) -> bool:
+        try:
+            self[clave]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, clave: str, por_defecto: Optional[Any] = None) -> Any:
+        try:
+            return self[clave]
+        except KeyError:
+            return por_defecto
+
+    def keys(self) -> Iterator[str]:
+        for clave in CAMPOS_ESCALARES + CURVAS + CAMPOS_ARREGLO:
+            if clave in self:
+                yield clave
+        yield from self.extras
+
+    def a_dict(self) -> Dict[str, Any]:
+        """Diccionario equivalente al de `ejecutar_ga_real` (arreglos como listas)."""
+        resultado = {}
+        for clave in self.keys():
+            valor = self[clave]
+            resultado[clave] = valor.tolist() if isinstance(valor, np.ndarray) else valor
+        return resultado
+
+    # --- Serialización: una tupla plana en lugar del diccionario de slots ---
+
+    def __reduce__(self):
+        return (_reconstruir, (tuple(getattr(self, campo) for campo in self.__slots__),))
+
+    def __repr__(self) -> str:
+        return (f"ResultadoCorrida({self.nombre_func}, {self.tipo_cruza}, semilla={self.semilla}, "
+                f"mejor_final={self.mejor_final:.6g})")
+
+
+def _reconstruir(valores: tuple) -> ResultadoCorrida:
+    registro = ResultadoCorrida.__new__(ResultadoCorrida)
+    for campo, valor in zip(ResultadoCorrida.__slots__, valores):
+        setattr(registro, campo, valor)
+    return registro
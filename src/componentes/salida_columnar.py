@@ -0,0 +1,173 @@
+import glob
+import os
+from typing import Dict, List
+
+import numpy as np
+
+# =========================================
+# Salida columnar de curvas (.npz por bloques)
+# =========================================
+# Alternativa al archivo '_curvas.csv': cada corrida aporta sus tres curvas
+# como arreglos float64 completos y sus metadatos se guardan una sola vez.
+# Las corridas se agrupan en bloques; cada bloque es un archivo
+# 'parte_XXXXX.npz' dentro de un directorio, escrito de forma atómica.
+#
+# Contenido de cada parte:
+#   funcion, tipo_cruza                 -> arreglos de texto (una entrada por corrida)
+#   dim, tam_pob, generaciones,
+#   repeticion, semilla                 -> arreglos int64 (una entrada por corrida)
+#   inicio                              -> desplazamientos int64 (corridas + 1) en las curvas
+#   generacion                          -> generación de cada punto (int64; registro diezmado)
+#   mejor, promedio, diversidad         -> curvas concatenadas float64
+
+CAMPOS_META = ["funcion", "tipo_cruza", "dim", "tam_pob", "generaciones", "repeticion", "semilla"]
+CAMPOS_CURVA = ["mejor", "promedio", "diversidad"]
+
+
+def _partes(directorio: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(directorio, "parte_*.npz")))
+
+
+def truncar_partes(directorio: str, num_partes: int) -> None:
+    """Elimina las partes con índice >= num_partes (escritas tras el último registro)."""
+    for ruta in _partes(directorio)[num_partes:]:
+        os.remove(ruta)
+
+
+class EscritorCurvasNPZ:
+    """
+    Acumula las curvas de varias corridas y las escribe en bloques .npz.
+
+    Args:
+        directorio (str): Carpeta de salida (se crea si no existe).
+        tam_bloque (int): Corridas por archivo de parte.
+        modo (str): 'w' elimina partes previas; 'a' continúa la numeración.
+    """
+
+    def __init__(self, directorio: str, tam_bloque: int = 64, modo: str = "w"):
+        if tam_bloque < 1:
+            raise ValueError("tam_bloque debe ser >= 1")
+
+        os.makedirs(directorio, exist_ok=True)
+        if modo == "w":
+            truncar_partes(directorio, 0)
+
+        self.directorio = directorio
+        self.tam_bloque = tam_bloque
+        self.num_partes = len(_partes(directorio))
+        self._meta: Dict[str, list] = {campo: [] for campo in CAMPOS_META}
+        self._curvas: Dict[str, list] = {campo: [] for campo in CAMPOS_CURVA}
+        self._generaciones: List[np.ndarray] = []
+
+    def agregar(self, resultado: dict, rep: int) -> bool:
+        """Agrega una corrida al bloque. Retorna True si el bloque se escribió a disco."""
+        self._meta["funcion"].append(resultado["nombre_func"])
+        self._meta["tipo_cruza"].append(resultado["tipo_cruza"])
+        self._meta["dim"].append(resultado["dim"])
+        self._meta["tam_pob"].append(resultado["tam_pob"])
+        self._meta["generaciones"].append(resultado["generaciones"])
+        self._meta["repeticion"].append(rep)
+        self._meta["semilla"].append(resultado["semilla"])
+
+        self._curvas["mejor"].append(np.asarray(resultado["curva_mejor"], dtype=float))
+        self._curvas["promedio"].append(np.asarray(resultado["curva_promedio"], dtype=float))
+        self._curvas["diversidad"].append(np.asarray(resultado["curva_diversidad"], dtype=float))
+        self._generaciones.append(np.asarray(
+            resultado.get("generaciones_registradas", range(len(resultado["curva_mejor"]))),
+            dtype=np.int64,
+        ))
+
+        if len(self._meta["funcion"]) >= self.tam_bloque:
+            self.vaciar()
+            return True
+        return False
+
+    def pendientes(self) -> int:
+        """Número de corridas en memoria que aún no se escriben."""
+        return len(self._meta["funcion"])
+
+    def vaciar(self) -> None:
+        """Escribe el bloque actual como una nueva parte (operación atómica)."""
+        if not self.pendientes():
+            return
+
+        longitudes = [len(c) for c in self._curvas["mejor"]]
+        inicio = np.zeros(len(longitudes) + 1, dtype=np.int64)
+        np.cumsum(longitudes, out=inicio[1:])
+
+        arreglos = {
+            "funcion": np.array(self._meta["funcion"]),
+            "tipo_cruza": np.array(self._meta["tipo_cruza"]),
+            "inicio": inicio,
+        }
+        for campo in CAMPOS_META[2:]:
+            arreglos[campo] = np.array(self._meta[campo], dtype=np.int64)
+        for campo in CAMPOS_CURVA:
+            arreglos[campo] = np.concatenate(self._curvas[campo])
+        arreglos["generacion"] = np.concatenate(self._generaciones)
+
+        ruta = os.path.join(self.directorio, f"parte_{self.num_partes:05d}.npz")
+        ruta_tmp = ruta + ".tmp"
+        with open(ruta_tmp, mode="wb") as f:
+            np.savez(f, **arreglos)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(ruta_tmp, ruta)
+
+        self.num_partes += 1
+        for lista in (*self._meta.values(), *self._curvas.values(), self._generaciones):
+            lista.clear()
+
+
+def cargar_curvas_npz(directorio: str) -> Dict[str, np.ndarray]:
+    """
+    Carga todas las partes y las une en un solo conjunto de arreglos.
+
+    Returns:
+        Dict[str, np.ndarray]: Metadatos por corrida (CAMPOS_META), desplazamientos
+        'inicio' (corridas + 1), curvas concatenadas (CAMPOS_CURVA) y 'generacion'.
+    """
+    partes = _partes(directorio)
+    if not partes:
+        raise FileNotFoundError(f"No hay partes .npz en: {directorio}")
+
+    datos: Dict[str, list] = {campo: [] for campo in CAMPOS_META + CAMPOS_CURVA + ["generacion"]}
+    inicios = []
+    desplazamiento = 0
+
+    for ruta in partes:
+        with np.load(ruta) as parte:
+            for campo in CAMPOS_META + CAMPOS_CURVA:
+                datos[campo].append(parte[campo])
+            if "generacion" in parte.files:
+                datos["generacion"].append(parte["generacion"])
+            else:
+                # Partes previas al registro diezmado: una entrada por generación
+                longitudes = np.diff(parte["inicio"])
+                datos["generacion"].append(
+                    np.arange(int(parte["inicio"][-1])) - np.repeat(parte["inicio"][:-1], longitudes)
+                )
+            inicios.append(parte["inicio"][:-1] + desplazamiento)
+            desplazamiento += int(parte["inicio"][-1])
+
+    resultado = {campo: np.concatenate(valores) for campo, valores in datos.items()}
+    resultado["inicio"] = np.append(np.concatenate(inicios), desplazamiento)
+    return resultado
+
+
+def curvas_a_dataframe(datos: Dict[str, np.ndarray]):
+    """
+    Construye el DataFrame largo con las mismas columnas que '_curvas.csv',
+    para que las gráficas funcionen igual con cualquiera de los dos formatos.
+    """
+    # Importación local: pandas solo se necesita al graficar, no al ejecutar el AG
+    import pandas as pd
+
+    longitudes = np.diff(datos["inicio"])
+    columnas = {campo: np.repeat(datos[campo], longitudes) for campo in CAMPOS_META}
+    columnas["generacion"] = datos["generacion"]
+    columnas["mejor_generacion"] = datos["mejor"]
+    columnas["promedio_generacion"] = datos["promedio"]
+    columnas["diversidad"] = datos["diversidad"]
+
+    return pd.DataFrame(columnas)
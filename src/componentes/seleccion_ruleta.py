@@ -1,6 +1,8 @@
 from random import Random
 from typing import List, Sequence
 
+import numpy as np
+
 def transformar_aptitud(costos: Sequence[float]) -> List[float]:
     """
     Transforma los valores de costo (minimización) en aptitud (maximización)
@@ -68,4 +70,108 @@ def seleccion_ruleta(
         )
     
     # Return de copias para evitar modificar la población original
-    return [ind.copy() for ind in seleccionados]
\ No newline at end of file
+    return [ind.copy() for ind in seleccionados]
+
+
+def transformar_aptitud_vector(costos: Sequence[float]) -> np.ndarray:
+    """
+    Versión vectorizada de `transformar_aptitud` sobre un arreglo de costos.
+
+    Produce exactamente los mismos valores que la versión por elemento.
+
+    Args:
+        costos (Sequence[float]): Vector de costos a minimizar.
+
+    Returns:
+        np.ndarray: Vector de aptitudes positivas.
+    """
+    epsilon = 1e-6  # Constante de estabilidad numérica
+    return 1.0 / (np.maximum(np.asarray(costos, dtype=float), 0.0) + epsilon)
+
+
+def seleccion_ruleta_indices(
+    aptitudes: np.ndarray,
+    k: int = 2,
+    rng: Random = None
+) -> List[int]:
+    """
+    Selección por ruleta que retorna índices en lugar de copias de individuos.
+
+    Construye la distribución acumulada una sola vez y la pasa a `rng.choices`
+    como `cum_weights`, por lo que consume la misma secuencia aleatoria y elige
+    los mismos individuos que `seleccion_ruleta`.
+
+    Args:
+        aptitudes (np.ndarray): Aptitudes no negativas de la población.
+        k (int): Cantidad de individuos a seleccionar.
+        rng (Random): Generador de números aleatorios.
+
+    Returns:
+        List[int]: Índices de los k individuos seleccionados.
+    """
+    if rng is None:
+        raise ValueError("Se debe proveer un generador 'rng'")
+
+    aptitudes = np.asarray(aptitudes, dtype=float)
+    if (aptitudes < 0).any():
+        raise ValueError("Todas las aptitudes deben ser no-negativas para la ruleta.")
+
+    n = len(aptitudes)
+    acumulada = np.cumsum(aptitudes)
+
+    # Caso base, sin aptitud: selección uniforme como mecanismo de fallback
+    if acumulada[-1] == 0:
+        return [rng.randrange(n) for _ in range(k)]
+
+    return rng.choices(range(n), cum_weights=acumulada.tolist(), k=k)
+
+
+def seleccion_ruleta_lote(
+    aptitudes: np.ndarray,
+    k: int,
+    rng: np.random.Generator = None,
+    metodo: str = "ruleta"
+) -> np.ndarray:
+    """
+    Selección proporcional a la aptitud para el motor matricial. Retorna índices.
+
+    La distribución acumulada se construye una vez y los k padres se obtienen
+    con una sola búsqueda `searchsorted`.
+
+    Args:
+        aptitudes (np.ndarray): Aptitudes no negativas de la población.
+        k (int): Cantidad de individuos a seleccionar.
+        rng (np.random.Generator): Generador de NumPy.
+        metodo (str): 'ruleta' (k giros independientes) o 'sus' (Stochastic
+            Universal Sampling: k punteros equiespaciados con un solo giro,
+            varianza mínima; el resultado se baraja para no emparejar vecinos).
+
+    Returns:
+        np.ndarray: Índices de los k individuos seleccionados.
+    """
+    if rng is None:
+        raise ValueError("Se debe proveer un generador 'rng'")
+
+    n = len(aptitudes)
+    acumulada = np.cumsum(aptitudes)
+    total = acumulada[-1]
+
+    if total == 0:
+        return rng.integers(0, n, size=k)
+
+    if metodo == "ruleta":
+        puntos = rng.random(k) * total
+    elif metodo == "sus":
+        paso = total / k
+        puntos = (rng.random() + np.arange(k)) * paso
+    else:
+        raise ValueError(f"Método de selección no reconocido: {metodo}")
+
+    idx = np.searchsorted(acumulada, puntos, side="right")
+    # Protección ante redondeo en el extremo superior de la ruleta
+    np.minimum(idx, n - 1, out=idx)
+
+    if metodo == "sus":
+        rng.shuffle(idx)
+
+    return idx